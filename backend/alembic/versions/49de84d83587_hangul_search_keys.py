@@ -0,0 +1,80 @@
+"""hangul_search_keys
+
+Revision ID: 49de84d83587
+Revises: e7919d0950af
+Create Date: 2026-10-18 11:03:27.558914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '49de84d83587'
+down_revision: Union[str, None] = 'e7919d0950af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (key column, source columns)
+KEY_COLUMNS = {
+    'job_posts': ('search_keys', ['title', 'department', 'specialty']),
+    'companies': ('name_keys', ['name']),
+    'resumes': ('search_keys', ['title', 'summary']),
+}
+
+
+# Frozen copy of app.core.hangul.index_keys as of this revision, so later
+# changes there don't change what this migration writes
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+
+
+def _chosung(ch: str) -> str:
+    if 0xAC00 <= ord(ch) <= 0xD7A3:
+        return CHOSUNG[(ord(ch) - 0xAC00) // 588]
+    return ch if ch in CHOSUNG else ''
+
+
+def _bigrams(text: str) -> list[str]:
+    return [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+def index_keys(*texts: str | None) -> list[str]:
+    keys: set[str] = set()
+    for text in texts:
+        if not text:
+            continue
+        norm = ''.join(ch for ch in text.lower() if ch.isalnum())
+        keys.update(_bigrams(norm))
+        keys.update(_bigrams(''.join(_chosung(ch) for ch in norm)))
+    return sorted(keys)
+
+
+def _backfill(table: str, key_column: str, sources: list[str]) -> None:
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(f"SELECT id, {', '.join(sources)} FROM {table}")
+    ).all()
+    stmt = sa.text(
+        f"UPDATE {table} SET {key_column} = :keys WHERE id = :id"
+    ).bindparams(sa.bindparam('keys', type_=postgresql.ARRAY(sa.Text())))
+    params = [{'id': row[0], 'keys': index_keys(*row[1:])} for row in rows]
+    if params:
+        conn.execute(stmt, params)
+
+
+def upgrade() -> None:
+    for table, (key_column, sources) in KEY_COLUMNS.items():
+        op.add_column(table, sa.Column(key_column, postgresql.ARRAY(sa.Text()), nullable=True))
+        _backfill(table, key_column, sources)
+        op.create_index(
+            f'ix_{table}_{key_column}', table, [key_column],
+            unique=False, postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    for table, (key_column, _) in KEY_COLUMNS.items():
+        op.drop_index(f'ix_{table}_{key_column}', table_name=table)
+        op.drop_column(table, key_column)
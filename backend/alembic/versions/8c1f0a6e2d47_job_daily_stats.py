@@ -0,0 +1,35 @@
+"""job_daily_stats
+
+Revision ID: 8c1f0a6e2d47
+Revises: 49de84d83587
+Create Date: 2026-10-18 14:22:05.318402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1f0a6e2d47'
+down_revision: Union[str, None] = '49de84d83587'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_daily_stats',
+        sa.Column('job_post_id', sa.UUID(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('views', sa.Integer(), nullable=False),
+        sa.Column('unique_viewers', sa.Integer(), nullable=False),
+        sa.Column('favorites', sa.Integer(), nullable=False),
+        sa.Column('applications', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['job_post_id'], ['job_posts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('job_post_id', 'day'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('job_daily_stats')
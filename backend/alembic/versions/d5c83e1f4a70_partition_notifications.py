@@ -0,0 +1,120 @@
+"""partition notifications by month
+
+Revision ID: d5c83e1f4a70
+Revises: a41e6c0d9b25
+Create Date: 2026-10-18 23:12:31.640275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5c83e1f4a70'
+down_revision: Union[str, None] = 'a41e6c0d9b25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, created_at, user_id, type, channel, payload_json, status, sent_at, "
+    "read_at, updated_at"
+)
+
+# One partition per month (UTC) from the oldest row to 3 months ahead;
+# app.services.notification_partitions keeps creating them from here on
+CREATE_PARTITIONS = """
+DO $$
+DECLARE
+    first_month date := date_trunc(
+        'month',
+        coalesce((SELECT min(created_at) FROM notifications_legacy), now())
+            AT TIME ZONE 'UTC'
+    );
+    last_month date := date_trunc('month', now() AT TIME ZONE 'UTC')
+        + interval '3 months';
+    start_day date;
+BEGIN
+    start_day := first_month;
+    WHILE start_day <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF notifications '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'notifications_p' || to_char(start_day, 'YYYYMM'),
+            start_day::text || ' 00:00+00',
+            (start_day + interval '1 month')::date::text || ' 00:00+00'
+        );
+        start_day := start_day + interval '1 month';
+    END LOOP;
+END $$
+"""
+
+
+def upgrade() -> None:
+    op.rename_table('notifications', 'notifications_legacy')
+    op.execute('ALTER TABLE notifications_legacy RENAME CONSTRAINT notifications_pkey TO notifications_legacy_pkey')
+    op.execute('ALTER TABLE notifications_legacy RENAME CONSTRAINT notifications_user_id_fkey TO notifications_legacy_user_id_fkey')
+    op.drop_index('ix_notifications_status', table_name='notifications_legacy')
+    op.drop_index('ix_notifications_user_created', table_name='notifications_legacy')
+
+    op.create_table('notifications',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('type', sa.String(length=20), nullable=False),
+    sa.Column('channel', sa.String(length=20), nullable=False),
+    sa.Column('payload_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('read_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)',
+    )
+    op.execute(CREATE_PARTITIONS)
+    op.execute(
+        f"INSERT INTO notifications ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM notifications_legacy"
+    )
+    op.drop_table('notifications_legacy')
+
+    op.create_index('ix_notifications_user_created', 'notifications', ['user_id', 'created_at'], unique=False)
+    op.create_index(
+        'ix_notifications_user_unread',
+        'notifications',
+        ['user_id', 'created_at'],
+        unique=False,
+        postgresql_where=sa.text('read_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.rename_table('notifications', 'notifications_partitioned')
+    op.drop_index('ix_notifications_user_unread', table_name='notifications_partitioned')
+    op.drop_index('ix_notifications_user_created', table_name='notifications_partitioned')
+    op.execute('ALTER TABLE notifications_partitioned RENAME CONSTRAINT notifications_pkey TO notifications_partitioned_pkey')
+    op.execute('ALTER TABLE notifications_partitioned RENAME CONSTRAINT notifications_user_id_fkey TO notifications_partitioned_user_id_fkey')
+
+    op.create_table('notifications',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('type', sa.String(length=20), nullable=False),
+    sa.Column('channel', sa.String(length=20), nullable=False),
+    sa.Column('payload_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('read_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(
+        f"INSERT INTO notifications ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM notifications_partitioned"
+    )
+    op.drop_table('notifications_partitioned')
+    op.create_index('ix_notifications_status', 'notifications', ['status'], unique=False)
+    op.create_index('ix_notifications_user_created', 'notifications', ['user_id', 'created_at'], unique=False)
@@ -0,0 +1,62 @@
+"""job_post_search_document
+
+Revision ID: e7919d0950af
+Revises: 2537541c75ac
+Create Date: 2026-10-18 10:12:41.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7919d0950af'
+down_revision: Union[str, None] = '2537541c75ac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column('job_posts', sa.Column('search_text', sa.Text(), nullable=True))
+
+    # Backfill the search document from existing posts and their companies
+    op.execute(
+        """
+        UPDATE job_posts AS j
+        SET search_text = concat_ws(
+            E'\\n', j.title, c.name, j.department, j.specialty, j.body
+        )
+        FROM companies AS c
+        WHERE c.id = j.company_id
+        """
+    )
+
+    op.add_column(
+        'job_posts',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('simple', coalesce(search_text, ''))", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_job_posts_search_vector', 'job_posts', ['search_vector'],
+        unique=False, postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_job_posts_search_text_trgm', 'job_posts', ['search_text'],
+        unique=False, postgresql_using='gin',
+        postgresql_ops={'search_text': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_posts_search_text_trgm', table_name='job_posts')
+    op.drop_index('ix_job_posts_search_vector', table_name='job_posts')
+    op.drop_column('job_posts', 'search_vector')
+    op.drop_column('job_posts', 'search_text')
@@ -5,12 +5,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import require_role
 from app.core.enums import Role
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.models.user import User
 from app.schemas.admin import (
     AdminDashboard,
     AdminLogListResponse,
     JobModerationListResponse,
+    SearchCacheStats,
     UserAdminListResponse,
     UserAdminRead,
     UserStatusUpdate,
@@ -25,7 +26,12 @@ from app.schemas.verification import (
     VerificationRead,
     VerificationReview,
 )
-from app.services import admin_service, report_service, verification_service
+from app.services import (
+    admin_service,
+    report_service,
+    search_cache,
+    verification_service,
+)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -39,24 +45,31 @@ admin_only = require_role(Role.ADMIN)
 @router.get("", response_model=AdminDashboard)
 async def admin_dashboard(
     user: User = Depends(admin_roles),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await admin_service.get_dashboard(db)
 
 
+@router.get("/cache/search", response_model=SearchCacheStats)
+async def search_cache_stats(user: User = Depends(admin_roles)):
+    return search_cache.stats()
+
+
 # --- Verifications ---
 
 
 @router.get("/verifications", response_model=VerificationListResponse)
 async def list_verifications(
     user: User = Depends(admin_roles),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     status: str | None = None,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
     return await verification_service.list_pending_verifications(
-        db, status, page, size
+        db, status, page, size, cursor, include_total
     )
 
 
@@ -80,12 +93,16 @@ async def review_verification(
 @router.get("/reports", response_model=ReportListResponse)
 async def list_reports(
     user: User = Depends(admin_roles),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     status: str | None = None,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
-    return await report_service.list_reports(db, status, page, size)
+    return await report_service.list_reports(
+        db, status, page, size, cursor, include_total
+    )
 
 
 @router.patch("/reports/{report_id}", response_model=ReportRead)
@@ -106,13 +123,15 @@ async def process_report(
 @router.get("/moderation/jobs", response_model=JobModerationListResponse)
 async def moderation_jobs(
     user: User = Depends(admin_roles),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     status: str | None = None,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
     return await admin_service.list_jobs_for_moderation(
-        db, status, page, size
+        db, status, page, size, cursor, include_total
     )
 
 
@@ -141,15 +160,17 @@ async def unblind_job(
 @router.get("/users", response_model=UserAdminListResponse)
 async def list_users(
     user: User = Depends(admin_roles),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     type: str | None = None,
     status: str | None = None,
     keyword: str | None = None,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
     return await admin_service.list_users(
-        db, type, status, keyword, page, size
+        db, type, status, keyword, page, size, cursor, include_total
     )
 
 
@@ -171,8 +192,10 @@ async def update_user_status(
 @router.get("/logs", response_model=AdminLogListResponse)
 async def list_logs(
     user: User = Depends(admin_only),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     size: int = Query(50, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
-    return await admin_service.list_admin_logs(db, page, size)
+    return await admin_service.list_admin_logs(db, page, size, cursor, include_total)
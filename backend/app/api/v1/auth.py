@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.rate_limit import limiter
@@ -16,11 +16,12 @@ from app.services import auth_service
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/signup", response_model=AuthResponse)
-@limiter.limit("3/minute")
-async def signup(
-    request: Request, data: SignupRequest, db: AsyncSession = Depends(get_db)
-):
+@router.post(
+    "/signup",
+    response_model=AuthResponse,
+    dependencies=[Depends(limiter.limit("signup"))],
+)
+async def signup(data: SignupRequest, db: AsyncSession = Depends(get_db)):
     user, access, refresh = await auth_service.signup(db, data)
     return AuthResponse(
         user=UserResponse(
@@ -33,11 +34,12 @@ async def signup(
     )
 
 
-@router.post("/login", response_model=AuthResponse)
-@limiter.limit("5/minute")
-async def login(
-    request: Request, data: LoginRequest, db: AsyncSession = Depends(get_db)
-):
+@router.post(
+    "/login",
+    response_model=AuthResponse,
+    dependencies=[Depends(limiter.limit("login"))],
+)
+async def login(data: LoginRequest, db: AsyncSession = Depends(get_db)):
     user, access, refresh = await auth_service.login(db, data)
     return AuthResponse(
         user=UserResponse(
@@ -50,11 +52,12 @@ async def login(
     )
 
 
-@router.post("/refresh", response_model=TokenResponse)
-@limiter.limit("10/minute")
-async def refresh(
-    request: Request, data: RefreshRequest, db: AsyncSession = Depends(get_db)
-):
+@router.post(
+    "/refresh",
+    response_model=TokenResponse,
+    dependencies=[Depends(limiter.limit("refresh"))],
+)
+async def refresh(data: RefreshRequest, db: AsyncSession = Depends(get_db)):
     access, new_refresh = await auth_service.refresh_tokens(db, data.refresh_token)
     return TokenResponse(access_token=access, refresh_token=new_refresh)
 
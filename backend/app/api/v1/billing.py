@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_current_user
-from app.db.session import get_db
-from app.models.user import User
+from app.core.deps import get_current_company
+from app.core.rate_limit import limiter
+from app.db.session import get_db, get_read_db
+from app.models.company import Company
 from app.schemas.billing import (
     EntitlementListResponse,
     InvoiceListResponse,
@@ -26,7 +27,7 @@ router = APIRouter(prefix="/billing", tags=["billing"])
 
 @router.get("/products", response_model=ProductListResponse)
 async def list_products(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await billing_service.list_products(db)
 
@@ -37,26 +38,30 @@ async def list_products(
 @router.post("/orders", response_model=OrderRead)
 async def create_order(
     data: OrderCreate,
-    user: User = Depends(get_current_user),
+    company: Company = Depends(get_current_company),
     db: AsyncSession = Depends(get_db),
 ):
-    return await billing_service.create_order(db, user, data.product_id)
+    return await billing_service.create_order(db, company, data.product_id)
 
 
 @router.get("/orders", response_model=OrderListResponse)
 async def list_orders(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
-    return await billing_service.list_orders(db, user, page, size)
+    return await billing_service.list_orders(
+        db, company, page, size, cursor, include_total
+    )
 
 
 # --- Webhook (no auth - called by PG) ---
 
 
-@router.post("/webhooks/{pg}")
+@router.post("/webhooks/{pg}", dependencies=[Depends(limiter.limit("webhook"))])
 async def receive_webhook(
     pg: str,
     data: WebhookPayload,
@@ -72,12 +77,16 @@ async def receive_webhook(
 
 @router.get("/payments", response_model=PaymentListResponse)
 async def list_payments(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
-    return await billing_service.list_payments(db, user, page, size)
+    return await billing_service.list_payments(
+        db, company, page, size, cursor, include_total
+    )
 
 
 # --- Entitlements ---
@@ -85,10 +94,10 @@ async def list_payments(
 
 @router.get("/entitlements", response_model=EntitlementListResponse)
 async def list_entitlements(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    return await billing_service.list_entitlements(db, user)
+    return await billing_service.list_entitlements(db, company)
 
 
 # --- Invoices ---
@@ -97,17 +106,21 @@ async def list_entitlements(
 @router.post("/invoices/request", response_model=InvoiceRead)
 async def request_invoice(
     data: InvoiceRequest,
-    user: User = Depends(get_current_user),
+    company: Company = Depends(get_current_company),
     db: AsyncSession = Depends(get_db),
 ):
-    return await billing_service.request_invoice(db, user, data.order_id)
+    return await billing_service.request_invoice(db, company, data.order_id)
 
 
 @router.get("/invoices", response_model=InvoiceListResponse)
 async def list_invoices(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
-    return await billing_service.list_invoices(db, user, page, size)
+    return await billing_service.list_invoices(
+        db, company, page, size, cursor, include_total
+    )
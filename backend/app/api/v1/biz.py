@@ -4,11 +4,12 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_company, get_current_user, get_optional_company
 from app.core.enums import ApplicationStatus, JobPostStatus
-from app.db.session import get_db
+from app.core.rate_limit import limiter
+from app.db.session import get_db, get_read_db
 from app.models.application import Application
-from app.models.company import CompanyUser
+from app.models.company import Company
 from app.models.job import JobPost
 from app.models.payment import Entitlement
 from app.models.user import User
@@ -24,6 +25,7 @@ from app.schemas.job import (
     JobPostCreate,
     JobPostRead,
     JobPostUpdate,
+    JobStatsResponse,
 )
 from app.schemas.report import ReportCreate, ReportRead
 from app.schemas.scout import ScoutCreate, ScoutListResponse, ScoutRead, TalentListResponse
@@ -35,14 +37,10 @@ router = APIRouter(prefix="/biz", tags=["biz"])
 
 @router.get("")
 async def dashboard(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company | None = Depends(get_optional_company),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    cu_result = await db.execute(
-        select(CompanyUser).where(CompanyUser.user_id == user.id)
-    )
-    cu = cu_result.scalar_one_or_none()
-    if not cu:
+    if company is None:
         return {
             "active_jobs": 0,
             "total_applicants": 0,
@@ -51,7 +49,7 @@ async def dashboard(
             "recent_applicants": [],
         }
 
-    company_id = cu.company_id
+    company_id = company.id
 
     active_jobs = (
         await db.execute(
@@ -137,19 +135,19 @@ async def dashboard(
 
 @router.get("/verify", response_model=VerificationRead | None)
 async def get_verification_status(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    return await verification_service.get_verification_status(db, user)
+    return await verification_service.get_verification_status(db, company)
 
 
 @router.post("/verify", response_model=VerificationRead)
 async def submit_verification(
     data: VerificationSubmit,
-    user: User = Depends(get_current_user),
+    company: Company = Depends(get_current_company),
     db: AsyncSession = Depends(get_db),
 ):
-    return await verification_service.submit_verification(db, user, data.file_key)
+    return await verification_service.submit_verification(db, company, data.file_key)
 
 
 # --- Reports ---
@@ -171,21 +169,36 @@ async def submit_report(
 
 @router.get("/jobs", response_model=JobListResponse)
 async def list_company_jobs(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
+):
+    return await job_service.get_company_jobs(
+        db, company, page, size, cursor, include_total
+    )
+
+
+@router.get("/jobs/{job_id}/stats", response_model=JobStatsResponse)
+async def get_job_stats(
+    job_id: UUID,
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
+    days: int = Query(30, ge=1, le=365),
 ):
-    return await job_service.get_company_jobs(db, user, page, size)
+    return await job_service.get_company_job_stats(db, company, job_id, days)
 
 
 @router.post("/jobs", response_model=JobPostRead)
 async def create_job(
     data: JobPostCreate,
     user: User = Depends(get_current_user),
+    company: Company = Depends(get_current_company),
     db: AsyncSession = Depends(get_db),
 ):
-    return await job_service.create_job(db, user, data)
+    return await job_service.create_job(db, user, company, data)
 
 
 @router.patch("/jobs/{job_id}", response_model=JobPostRead)
@@ -193,27 +206,30 @@ async def update_job(
     job_id: UUID,
     data: JobPostUpdate,
     user: User = Depends(get_current_user),
+    company: Company = Depends(get_current_company),
     db: AsyncSession = Depends(get_db),
 ):
-    return await job_service.update_job(db, user, job_id, data)
+    return await job_service.update_job(db, user, company, job_id, data)
 
 
 @router.post("/jobs/{job_id}/publish", response_model=JobPostRead)
 async def publish_job(
     job_id: UUID,
     user: User = Depends(get_current_user),
+    company: Company = Depends(get_current_company),
     db: AsyncSession = Depends(get_db),
 ):
-    return await job_service.publish_job(db, user, job_id)
+    return await job_service.publish_job(db, user, company, job_id)
 
 
 @router.post("/jobs/{job_id}/close", response_model=JobPostRead)
 async def close_job(
     job_id: UUID,
     user: User = Depends(get_current_user),
+    company: Company = Depends(get_current_company),
     db: AsyncSession = Depends(get_db),
 ):
-    return await job_service.close_job(db, user, job_id)
+    return await job_service.close_job(db, user, company, job_id)
 
 
 # --- ATS (Applicant Management) ---
@@ -221,25 +237,27 @@ async def close_job(
 
 @router.get("/applicants", response_model=ApplicationListResponse)
 async def list_applicants(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
     job_post_id: UUID | None = None,
     status: str | None = None,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
     return await application_service.list_company_applicants(
-        db, user, job_post_id, status, page, size
+        db, company, job_post_id, status, page, size, cursor, include_total
     )
 
 
 @router.get("/applicants/{application_id}", response_model=ApplicationDetailRead)
 async def get_applicant(
     application_id: UUID,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    return await application_service.get_applicant_detail(db, user, application_id)
+    return await application_service.get_applicant_detail(db, company, application_id)
 
 
 @router.patch("/applicants/{application_id}/status", response_model=ApplicationDetailRead)
@@ -247,10 +265,11 @@ async def change_applicant_status(
     application_id: UUID,
     data: StatusChangeRequest,
     user: User = Depends(get_current_user),
+    company: Company = Depends(get_current_company),
     db: AsyncSession = Depends(get_db),
 ):
     return await application_service.change_applicant_status(
-        db, user, application_id, data.status, data.note
+        db, user, company, application_id, data.status, data.note
     )
 
 
@@ -259,29 +278,37 @@ async def add_applicant_note(
     application_id: UUID,
     data: ApplicationNoteCreate,
     user: User = Depends(get_current_user),
+    company: Company = Depends(get_current_company),
     db: AsyncSession = Depends(get_db),
 ):
     return await application_service.add_applicant_note(
-        db, user, application_id, data.note
+        db, user, company, application_id, data.note
     )
 
 
 # --- Talent Search ---
 
 
-@router.get("/talents", response_model=TalentListResponse)
+@router.get(
+    "/talents",
+    response_model=TalentListResponse,
+    dependencies=[Depends(limiter.limit("search"))],
+)
 async def search_talents(
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     keyword: str | None = None,
     desired_job: str | None = None,
     desired_region: str | None = None,
     is_experienced: bool | None = None,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
     return await scout_service.search_talents(
-        db, keyword, desired_job, desired_region, is_experienced, page, size
+        db, keyword, desired_job, desired_region, is_experienced,
+        page, size, cursor, include_total,
     )
 
 
@@ -290,31 +317,35 @@ async def search_talents(
 
 @router.get("/scouts", response_model=ScoutListResponse)
 async def list_scouts(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
     status: str | None = None,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
-    return await scout_service.list_company_scouts(db, user, status, page, size)
+    return await scout_service.list_company_scouts(
+        db, company, status, page, size, cursor, include_total
+    )
 
 
 @router.post("/scouts", response_model=ScoutRead)
 async def send_scout(
     data: ScoutCreate,
-    user: User = Depends(get_current_user),
+    company: Company = Depends(get_current_company),
     db: AsyncSession = Depends(get_db),
 ):
-    return await scout_service.send_scout(db, user, data)
+    return await scout_service.send_scout(db, company, data)
 
 
 @router.get("/scouts/{scout_id}", response_model=ScoutRead)
 async def get_scout_detail(
     scout_id: UUID,
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    company: Company = Depends(get_current_company),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    return await scout_service.get_company_scout_detail(db, user, scout_id)
+    return await scout_service.get_company_scout_detail(db, company, scout_id)
 
 
 # --- Placeholders ---
@@ -1,22 +1,28 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_current_user
-from app.db.session import get_db
+from app.core.rate_limit import limiter
+from app.db.session import get_db, get_read_db
 from app.models.user import User
 from app.schemas.application import ApplyRequest, ApplicationRead
 from app.core.enums import JobPostStatus
 from app.models.job import JobPost
-from app.schemas.job import JobListResponse, JobPostRead, JobSitemapEntry
-from app.services import application_service, job_service
+from app.schemas.job import (
+    JobFacetsResponse,
+    JobListResponse,
+    JobPostRead,
+    JobSitemapEntry,
+)
+from app.services import application_service, job_service, view_counter
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
 @router.get("/sitemap", response_model=list[JobSitemapEntry])
-async def jobs_for_sitemap(db: AsyncSession = Depends(get_db)):
+async def jobs_for_sitemap(db: AsyncSession = Depends(get_read_db)):
     from sqlalchemy import select
 
     result = await db.execute(
@@ -30,9 +36,13 @@ async def jobs_for_sitemap(db: AsyncSession = Depends(get_db)):
     ]
 
 
-@router.get("", response_model=JobListResponse)
+@router.get(
+    "",
+    response_model=JobListResponse,
+    dependencies=[Depends(limiter.limit("search"))],
+)
 async def list_jobs(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     keyword: str | None = None,
     location_code: str | None = None,
     job_category: str | None = None,
@@ -42,6 +52,8 @@ async def list_jobs(
     sort: str = "LATEST",
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
     return await job_service.search_jobs(
         db,
@@ -54,12 +66,43 @@ async def list_jobs(
         sort=sort,
         page=page,
         size=size,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+
+@router.get(
+    "/facets",
+    response_model=JobFacetsResponse,
+    dependencies=[Depends(limiter.limit("search"))],
+)
+async def job_facets(
+    db: AsyncSession = Depends(get_read_db),
+    keyword: str | None = None,
+    location_code: str | None = None,
+    job_category: str | None = None,
+    shift_type: str | None = None,
+    employment_type: str | None = None,
+    salary_min: int | None = None,
+):
+    return await job_service.search_job_facets(
+        db,
+        keyword=keyword,
+        location_code=location_code,
+        job_category=job_category,
+        shift_type=shift_type,
+        employment_type=employment_type,
+        salary_min=salary_min,
     )
 
 
 @router.get("/{job_id}", response_model=JobPostRead)
-async def get_job(job_id: UUID, db: AsyncSession = Depends(get_db)):
-    return await job_service.get_job_detail(db, job_id)
+async def get_job(
+    job_id: UUID, request: Request, db: AsyncSession = Depends(get_read_db)
+):
+    job = await job_service.get_job_detail(db, job_id)
+    await view_counter.record_view(job_id, request)
+    return job
 
 
 @router.post("/{job_id}/apply", response_model=ApplicationRead)
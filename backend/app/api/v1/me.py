@@ -1,13 +1,20 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_current_user
-from app.db.session import get_db
+from app.core.config import get_settings
+from app.core.deps import get_current_user, get_streaming_user
+from app.core.security import create_stream_token
+from app.db.session import get_db, get_read_db
 from app.models.user import User
 from app.schemas.application import ApplicationDetailRead, ApplicationListResponse
-from app.schemas.notification import NotificationListResponse
+from app.schemas.notification import (
+    NotificationListResponse,
+    StreamTokenResponse,
+    UnreadCountResponse,
+)
 from app.schemas.resume import (
     ResumeCreate,
     ResumeListResponse,
@@ -18,6 +25,7 @@ from app.schemas.resume import (
 from app.schemas.favorite import FavoriteListResponse
 from app.schemas.scout import ScoutListResponse, ScoutRead, ScoutRespondRequest
 from app.services import application_service, favorite_service, notification_service, resume_service, scout_service
+from app.services import notification_stream, unread_counter
 
 router = APIRouter(prefix="/me", tags=["me"])
 
@@ -38,7 +46,7 @@ async def get_me(user: User = Depends(get_current_user)):
 @router.get("/resumes", response_model=ResumeListResponse)
 async def list_resumes(
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await resume_service.list_resumes(db, user)
 
@@ -56,7 +64,7 @@ async def create_resume(
 async def get_resume(
     resume_id: UUID,
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await resume_service.get_resume(db, user, resume_id)
 
@@ -87,7 +95,7 @@ async def update_visibility(
 @router.get("/applications", response_model=ApplicationListResponse)
 async def list_applications(
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await application_service.list_my_applications(db, user)
 
@@ -96,7 +104,7 @@ async def list_applications(
 async def get_application(
     application_id: UUID,
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await application_service.get_my_application(db, user, application_id)
 
@@ -107,11 +115,59 @@ async def get_application(
 @router.get("/notifications", response_model=NotificationListResponse)
 async def list_notifications(
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     size: int = Query(30, ge=1, le=100),
+    cursor: str | None = None,
 ):
-    return await notification_service.list_notifications(db, user, page, size)
+    return await notification_service.list_notifications(db, user, page, size, cursor)
+
+
+@router.get("/notifications/unread-count", response_model=UnreadCountResponse)
+async def unread_notification_count(
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+):
+    return UnreadCountResponse(unread_count=await unread_counter.count(db, user.id))
+
+
+@router.post("/notifications/stream-token", response_model=StreamTokenResponse)
+async def notification_stream_token(user: User = Depends(get_current_user)):
+    """Short-lived `?token=` for opening the stream with EventSource."""
+    return StreamTokenResponse(
+        token=create_stream_token(user.id),
+        expires_in=get_settings().NOTIFICATION_STREAM_TOKEN_EXPIRE_SECONDS,
+    )
+
+
+@router.get("/notifications/stream")
+async def stream_notifications(
+    user: User = Depends(get_streaming_user),
+    last_event_id: str | None = Header(None),
+    resume_after: str | None = Query(None, alias="last_event_id"),
+):
+    """Server-sent events: new notifications as they are created.
+
+    Authenticated by a bearer token or, for EventSource (no custom headers),
+    a `?token=` from POST /notifications/stream-token. Reconnect with
+    Last-Event-ID to receive what was missed; EventSource sends it on its own
+    retries, a stream reopened with a fresh token passes `?last_event_id=`.
+    """
+    if not notification_stream.hub.accepting():
+        raise HTTPException(
+            status_code=503,
+            detail="실시간 알림 연결이 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": "5"},
+        )
+    return StreamingResponse(
+        notification_stream.stream(user.id, last_event_id or resume_after),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # nginx must not buffer the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 @router.patch("/notifications/{notification_id}/read")
@@ -139,11 +195,15 @@ async def mark_all_notifications_read(
 @router.get("/favorites", response_model=FavoriteListResponse)
 async def list_favorites(
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
-    return await favorite_service.list_favorites(db, user, page, size)
+    return await favorite_service.list_favorites(
+        db, user, page, size, cursor, include_total
+    )
 
 
 @router.post("/favorites/{job_post_id}")
@@ -161,12 +221,16 @@ async def toggle_favorite(
 @router.get("/scouts", response_model=ScoutListResponse)
 async def list_received_scouts(
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     status: str | None = None,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
-    return await scout_service.list_user_scouts(db, user, status, page, size)
+    return await scout_service.list_user_scouts(
+        db, user, status, page, size, cursor, include_total
+    )
 
 
 @router.get("/scouts/{scout_id}", response_model=ScoutRead)
@@ -1,39 +1,83 @@
 from uuid import UUID
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import principal_cache
 from app.core.enums import Role, UserStatus
 from app.core.security import decode_token
-from app.db.session import get_db
+from app.db.session import async_session
+from app.models.company import Company
 from app.models.user import User
+from app.services import company_context
 
 security_scheme = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    token = credentials.credentials
+async def _load_principal(db: AsyncSession, user_id: UUID) -> User | None:
+    """Cached principal (detached User: id/email/type/role/status), else the row."""
+    user = await principal_cache.get(user_id)
+    if user is None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is not None and user.status == UserStatus.ACTIVE.value:
+            await principal_cache.put(user)
+    return user
+
+
+def _token_user_id(token: str, token_type: str = "access") -> UUID:
     try:
         payload = decode_token(token)
-        if payload.get("type") != "access":
+        if payload.get("type") != token_type:
             raise HTTPException(status_code=401, detail="Invalid token type")
-        user_id = UUID(payload["sub"])
+        return UUID(payload["sub"])
     except (JWTError, ValueError):
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+
+def _require_active(user: User | None) -> User:
     if user is None or user.status != UserStatus.ACTIVE.value:
         raise HTTPException(status_code=401, detail="User not found or inactive")
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+) -> User:
+    """The authenticated, active user.
+
+    Looked up on a short session of its own on the primary, closed before the
+    handler runs: the handler's session is not held open any longer, and a
+    lagging replica cannot resolve a stale principal. Cache hits open no
+    connection at all.
+    """
+    user_id = _token_user_id(credentials.credentials)
+    async with async_session() as db:
+        return _require_active(await _load_principal(db, user_id))
+
+
+async def get_streaming_user(
+    token: str | None = Query(None),
+    credentials: HTTPAuthorizationCredentials | None = Depends(
+        HTTPBearer(auto_error=False)
+    ),
+) -> User:
+    """The user of a notification stream: bearer access token (fetch-based
+    clients) or `?token=` stream token (EventSource, which cannot set headers).
+    """
+    if credentials is not None:
+        user_id = _token_user_id(credentials.credentials)
+    elif token is not None:
+        user_id = _token_user_id(token, "stream")
+    else:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    async with async_session() as db:
+        return _require_active(await _load_principal(db, user_id))
+
+
 def require_role(*roles: Role):
     async def checker(user: User = Depends(get_current_user)) -> User:
         if user.role not in [r.value for r in roles]:
@@ -44,7 +88,6 @@ def require_role(*roles: Role):
 
 async def get_optional_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(HTTPBearer(auto_error=False)),
-    db: AsyncSession = Depends(get_db),
 ) -> User | None:
     if credentials is None:
         return None
@@ -53,7 +96,20 @@ async def get_optional_user(
         if payload.get("type") != "access":
             return None
         user_id = UUID(payload["sub"])
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
     except (JWTError, ValueError):
         return None
+    async with async_session() as db:
+        return await _load_principal(db, user_id)
+
+
+async def get_current_company(user: User = Depends(get_current_user)) -> Company:
+    """Company of the current user (403 if not a company member)."""
+    async with async_session() as db:
+        return await company_context.get_company_for_user(db, user)
+
+
+async def get_optional_company(
+    user: User = Depends(get_current_user),
+) -> Company | None:
+    async with async_session() as db:
+        return await company_context.find_company_for_user(db, user)
@@ -95,6 +95,12 @@ class NotificationChannel(str, enum.Enum):
     PUSH = "PUSH"
 
 
+class OutboxStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    DONE = "DONE"
+    DEAD = "DEAD"
+
+
 class PaymentStatus(str, enum.Enum):
     PENDING = "PENDING"
     PAID = "PAID"
@@ -40,4 +40,5 @@ def register_exception_handlers(app: FastAPI) -> None:
                     "message": exc.detail,
                 }
             },
+            headers=exc.headers,
         )
@@ -0,0 +1,101 @@
+"""
+한글 검색 키 생성 유틸리티
+
+- 음절 → 자모 분해 (초성/중성/종성)
+- 초성 추출 ("서울대병원" → "ㅅㅇㄷㅂㅇ")
+- 공백/기호를 제거한 정규화 문자열의 bigram 생성
+
+문서 쪽은 `index_keys()`로 만든 키 배열을 GIN 인덱스 컬럼에 저장하고,
+검색 쪽은 `query_keys()`로 만든 키가 모두 포함(@>)되는지로 매칭한다.
+"""
+
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = (
+    "", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+    "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)
+
+_CHOSUNG_SET = frozenset(CHOSUNG)
+
+
+def is_syllable(ch: str) -> bool:
+    return HANGUL_BASE <= ord(ch) <= HANGUL_END
+
+
+def is_chosung(ch: str) -> bool:
+    return ch in _CHOSUNG_SET
+
+
+def split_syllable(ch: str) -> tuple[str, str, str]:
+    """Split one syllable into (초성, 중성, 종성); 종성 is "" when absent."""
+    idx = ord(ch) - HANGUL_BASE
+    return CHOSUNG[idx // 588], JUNGSUNG[(idx % 588) // 28], JONGSUNG[idx % 28]
+
+
+def decompose(text: str) -> str:
+    """Decompose Hangul syllables into compatibility jamo ("병원" → "ㅂㅕㅇㅇㅝㄴ")."""
+    return "".join("".join(split_syllable(ch)) if is_syllable(ch) else ch for ch in text)
+
+
+def normalize(text: str) -> str:
+    """Lowercase and drop whitespace/punctuation so "서울 대병원" == "서울대병원"."""
+    return "".join(ch for ch in text.lower() if ch.isalnum())
+
+
+def extract_chosung(text: str) -> str:
+    """Initial consonants of the Hangul syllables in text (other characters dropped)."""
+    out: list[str] = []
+    for ch in text:
+        if is_syllable(ch):
+            out.append(split_syllable(ch)[0])
+        elif is_chosung(ch):
+            out.append(ch)
+    return "".join(out)
+
+
+def bigrams(text: str) -> list[str]:
+    return [text[i : i + 2] for i in range(len(text) - 1)]
+
+
+def is_chosung_query(query: str) -> bool:
+    """True when the query consists only of initial consonants, e.g. "ㅅㅇㄷㅂㅇ"."""
+    norm = normalize(query)
+    return bool(norm) and all(is_chosung(ch) for ch in norm)
+
+
+def index_keys(*texts: str | None) -> list[str]:
+    """Search keys for a document: syllable bigrams plus chosung bigrams."""
+    keys: set[str] = set()
+    for text in texts:
+        if not text:
+            continue
+        norm = normalize(text)
+        keys.update(bigrams(norm))
+        keys.update(bigrams(extract_chosung(norm)))
+    return sorted(keys)
+
+
+def query_keys(query: str) -> list[str]:
+    """
+    Keys that a matching document must all contain.
+
+    A trailing lone consonant (e.g. "서울대ㅂ" while typing "서울대병원")
+    becomes a chosung bigram with the preceding syllable ("ㄷㅂ").
+    Returns an empty list when the query is too short to use bigrams.
+    """
+    norm = normalize(query)
+    if len(norm) < 2:
+        return []
+    if is_chosung_query(norm):
+        return sorted(set(bigrams(norm)))
+
+    keys: set[str] = set()
+    if is_chosung(norm[-1]) and is_syllable(norm[-2]):
+        keys.add(extract_chosung(norm[-2]) + norm[-1])
+        norm = norm[:-1]
+    keys.update(bigrams(norm))
+    return sorted(keys)
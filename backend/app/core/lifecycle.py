@@ -0,0 +1,135 @@
+"""
+Startup warmup and shutdown drain.
+
+`warmup` runs before the app takes traffic: it opens DB_WARMUP_CONNECTIONS
+(at most the pool size) connections per engine at once, so connect, TLS
+and asyncpg type introspection happen here rather than in the first
+requests, runs the hottest statements on each so they are prepared per
+connection, and fills the search/count caches for the default job list. It never fails startup;
+problems are logged and left to /health/ready.
+
+On shutdown `drain` stops admitting requests (503 + Connection: close,
+and /health/ready reports draining so the load balancer moves away) and
+waits up to SHUTDOWN_DRAIN_TIMEOUT_SECONDS for in-flight requests.
+"""
+
+import asyncio
+import logging
+import uuid
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from starlette.responses import JSONResponse
+
+from app.core.config import get_settings
+from app.db.session import async_session
+from app.models.job import JobPost
+from app.models.user import User
+from app.services import job_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+ALWAYS_ADMITTED = ("/health", "/internal/")
+
+_draining = False
+_in_flight = 0
+_idle = asyncio.Event()
+_idle.set()
+
+
+async def _prime_connection(engine: AsyncEngine) -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        db = AsyncSession(bind=conn)
+        # Same statements as principal lookup, job detail and an uncached page
+        await db.execute(select(User).where(User.id == uuid.uuid4()))
+        await db.execute(select(JobPost).where(JobPost.id == uuid.uuid4()))
+        await job_service.search_jobs(
+            db, page=settings.SEARCH_CACHE_MAX_PAGE + 1, include_total=False
+        )
+        await db.close()
+
+
+async def _warm_caches() -> None:
+    async with async_session() as db:
+        await job_service.search_jobs(db)
+
+
+async def warmup(engines: list[AsyncEngine]) -> None:
+    # More than the pool keeps would only open overflow connections
+    n = min(settings.DB_WARMUP_CONNECTIONS, settings.db_pool_limits[0])
+    if n <= 0:
+        return
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    tasks = [_prime_connection(engine) for engine in engines for _ in range(n)]
+    try:
+        async with asyncio.timeout(settings.WARMUP_TIMEOUT_SECONDS):
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            errors = [r for r in results if isinstance(r, Exception)]
+            if errors:
+                logger.warning(
+                    "%d/%d warmup connections failed: %r",
+                    len(errors), len(tasks), errors[0],
+                )
+            await _warm_caches()
+    except Exception:
+        logger.warning("warmup incomplete", exc_info=True)
+        return
+    logger.info(
+        "warmed %d connections in %.2fs", len(tasks) - len(errors), loop.time() - start
+    )
+
+
+def is_draining() -> bool:
+    return _draining
+
+
+async def drain() -> bool:
+    """Stop admitting requests and wait for in-flight ones; False on timeout."""
+    global _draining
+    _draining = True
+    try:
+        async with asyncio.timeout(settings.SHUTDOWN_DRAIN_TIMEOUT_SECONDS):
+            await _idle.wait()
+    except TimeoutError:
+        logger.warning("shutdown with %d requests still in flight", _in_flight)
+        return False
+    return True
+
+
+class AdmissionMiddleware:
+    """Counts in-flight requests; refuses new ones while draining."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        global _in_flight
+        if scope["type"] != "http" or scope["path"].startswith(ALWAYS_ADMITTED):
+            await self.app(scope, receive, send)
+            return
+
+        if _draining:
+            response = JSONResponse(
+                {
+                    "error": {
+                        "code": "SHUTTING_DOWN",
+                        "message": "서버가 재시작 중입니다",
+                    }
+                },
+                status_code=503,
+                headers={"Connection": "close", "Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+
+        _in_flight += 1
+        _idle.clear()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _in_flight -= 1
+            if _in_flight == 0:
+                _idle.set()
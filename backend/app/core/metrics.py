@@ -0,0 +1,180 @@
+"""
+In-process metrics registry.
+
+Counters are per worker process; each one is keyed by its label values.
+`render` produces the Prometheus text exposition format; collectors
+registered with `collector` refresh gauges right before each render.
+Under gunicorn every worker serves its own values on a port of its own
+(see app.core.monitoring).
+"""
+
+import bisect
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] += amount
+
+    def value(self, **labels: str) -> float:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        return self._values.get(key, 0)
+
+    def samples(self) -> list[tuple[dict[str, str], float]]:
+        with self._lock:
+            items = list(self._values.items())
+        return [(dict(zip(self.labelnames, key)), value) for key, value in items]
+
+    def exposition(self) -> list[str]:
+        return [_line(self.name, labels, value) for labels, value in self.samples()]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (per-bucket counts incl. +Inf, sum)
+        self._values: dict[tuple[str, ...], tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = ([0] * (len(self.buckets) + 1), 0.0)
+            counts, total = self._values[key]
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        entry = self._values.get(key)
+        return sum(entry[0]) if entry else 0
+
+    def exposition(self) -> list[str]:
+        with self._lock:
+            items = [(key, list(c), s) for key, (c, s) in self._values.items()]
+        lines = []
+        for key, counts, total in items:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, n in zip((*self.buckets, float("inf")), counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_labels = {**labels, "le": le}
+                lines.append(_line(f"{self.name}_bucket", bucket_labels, cumulative))
+            lines.append(_line(f"{self.name}_sum", labels, total))
+            lines.append(_line(f"{self.name}_count", labels, cumulative))
+        return lines
+
+
+REGISTRY: dict[str, Counter | Histogram] = {}
+_collectors: list[Callable[[], None]] = []
+
+
+def counter(name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+    """Get or register the counter `name`."""
+    if name not in REGISTRY:
+        REGISTRY[name] = Counter(name, documentation, labelnames)
+    return REGISTRY[name]
+
+
+def gauge(name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+    """Get or register the gauge `name`."""
+    if name not in REGISTRY:
+        REGISTRY[name] = Gauge(name, documentation, labelnames)
+    return REGISTRY[name]
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: tuple[str, ...] = (),
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+) -> Histogram:
+    """Get or register the histogram `name`."""
+    if name not in REGISTRY:
+        REGISTRY[name] = Histogram(name, documentation, labelnames, buckets)
+    return REGISTRY[name]
+
+
+cache_requests = counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit/miss/error).",
+    ("cache", "result"),
+)
+
+
+def collector(fn: Callable[[], None]) -> Callable[[], None]:
+    """Register `fn` to refresh gauges before each render."""
+    _collectors.append(fn)
+    return fn
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _line(name: str, labels: dict[str, str], value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+        name = f"{name}{{{rendered}}}"
+    return f"{name} {value}"
+
+
+def render() -> str:
+    """All registered metrics in the Prometheus text format (version 0.0.4)."""
+    for fn in _collectors:
+        try:
+            fn()
+        except Exception:
+            logger.exception("metrics collector %s failed", fn.__name__)
+    lines = []
+    for metric in sorted(REGISTRY.values(), key=lambda m: m.name):
+        doc = metric.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        lines.append(f"# HELP {metric.name} {doc}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        lines.extend(metric.exposition())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,144 @@
+"""
+HTTP and runtime metrics for the /internal/metrics endpoint.
+
+- http_request_duration_seconds: latency per method, route template and
+  status; requests that match no route share route="<unmatched>".
+- http_requests_in_flight: requests currently being served.
+- event_loop_lag_seconds (+ _last_seconds): how late
+  `monitor_event_loop`'s ticks fire; high values mean something is
+  blocking the loop.
+- cache_hit_ratio: hits / (hits + misses) per cache, from
+  cache_requests_total.
+
+Values are per process. /internal/metrics is not behind nginx (which only
+forwards /api, /health and the docs) and answers from whichever worker
+takes the connection, so it is only meaningful with a single process.
+Under gunicorn each worker also serves GET /metrics on a port of its own
+(`serve_metrics`, METRICS_PORT + the worker's slot, see gunicorn.conf.py):
+scrape every one of those ports and aggregate in Prometheus.
+"""
+
+import asyncio
+import time
+
+from app.core.metrics import (
+    CONTENT_TYPE,
+    cache_requests,
+    collector,
+    gauge,
+    histogram,
+    render,
+)
+
+LOOP_LAG_INTERVAL_SECONDS = 0.5
+METRICS_READ_TIMEOUT_SECONDS = 5
+UNMATCHED_ROUTE = "<unmatched>"
+
+http_request_seconds = histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method, route template and status.",
+    ("method", "route", "status"),
+)
+http_in_flight = gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.", ("method",)
+)
+event_loop_lag_last = gauge(
+    "event_loop_lag_last_seconds", "Most recent event loop tick delay."
+)
+event_loop_lag_seconds = histogram(
+    "event_loop_lag_seconds",
+    "Event loop tick delay.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+cache_hit_ratio = gauge(
+    "cache_hit_ratio", "Hits / (hits + misses) since process start.", ("cache",)
+)
+
+
+@collector
+def _collect_cache_ratios() -> None:
+    lookups: dict[str, list[float]] = {}
+    for labels, value in cache_requests.samples():
+        counts = lookups.setdefault(labels["cache"], [0.0, 0.0])
+        if labels["result"] == "hit":
+            counts[0] += value
+        elif labels["result"] == "miss":
+            counts[1] += value
+    for cache, (hits, misses) in lookups.items():
+        if hits + misses:
+            cache_hit_ratio.set(round(hits / (hits + misses), 4), cache=cache)
+
+
+async def monitor_event_loop() -> None:
+    """Measure scheduling delay of a periodic tick until cancelled."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(LOOP_LAG_INTERVAL_SECONDS)
+        lag = max(0.0, time.perf_counter() - start - LOOP_LAG_INTERVAL_SECONDS)
+        event_loop_lag_last.set(lag)
+        event_loop_lag_seconds.observe(lag)
+
+
+async def _answer_scrape(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        async with asyncio.timeout(METRICS_READ_TIMEOUT_SECONDS):
+            request_line = await reader.readline()
+            while (await reader.readline()).strip():
+                pass  # headers
+        method, target, *_ = request_line.split() or [b"", b""]
+        if method == b"GET" and target.split(b"?")[0] == b"/metrics":
+            status, body = "200 OK", render().encode()
+        else:
+            status, body = "404 Not Found", b""
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+    except (TimeoutError, ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve_metrics(port: int) -> asyncio.Server:
+    """Serve this process's metrics at GET /metrics on `port`.
+
+    A bare asyncio server beside the app, so a scrape reaches this worker
+    rather than whichever one accepts on the shared port.
+    """
+    return await asyncio.start_server(_answer_scrape, "0.0.0.0", port)
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_in_flight.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_in_flight.dec(method=method)
+            route = scope.get("route")
+            http_request_seconds.observe(
+                time.perf_counter() - start,
+                method=method,
+                route=route.path if route else UNMATCHED_ROUTE,
+                status=status,
+            )
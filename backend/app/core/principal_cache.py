@@ -0,0 +1,96 @@
+"""
+Cache of authenticated principals for `get_current_user`.
+
+Holds only the columns request handling reads from the current user
+(id, email, type, role, status): a short-lived in-process LRU in front of
+Redis. On a hit `get_current_user` skips the users query and returns a
+detached `User` carrying just those columns; load the row explicitly
+before modifying a user.
+
+`invalidate` runs after commit. Other workers' LRUs can serve the previous
+state for up to PRINCIPAL_LOCAL_TTL_SECONDS.
+"""
+
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.metrics import cache_requests
+from app.core.redis import get_redis
+from app.db.hooks import run_after_commit
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+CACHE_NAME = "principal"
+KEY_PREFIX = "principal:"
+FIELDS = ("email", "type", "role", "status")
+
+# user id -> (expires_at, fields)
+_local: OrderedDict[uuid.UUID, tuple[float, dict]] = OrderedDict()
+
+
+def _to_user(user_id: uuid.UUID, fields: dict) -> User:
+    return User(id=user_id, **fields)
+
+
+def _remember(user_id: uuid.UUID, fields: dict) -> None:
+    _local[user_id] = (time.monotonic() + settings.PRINCIPAL_LOCAL_TTL_SECONDS, fields)
+    _local.move_to_end(user_id)
+    while len(_local) > settings.PRINCIPAL_LOCAL_MAX_SIZE:
+        _local.popitem(last=False)
+
+
+async def get(user_id: uuid.UUID) -> User | None:
+    entry = _local.get(user_id)
+    if entry and entry[0] > time.monotonic():
+        _local.move_to_end(user_id)
+        cache_requests.inc(cache=CACHE_NAME, result="hit")
+        return _to_user(user_id, entry[1])
+
+    try:
+        raw = await get_redis().get(f"{KEY_PREFIX}{user_id}")
+    except RedisError:
+        logger.warning("principal cache unavailable", exc_info=True)
+        cache_requests.inc(cache=CACHE_NAME, result="error")
+        return None
+    if raw is None:
+        cache_requests.inc(cache=CACHE_NAME, result="miss")
+        return None
+    cache_requests.inc(cache=CACHE_NAME, result="hit")
+    fields = json.loads(raw)
+    _remember(user_id, fields)
+    return _to_user(user_id, fields)
+
+
+async def put(user: User) -> None:
+    fields = {name: getattr(user, name) for name in FIELDS}
+    _remember(user.id, fields)
+    try:
+        await get_redis().set(
+            f"{KEY_PREFIX}{user.id}",
+            json.dumps(fields),
+            ex=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        )
+    except RedisError:
+        logger.warning("principal cache write failed", exc_info=True)
+
+
+async def evict(user_id: uuid.UUID) -> None:
+    _local.pop(user_id, None)
+    try:
+        await get_redis().delete(f"{KEY_PREFIX}{user_id}")
+    except RedisError:
+        logger.warning("principal cache eviction failed", exc_info=True)
+
+
+def invalidate(db: AsyncSession, user_id: uuid.UUID) -> None:
+    """Evict `user_id` once the current transaction commits."""
+    run_after_commit(db, f"{KEY_PREFIX}{user_id}", lambda: evict(user_id))
@@ -1,8 +1,179 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+"""
+Distributed rate limiting.
 
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=[],
-    storage_uri="memory://",
+Limits are sliding windows shared by every worker: counters live in Redis
+and one Lua script reads and bumps them atomically. The window is
+approximated from two fixed buckets (the previous bucket weighted by how
+much of it still overlaps the window, plus the current one), so each
+(policy, client) pair costs two small keys however high the limit is.
+
+Routes opt in with a policy from POLICIES:
+
+    @router.post("/login", dependencies=[Depends(limiter.limit("login"))])
+
+Clients are identified by IP (nginx's X-Real-IP), or, for per-user
+policies, by the access token's user id when one is sent. If Redis is
+unavailable the same algorithm runs on a process-local table until it
+comes back, so limits are briefly per worker instead of failing open.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Request
+from redis.exceptions import RedisError
+
+from app.core.metrics import counter
+from app.core.redis import get_redis
+from app.core.security import access_token_subject
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "ratelimit:"
+LOCAL_MAX_KEYS = 10000
+
+SLIDING_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local weight = tonumber(ARGV[3])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local used = math.floor(previous * weight) + current
+if used >= limit then
+    return {0, 0}
+end
+redis.call('INCR', KEYS[1])
+if current == 0 then
+    redis.call('EXPIRE', KEYS[1], ttl)
+end
+return {1, limit - used - 1}
+"""
+
+rate_limit_requests = counter(
+    "rate_limit_requests_total",
+    "Rate-limited requests by policy and outcome (allowed/rejected).",
+    ("policy", "outcome"),
+)
+rate_limit_fallbacks = counter(
+    "rate_limit_local_fallback_total",
+    "Rate-limit checks served by the process-local table (Redis unavailable).",
 )
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    name: str
+    limit: int
+    window: int  # seconds
+    per_user: bool = False  # key by user id when authenticated, else by IP
+
+
+@dataclass(frozen=True)
+class RateDecision:
+    allowed: bool
+    remaining: int
+    retry_after: int  # seconds; 0 when allowed
+
+
+POLICIES: dict[str, RatePolicy] = {
+    "signup": RatePolicy("signup", limit=3, window=60),
+    "login": RatePolicy("login", limit=5, window=60),
+    "refresh": RatePolicy("refresh", limit=10, window=60),
+    "webhook": RatePolicy("webhook", limit=300, window=60),
+    "search": RatePolicy("search", limit=120, window=60, per_user=True),
+}
+
+
+def client_ip(request: Request) -> str:
+    return request.headers.get("x-real-ip") or (
+        request.client.host if request.client else "unknown"
+    )
+
+
+def client_identity(request: Request, policy: RatePolicy) -> str:
+    if policy.per_user:
+        user_id = access_token_subject(request.headers.get("authorization"))
+        if user_id:
+            return f"u:{user_id}"
+    return f"ip:{client_ip(request)}"
+
+
+class RateLimiter:
+    def __init__(self, policies: dict[str, RatePolicy]):
+        self.policies = policies
+        self.enabled = True
+        self._script = None
+        self._script_client = None
+        # key -> (count, expires_at)
+        self._local: dict[str, tuple[int, float]] = {}
+
+    def _sliding_window(self):
+        client = get_redis()
+        if self._script_client is not client:
+            self._script = client.register_script(SLIDING_WINDOW_LUA)
+            self._script_client = client
+        return self._script
+
+    def _local_count(self, key: str, now: float) -> int:
+        entry = self._local.get(key)
+        return entry[0] if entry and entry[1] > now else 0
+
+    def _local_hit(
+        self, keys: tuple[str, str], policy: RatePolicy, weight: float, now: float
+    ) -> tuple[int, int]:
+        current = self._local_count(keys[0], now)
+        used = math.floor(self._local_count(keys[1], now) * weight) + current
+        if used >= policy.limit:
+            return 0, 0
+        if len(self._local) >= LOCAL_MAX_KEYS:
+            self._local = {k: v for k, v in self._local.items() if v[1] > now}
+        self._local[keys[0]] = (current + 1, now + policy.window * 2)
+        return 1, policy.limit - used - 1
+
+    async def hit(
+        self, policy: RatePolicy, identity: str, now: float | None = None
+    ) -> RateDecision:
+        """Count one request from `identity` against `policy`."""
+        now = time.time() if now is None else now
+        bucket, offset = divmod(now, policy.window)
+        base = f"{KEY_PREFIX}{policy.name}:{identity}:"
+        keys = (f"{base}{int(bucket)}", f"{base}{int(bucket) - 1}")
+        weight = 1 - offset / policy.window
+
+        try:
+            allowed, remaining = await self._sliding_window()(
+                keys=list(keys), args=[policy.limit, policy.window * 2, weight]
+            )
+        except RedisError:
+            logger.warning("rate limit store unavailable", exc_info=True)
+            rate_limit_fallbacks.inc()
+            allowed, remaining = self._local_hit(keys, policy, weight, now)
+
+        if allowed:
+            return RateDecision(True, int(remaining), 0)
+        return RateDecision(False, 0, max(1, math.ceil(policy.window - offset)))
+
+    def limit(self, name: str):
+        """Route dependency enforcing POLICIES[`name`]."""
+        policy = self.policies[name]
+
+        async def dependency(request: Request) -> None:
+            if not self.enabled:
+                return
+            decision = await self.hit(policy, client_identity(request, policy))
+            if decision.allowed:
+                rate_limit_requests.inc(policy=policy.name, outcome="allowed")
+                return
+            rate_limit_requests.inc(policy=policy.name, outcome="rejected")
+            raise HTTPException(
+                status_code=429,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요",
+                headers={"Retry-After": str(decision.retry_after)},
+            )
+
+        return dependency
+
+
+limiter = RateLimiter(POLICIES)
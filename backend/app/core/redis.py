@@ -0,0 +1,109 @@
+"""
+Process-wide Redis client.
+
+One client over a bounded `BlockingConnectionPool` (REDIS_MAX_CONNECTIONS;
+callers wait up to REDIS_POOL_TIMEOUT_SECONDS for a free connection) with
+socket/connect timeouts, so a slow or unreachable Redis fails fast and
+callers fall back instead of stalling requests. The lifespan creates it
+with `init_redis` and closes it with `close_redis`; `get_redis` creates it
+on first use elsewhere (scripts, tests).
+
+`check` pings Redis and records the result (`is_healthy`, `redis_up`).
+"""
+
+import logging
+import time
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.core.metrics import gauge, histogram
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+redis_command_seconds = histogram(
+    "redis_command_duration_seconds",
+    "Redis command round trips by command.",
+    ("command",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+redis_up = gauge("redis_up", "1 if the last Redis health check succeeded.")
+
+
+class TimedRedis(aioredis.Redis):
+    """Client that observes the latency of every command it sends."""
+
+    async def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            redis_command_seconds.observe(
+                time.perf_counter() - start, command=str(args[0]).upper()
+            )
+
+
+_client: TimedRedis | None = None
+_healthy = True
+_last_error: str | None = None
+
+
+def _create_client() -> TimedRedis:
+    pool = aioredis.BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        decode_responses=True,
+    )
+    return TimedRedis.from_pool(pool)
+
+
+def get_redis() -> TimedRedis:
+    """Process-wide Redis client (connection pool shared across requests)."""
+    global _client
+    if _client is None:
+        _client = _create_client()
+    return _client
+
+
+async def init_redis() -> None:
+    get_redis()
+    if not await check():
+        logger.warning("Redis unavailable at startup: %s", _last_error)
+
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+
+
+async def check() -> bool:
+    """Ping Redis and record whether it is reachable."""
+    global _healthy, _last_error
+    try:
+        await get_redis().ping()
+    except (RedisError, OSError) as exc:
+        if _healthy:
+            logger.warning("Redis health check failed: %s", exc)
+        _healthy, _last_error = False, str(exc) or exc.__class__.__name__
+    else:
+        if not _healthy:
+            logger.info("Redis reachable again")
+        _healthy, _last_error = True, None
+    redis_up.set(1 if _healthy else 0)
+    return _healthy
+
+
+def is_healthy() -> bool:
+    return _healthy
+
+
+def last_error() -> str | None:
+    return _last_error
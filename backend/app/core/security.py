@@ -1,13 +1,24 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import Callable, TypeVar
 from uuid import UUID
 
+from fastapi import HTTPException
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
+from app.core.metrics import counter, gauge
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes made with a different cost report needs_update -> rehashed on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+T = TypeVar("T")
 
 
 def hash_password(password: str) -> str:
@@ -18,6 +29,79 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+# --- Off-loop hashing ---
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the event
+# loop. Admission is bounded: beyond PASSWORD_HASH_MAX_PENDING queued + running
+# jobs a request gets 503 instead of piling up behind the pool.
+
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="pwhash"
+)
+_hash_pending = 0
+
+password_hash_pending = gauge(
+    "password_hash_pending", "Password hash jobs queued or running."
+)
+password_hash_ops = counter(
+    "password_hash_ops_total", "Password hash jobs by operation.", ("op",)
+)
+password_hash_rejected = counter(
+    "password_hash_rejected_total", "Password hash jobs rejected (pool saturated)."
+)
+password_hash_wait_seconds = counter(
+    "password_hash_wait_seconds_total", "Seconds hash jobs spent queued.", ("op",)
+)
+password_hash_run_seconds = counter(
+    "password_hash_run_seconds_total", "Seconds spent hashing.", ("op",)
+)
+
+
+async def _run_hash_job(op: str, fn: Callable[..., T], *args) -> T:
+    global _hash_pending
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        password_hash_rejected.inc()
+        raise HTTPException(
+            status_code=503, detail="요청이 많습니다. 잠시 후 다시 시도해주세요"
+        )
+
+    queued_at = time.perf_counter()
+    timing: dict[str, float] = {}
+
+    def _timed():
+        timing["start"] = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            timing["end"] = time.perf_counter()
+
+    _hash_pending += 1
+    password_hash_pending.set(_hash_pending)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, _timed)
+    finally:
+        _hash_pending -= 1
+        password_hash_pending.set(_hash_pending)
+        password_hash_ops.inc(op=op)
+        if "start" in timing:
+            password_hash_wait_seconds.inc(timing["start"] - queued_at, op=op)
+            password_hash_run_seconds.inc(
+                timing.get("end", timing["start"]) - timing["start"], op=op
+            )
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hash_job("hash", pwd_context.hash, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> tuple[bool, str | None]:
+    """(valid, replacement hash if the stored one uses outdated parameters)."""
+    return await _run_hash_job("verify", pwd_context.verify_and_update, plain, hashed)
+
+
+def shutdown_hash_executor() -> None:
+    _hash_executor.shutdown(wait=True, cancel_futures=True)
+
+
 def create_access_token(
     user_id: UUID, role: str, user_type: str = "", email: str = ""
 ) -> str:
@@ -43,5 +127,36 @@ def create_refresh_token(user_id: UUID) -> str:
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
+def create_stream_token(user_id: UUID) -> str:
+    """Short-lived token for opening the notification stream from EventSource.
+
+    EventSource cannot send an Authorization header, so the token travels in
+    the query string (and so in access logs); it only opens a stream, and
+    only for a minute.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(
+        seconds=settings.NOTIFICATION_STREAM_TOKEN_EXPIRE_SECONDS
+    )
+    payload = {
+        "sub": str(user_id),
+        "exp": expire,
+        "type": "stream",
+    }
+    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
 def decode_token(token: str) -> dict:
     return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+
+
+def access_token_subject(authorization: str | None) -> str | None:
+    """User id from an `Authorization: Bearer` access token, without a DB lookup."""
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    try:
+        payload = decode_token(authorization[7:])
+    except JWTError:
+        return None
+    if payload.get("type") != "access":
+        return None
+    return payload.get("sub")
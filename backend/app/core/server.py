@@ -0,0 +1,21 @@
+"""
+Gunicorn worker class for the production profile (see gunicorn.conf.py).
+"""
+
+from uvicorn_worker import UvicornWorker
+
+
+class ProductionUvicornWorker(UvicornWorker):
+    """uvloop + httptools explicitly (fail loudly if missing), lifespan on.
+
+    Client IPs come from nginx's X-Real-IP (see rate_limit.client_ip), so
+    proxy headers keep uvicorn's default of trusting only localhost.
+    """
+
+    CONFIG_KWARGS = {
+        **UvicornWorker.CONFIG_KWARGS,
+        "loop": "uvloop",
+        "http": "httptools",
+        "lifespan": "on",
+        "server_header": False,
+    }
@@ -0,0 +1,33 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodic(
+    job: Callable[[], Awaitable[object]],
+    interval: float,
+    name: str,
+    final_run: bool = True,
+) -> None:
+    """Run `job` every `interval` seconds until cancelled, then once more.
+
+    Failures are logged and retried on the next tick. Jobs with nothing to
+    flush on shutdown pass final_run=False.
+    """
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await job()
+            except Exception:
+                logger.exception("periodic task %s failed", name)
+    except asyncio.CancelledError:
+        if not final_run:
+            raise
+        try:
+            await job()
+        except Exception:
+            logger.exception("final run of periodic task %s failed", name)
+        raise
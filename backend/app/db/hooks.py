@@ -0,0 +1,73 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import SessionTransaction
+
+# key -> (transaction the job was registered in, job)
+_PENDING = "after_commit_jobs"
+
+# Strong references for fire-and-forget jobs
+_background: set[asyncio.Task] = set()
+
+
+def _run_pending(session) -> None:
+    # Also fired when a savepoint is released; jobs wait for the real commit
+    if session.get_nested_transaction() is not None:
+        return
+    jobs = session.info.pop(_PENDING, {})
+    loop = asyncio.get_running_loop()
+    for _, job in jobs.values():
+        task = loop.create_task(job())
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+
+
+def _within(
+    transaction: SessionTransaction | None, ended: SessionTransaction
+) -> bool:
+    while transaction is not None:
+        if transaction is ended:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+def _discard_rolled_back(session, previous_transaction: SessionTransaction) -> None:
+    """Drop jobs registered inside the transaction or savepoint rolled back."""
+    pending = session.info.get(_PENDING)
+    if not pending:
+        return
+    if previous_transaction.parent is None:
+        pending.clear()
+        return
+    for key in [k for k, (t, _) in pending.items() if _within(t, previous_transaction)]:
+        del pending[key]
+
+
+async def wait_background() -> None:
+    """Wait for after-commit jobs still running (shutdown)."""
+    if _background:
+        await asyncio.gather(*_background, return_exceptions=True)
+
+
+def run_after_commit(
+    db: AsyncSession, key: str, job: Callable[[], Awaitable[object]]
+) -> None:
+    """Run `job` on the event loop once the current transaction commits.
+
+    Jobs registered under the same key within a transaction run once. A job
+    is dropped if the transaction rolls back, or the savepoint it was
+    registered in does (other jobs of the transaction still run). Use it
+    for cache invalidation, so that a concurrent reader cannot re-cache the
+    pre-commit state, and for side effects that must only count committed
+    writes.
+    """
+    session = db.sync_session
+    # Registered once per session and kept for its lifetime
+    if not event.contains(session, "after_commit", _run_pending):
+        event.listen(session, "after_commit", _run_pending)
+        event.listen(session, "after_soft_rollback", _discard_rolled_back)
+    transaction = session.get_nested_transaction() or session.get_transaction()
+    session.info.setdefault(_PENDING, {}).setdefault(key, (transaction, job))
@@ -0,0 +1,192 @@
+"""
+Per-request SQL instrumentation.
+
+`QueryStatsMiddleware` opens a `QueryStats` for each HTTP request; cursor
+events on every instrumented engine add to it: statement count, time
+spent in the database, the slowest statements and time spent waiting for
+a pooled connection (`TimedQueuePool`). When the request ends:
+
+- statements whose shape (SQL with bind lists collapsed) ran at least
+  DB_N_PLUS_ONE_THRESHOLD times are logged as N+1 suspects;
+- statements slower than DB_SLOW_STATEMENT_MS are logged;
+- in DEBUG, X-DB-Statements / X-DB-Time / X-DB-Pool-Wait (ms) response
+  headers report the totals so far.
+
+Statements outside a request (background tasks, scripts) are not tracked.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import get_settings
+from app.core.metrics import collector, counter, gauge
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+SLOWEST_KEPT = 3
+_BIND = r"(?:\$\d+|%\(\w+\)s|\?)"
+_BIND_LIST = re.compile(rf"{_BIND}(?:\s*,\s*{_BIND})*")
+_STARTED = "query_started_at"
+
+_current: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+
+db_statements = counter("db_statements_total", "SQL statements executed.")
+db_time_seconds = counter("db_time_seconds_total", "Seconds spent executing SQL.")
+db_pool_wait_seconds = counter(
+    "db_pool_wait_seconds_total", "Seconds spent waiting for a pooled connection."
+)
+db_pool_connections = gauge(
+    "db_pool_connections",
+    "Pool connections by engine and state (size/checked_out/overflow/idle).",
+    ("engine", "state"),
+)
+db_n_plus_one = counter(
+    "db_n_plus_one_suspects_total",
+    "Repeated statement shapes flagged per route.",
+    ("route",),
+)
+
+
+def statement_shape(statement: str) -> str:
+    return _BIND_LIST.sub("?", " ".join(statement.split()))
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    db_time: float = 0.0
+    pool_wait: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.statements += 1
+        self.db_time += duration
+        self.shapes[statement_shape(statement)] += 1
+        self.slowest.append((duration, statement))
+        self.slowest.sort(key=lambda item: item[0], reverse=True)
+        del self.slowest[SLOWEST_KEPT:]
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+def current_stats() -> QueryStats | None:
+    return _current.get()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout took."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            waited = time.perf_counter() - start
+            db_pool_wait_seconds.inc(waited)
+            stats = _current.get()
+            if stats is not None:
+                stats.pool_wait += waited
+
+
+def _before_cursor_execute(conn, cursor, statement, params, context, executemany):
+    conn.info.setdefault(_STARTED, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, params, context, executemany):
+    duration = time.perf_counter() - conn.info[_STARTED].pop()
+    db_statements.inc()
+    db_time_seconds.inc(duration)
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_STARTED):
+        conn.info[_STARTED].pop()
+
+
+_engines: dict[str, AsyncEngine] = {}
+
+
+@collector
+def _collect_pool_stats() -> None:
+    for name, engine in _engines.items():
+        pool = engine.sync_engine.pool
+        for state, value in (
+            ("size", pool.size()),
+            ("checked_out", pool.checkedout()),
+            ("overflow", pool.overflow()),
+            ("idle", pool.checkedin()),
+        ):
+            db_pool_connections.set(value, engine=name, state=state)
+
+
+def instrument(engine: AsyncEngine, name: str) -> None:
+    _engines[name] = engine
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+def _report(scope, stats: QueryStats) -> None:
+    route = scope.get("route")
+    name = f"{scope['method']} {route.path if route else scope['path']}"
+
+    for shape, n in stats.repeated(settings.DB_N_PLUS_ONE_THRESHOLD):
+        db_n_plus_one.inc(route=name)
+        logger.warning("N+1 suspect in %s: %d x %s", name, n, shape[:300])
+
+    slow = [s for s in stats.slowest if s[0] * 1000 >= settings.DB_SLOW_STATEMENT_MS]
+    for duration, statement in slow:
+        logger.warning(
+            "slow statement in %s (%.0f ms): %s",
+            name, duration * 1000, " ".join(statement.split())[:300],
+        )
+
+    logger.debug(
+        "%s: %d statements, db %.1f ms, pool wait %.1f ms",
+        name, stats.statements, stats.db_time * 1000, stats.pool_wait * 1000,
+    )
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-db-statements", str(stats.statements).encode()),
+                    (b"x-db-time", f"{stats.db_time * 1000:.1f}".encode()),
+                    (b"x-db-pool-wait", f"{stats.pool_wait * 1000:.1f}".encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current.reset(token)
+            if stats.statements:
+                _report(scope, stats)
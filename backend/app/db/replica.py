@@ -0,0 +1,134 @@
+"""
+Read replica routing state.
+
+Sessions from `get_read_db` read from the replica engine while it is
+healthy: reachable and no more than DB_REPLICA_MAX_LAG_SECONDS behind the
+primary (checked periodically by `check`). Requests from a user who wrote
+in the last DB_READ_YOUR_WRITES_SECONDS stay on the primary so they see
+their own writes. Without DATABASE_REPLICA_URL everything uses the primary.
+"""
+
+import logging
+import time
+
+from redis.exceptions import RedisError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import get_settings
+from app.core.metrics import counter, gauge
+from app.core.redis import get_redis
+from app.db.instrumentation import TimedQueuePool, instrument
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+STICKY_PREFIX = "db:sticky:"
+
+LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+engine: AsyncEngine | None = (
+    create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        echo=settings.DEBUG,
+        pool_size=(
+            settings.DB_REPLICA_POOL_SIZE
+            if settings.DB_REPLICA_POOL_SIZE is not None
+            else settings.db_pool_limits[0]
+        ),
+        max_overflow=(
+            settings.DB_REPLICA_MAX_OVERFLOW
+            if settings.DB_REPLICA_MAX_OVERFLOW is not None
+            else settings.db_pool_limits[1]
+        ),
+        pool_pre_ping=True,
+        poolclass=TimedQueuePool,
+    )
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+
+if engine is not None:
+    instrument(engine, "replica")
+
+_healthy = engine is not None
+# user id -> sticky until (monotonic); used while Redis is unavailable
+_local_sticky: dict[str, float] = {}
+
+replica_lag_seconds = gauge("db_replica_lag_seconds", "Last measured replica lag.")
+read_routing = counter(
+    "db_read_routing_total", "Read-only sessions by target database.", ("target",)
+)
+
+
+def available() -> bool:
+    return engine is not None and _healthy
+
+
+def mark_unhealthy(reason: str) -> None:
+    """Send reads to the primary until the next successful `check`."""
+    global _healthy
+    if _healthy:
+        logger.warning("replica disabled for reads: %s", reason)
+    _healthy = False
+
+
+async def check() -> None:
+    """Periodic health/lag probe."""
+    global _healthy
+    if engine is None:
+        return
+    try:
+        async with engine.connect() as conn:
+            lag = float((await conn.execute(LAG_QUERY)).scalar() or 0)
+    except Exception as exc:
+        mark_unhealthy(f"unreachable ({exc.__class__.__name__})")
+        return
+    replica_lag_seconds.set(lag)
+    if lag > settings.DB_REPLICA_MAX_LAG_SECONDS:
+        mark_unhealthy(f"lag {lag:.1f}s")
+    elif not _healthy:
+        logger.info("replica back in rotation (lag %.1fs)", lag)
+        _healthy = True
+
+
+async def stick(user_id: str | None) -> None:
+    """Keep `user_id`'s reads on the primary after they wrote."""
+    if engine is None or not user_id:
+        return
+    ttl = settings.DB_READ_YOUR_WRITES_SECONDS
+    try:
+        await get_redis().set(f"{STICKY_PREFIX}{user_id}", 1, ex=ttl)
+    except RedisError:
+        logger.warning("read-your-writes marker not stored in Redis", exc_info=True)
+        _local_sticky[user_id] = time.monotonic() + ttl
+
+
+async def _is_sticky(user_id: str) -> bool:
+    until = _local_sticky.get(user_id)
+    if until is not None:
+        if until > time.monotonic():
+            return True
+        del _local_sticky[user_id]
+    try:
+        return bool(await get_redis().exists(f"{STICKY_PREFIX}{user_id}"))
+    except RedisError:
+        logger.warning("read-your-writes marker unavailable", exc_info=True)
+        return True
+
+
+async def use_for(user_id: str | None) -> bool:
+    """Whether a read-only session for `user_id` (None: anonymous) may use it."""
+    use = available() and not (user_id and await _is_sticky(user_id))
+    read_routing.inc(target="replica" if use else "primary")
+    return use
@@ -1,22 +1,89 @@
 from collections.abc import AsyncGenerator
 
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.exc import InterfaceError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.core.security import access_token_subject
+from app.db import replica
+from app.db.instrumentation import TimedQueuePool, instrument
 
 settings = get_settings()
 
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    pool_size=20,
-    max_overflow=10,
+    pool_size=settings.db_pool_limits[0],
+    max_overflow=settings.db_pool_limits[1],
+    poolclass=TimedQueuePool,
 )
+instrument(engine, "primary")
 
-async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+READ_ONLY = "read_only"
+READ_BIND = "read_bind"
+WROTE = "wrote"
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+class RoutingSession(Session):
+    """Uses the engine a read-only session was routed to, else the primary."""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        bind = self.info.get(READ_BIND)
+        if bind is not None:
+            return bind
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+async_session = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+)
+
+
+class ReadOnlySessionError(RuntimeError):
+    """A session opened with `get_read_db` tried to write."""
+
+
+@event.listens_for(Session, "after_begin")
+def _begin_read_only(session, transaction, connection) -> None:
+    if session.info.get(READ_ONLY):
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session, flush_context, instances) -> None:
+    if session.info.get(READ_ONLY):
+        raise ReadOnlySessionError(
+            "read-only session has pending changes; use get_db for handlers that write"
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def _note_write(session, flush_context) -> None:
+    session.info[WROTE] = True
+
+
+def mark_read_only(session: AsyncSession) -> None:
+    session.info[READ_ONLY] = True
+
+
+async def route_read_only(session: AsyncSession, request: Request) -> bool:
+    """Make `session` read-only, on the replica unless the caller must see
+    their own recent writes. Returns whether the replica is used."""
+    mark_read_only(session)
+    user_id = access_token_subject(request.headers.get("authorization"))
+    if not await replica.use_for(user_id):
+        return False
+    session.info[READ_BIND] = replica.engine.sync_engine
+    return True
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         try:
             yield session
@@ -24,3 +91,25 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+        if session.info.get(WROTE):
+            await replica.stick(
+                access_token_subject(request.headers.get("authorization"))
+            )
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session for handlers that only read.
+
+    Its transaction is READ ONLY, routed to the read replica when one is
+    usable, and rolled back rather than committed as soon as the handler
+    returns, releasing the connection to the pool. Flushing pending
+    changes raises ReadOnlySessionError.
+    """
+    async with async_session() as session:
+        on_replica = await route_read_only(session, request)
+        try:
+            yield session
+        except (OperationalError, InterfaceError, OSError) as exc:
+            if on_replica:
+                replica.mark_unhealthy(f"query failed ({exc.__class__.__name__})")
+            raise
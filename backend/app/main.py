@@ -1,16 +1,93 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlalchemy import text
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 
 from app.api.router import api_router
 from app.core.config import get_settings
 from app.core.exceptions import register_exception_handlers
-from app.core.rate_limit import limiter
-from app.db.session import async_session
+from app.core import lifecycle, redis
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.core.metrics import render as render_metrics
+from app.core.monitoring import (
+    RequestMetricsMiddleware,
+    monitor_event_loop,
+    serve_metrics,
+)
+from app.core.security import shutdown_hash_executor
+from app.core.tasks import run_periodic
+from app.db import replica
+from app.db.instrumentation import QueryStatsMiddleware
+from app.db import hooks
+from app.db.session import async_session, engine
+from app.services import job_stats, notification_stream, view_counter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    engines = [engine] + ([replica.engine] if replica.engine is not None else [])
+    await redis.init_redis()
+    await lifecycle.warmup(engines)
+    metrics_server = (
+        await serve_metrics(settings.METRICS_PORT) if settings.METRICS_PORT else None
+    )
+    background = [
+        asyncio.create_task(monitor_event_loop()),
+        asyncio.create_task(
+            run_periodic(
+                redis.check,
+                settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+                "redis health check",
+            )
+        ),
+        asyncio.create_task(
+            run_periodic(
+                view_counter.flush, settings.VIEW_FLUSH_INTERVAL_SECONDS, "view flush"
+            )
+        ),
+        asyncio.create_task(
+            run_periodic(
+                job_stats.rollup,
+                settings.JOB_STATS_ROLLUP_INTERVAL_SECONDS,
+                "job stats rollup",
+            )
+        ),
+    ]
+    if replica.engine is not None:
+        background.append(
+            asyncio.create_task(
+                run_periodic(
+                    replica.check,
+                    settings.DB_REPLICA_CHECK_INTERVAL_SECONDS,
+                    "replica check",
+                )
+            )
+        )
+    yield
+
+    # Drain: end the notification streams (clients reconnect elsewhere), then
+    # requests, then the flushers (their final run writes out buffered
+    # views/stats), after-commit jobs, and finally the pools.
+    await notification_stream.hub.close()
+    await lifecycle.drain()
+    for task in background:
+        task.cancel()
+    for task in background:
+        with suppress(asyncio.CancelledError):
+            await task
+    await hooks.wait_background()
+    shutdown_hash_executor()
+    for e in engines:
+        await e.dispose()
+    await redis.close_redis()
+    if metrics_server is not None:
+        metrics_server.close()
+        await metrics_server.wait_closed()
 
 
 def create_app() -> FastAPI:
@@ -22,12 +99,9 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/docs" if settings.DEBUG else None,
         redoc_url="/redoc" if settings.DEBUG else None,
+        lifespan=lifespan,
     )
 
-    # Rate limiter
-    app.state.limiter = limiter
-    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
     # Trusted host (production only)
     if not settings.DEBUG and settings.ALLOWED_HOSTS != "*":
         app.add_middleware(
@@ -42,16 +116,27 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(QueryStatsMiddleware)
+    app.add_middleware(RequestMetricsMiddleware)
+    app.add_middleware(lifecycle.AdmissionMiddleware)
 
     app.include_router(api_router)
     register_exception_handlers(app)
 
+    # Not proxied by nginx; under gunicorn scrape the per-worker METRICS_PORTs
+    @app.get("/internal/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
     @app.get("/health")
     async def health():
         return {"status": "ok"}
 
     @app.get("/health/ready")
     async def health_ready():
+        if lifecycle.is_draining():
+            return JSONResponse(status_code=503, content={"status": "draining"})
+
         checks: dict[str, str] = {}
 
         try:
@@ -61,15 +146,10 @@ def create_app() -> FastAPI:
         except Exception as e:
             checks["database"] = f"error: {e}"
 
-        try:
-            import redis.asyncio as aioredis
-
-            r = aioredis.from_url(settings.REDIS_URL)
-            await r.ping()
-            await r.aclose()
+        if await redis.check():
             checks["redis"] = "ok"
-        except Exception as e:
-            checks["redis"] = f"error: {e}"
+        else:
+            checks["redis"] = f"error: {redis.last_error()}"
 
         all_ok = all(v == "ok" for v in checks.values())
         return JSONResponse(
@@ -2,10 +2,11 @@ from app.models.base import Base, BaseModel
 from app.models.user import User, UserProfile
 from app.models.company import Company, CompanyUser, CompanyVerification
 from app.models.resume import Resume, ResumeLicense, ResumeCareer
-from app.models.job import JobPost, JobPostHistory
+from app.models.job import JobDailyStat, JobPost, JobPostHistory
 from app.models.application import Application, ApplicationStatusHistory, ApplicationNote
 from app.models.interaction import Favorite, Follow, Scout
-from app.models.notification import Notification
+from app.models.notification import Notification, NotificationCounter
+from app.models.outbox import OutboxEvent
 from app.models.payment import Product, Order, Payment, Entitlement, Invoice
 from app.models.admin import Report, AdminLog
 
@@ -22,6 +23,7 @@ __all__ = [
     "ResumeCareer",
     "JobPost",
     "JobPostHistory",
+    "JobDailyStat",
     "Application",
     "ApplicationStatusHistory",
     "ApplicationNote",
@@ -29,6 +31,8 @@ __all__ = [
     "Follow",
     "Scout",
     "Notification",
+    "NotificationCounter",
+    "OutboxEvent",
     "Product",
     "Order",
     "Payment",
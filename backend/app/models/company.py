@@ -3,6 +3,7 @@ from __future__ import annotations
 import uuid
 
 from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import UserStatus, VerificationStatus
@@ -14,6 +15,7 @@ class Company(BaseModel):
     __table_args__ = (
         Index("ix_companies_business_no", "business_no", unique=True),
         Index("ix_companies_status", "status"),
+        Index("ix_companies_name_keys", "name_keys", postgresql_using="gin"),
     )
 
     business_no: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
@@ -21,6 +23,8 @@ class Company(BaseModel):
     type: Mapped[str | None] = mapped_column(String(50))
     address: Mapped[str | None] = mapped_column(String(500))
     status: Mapped[str] = mapped_column(String(20), default=UserStatus.ACTIVE.value)
+    # Hangul bigram/chosung keys of name (app.core.hangul.index_keys)
+    name_keys: Mapped[list[str] | None] = mapped_column(ARRAY(Text), deferred=True)
 
     users: Mapped[list[CompanyUser]] = relationship(back_populates="company")
     verifications: Mapped[list[CompanyVerification]] = relationship(back_populates="company")
@@ -3,12 +3,24 @@ from __future__ import annotations
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Computed,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import JobPostStatus
-from app.models.base import BaseModel
+from app.models.base import Base, BaseModel
 
 
 class JobPost(BaseModel):
@@ -18,6 +30,14 @@ class JobPost(BaseModel):
         Index("ix_job_posts_location_code", "location_code"),
         Index("ix_job_posts_job_category", "job_category"),
         Index("ix_job_posts_company_id", "company_id"),
+        Index("ix_job_posts_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_job_posts_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        Index("ix_job_posts_search_keys", "search_keys", postgresql_using="gin"),
     )
 
     company_id: Mapped[uuid.UUID] = mapped_column(
@@ -56,11 +76,30 @@ class JobPost(BaseModel):
     # Denormalized counter
     view_count: Mapped[int] = mapped_column(Integer, default=0)
 
+    # Search document (title/body/department/specialty/company name),
+    # maintained by the service layer on write
+    search_text: Mapped[str | None] = mapped_column(Text, deferred=True)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(search_text, ''))", persisted=True),
+        deferred=True,
+    )
+    # Hangul bigram/chosung keys (app.core.hangul.index_keys)
+    search_keys: Mapped[list[str] | None] = mapped_column(ARRAY(Text), deferred=True)
+
     company: Mapped["Company"] = relationship(back_populates="job_posts")
     history: Mapped[list[JobPostHistory]] = relationship(back_populates="job_post")
     applications: Mapped[list] = relationship("Application", back_populates="job_post")
 
 
+# gin_trgm_ops requires pg_trgm (also created by the migration)
+event.listen(
+    JobPost.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
+
 class JobPostHistory(BaseModel):
     __tablename__ = "job_post_history"
     __table_args__ = (
@@ -75,3 +114,18 @@ class JobPostHistory(BaseModel):
     action: Mapped[str] = mapped_column(String(30))
 
     job_post: Mapped[JobPost] = relationship(back_populates="history")
+
+
+class JobDailyStat(Base):
+    """Daily engagement rollup per job (see app.services.job_stats)."""
+
+    __tablename__ = "job_daily_stats"
+
+    job_post_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("job_posts.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    views: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    unique_viewers: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    favorites: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    applications: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
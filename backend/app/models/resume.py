@@ -4,6 +4,7 @@ import uuid
 from datetime import date
 
 from sqlalchemy import Boolean, Date, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.enums import ResumeVisibility
@@ -15,6 +16,7 @@ class Resume(BaseModel):
     __table_args__ = (
         Index("ix_resumes_user_id", "user_id"),
         Index("ix_resumes_visibility_job", "visibility", "desired_job"),
+        Index("ix_resumes_search_keys", "search_keys", postgresql_using="gin"),
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -31,6 +33,8 @@ class Resume(BaseModel):
     desired_salary_min: Mapped[int | None] = mapped_column(Integer)
     summary: Mapped[str | None] = mapped_column(Text)
     is_experienced: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Hangul bigram/chosung keys of title/summary (app.core.hangul.index_keys)
+    search_keys: Mapped[list[str] | None] = mapped_column(ARRAY(Text), deferred=True)
 
     user: Mapped["User"] = relationship(back_populates="resumes")
     licenses: Mapped[list[ResumeLicense]] = relationship(
@@ -11,6 +11,13 @@ class AdminDashboard(BaseModel):
     today_applications: int = 0
 
 
+class SearchCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+    hit_ratio: float = 0.0
+
+
 class AdminLogRead(BaseModel):
     id: str
     admin_user_id: str
@@ -23,7 +30,9 @@ class AdminLogRead(BaseModel):
 
 class AdminLogListResponse(BaseModel):
     items: list[AdminLogRead]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 class JobModerationItem(BaseModel):
@@ -38,7 +47,9 @@ class JobModerationItem(BaseModel):
 
 class JobModerationListResponse(BaseModel):
     items: list[JobModerationItem]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 class UserAdminRead(BaseModel):
@@ -52,7 +63,9 @@ class UserAdminRead(BaseModel):
 
 class UserAdminListResponse(BaseModel):
     items: list[UserAdminRead]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 class UserStatusUpdate(BaseModel):
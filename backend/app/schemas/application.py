@@ -22,7 +22,9 @@ class ApplicationRead(BaseModel):
 
 class ApplicationListResponse(BaseModel):
     items: list[ApplicationRead]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 class StatusChangeRequest(BaseModel):
@@ -40,7 +40,9 @@ class OrderRead(BaseModel):
 
 class OrderListResponse(BaseModel):
     items: list[OrderRead]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 # --- Payment ---
@@ -58,7 +60,9 @@ class PaymentRead(BaseModel):
 
 class PaymentListResponse(BaseModel):
     items: list[PaymentRead]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 # --- Webhook ---
@@ -109,4 +113,6 @@ class InvoiceRead(BaseModel):
 
 class InvoiceListResponse(BaseModel):
     items: list[InvoiceRead]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
@@ -15,4 +15,6 @@ class FavoriteRead(BaseModel):
 
 class FavoriteListResponse(BaseModel):
     items: list[FavoriteRead]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
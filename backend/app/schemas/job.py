@@ -90,7 +90,38 @@ class JobListResponse(BaseModel):
     items: list[JobPostSummary]
     page: int
     size: int
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class JobFacetsResponse(BaseModel):
+    total: int = 0
+    location_code: list[FacetCount] = []
+    job_category: list[FacetCount] = []
+    shift_type: list[FacetCount] = []
+    employment_type: list[FacetCount] = []
+
+
+class JobDailyStatRead(BaseModel):
+    day: date
+    views: int = 0
+    unique_viewers: int = 0
+    favorites: int = 0
+    applications: int = 0
+
+
+class JobStatsResponse(BaseModel):
+    job_post_id: str
+    days: list[JobDailyStatRead]
+    views: int = 0
+    favorites: int = 0
+    applications: int = 0
 
 
 class JobSitemapEntry(BaseModel):
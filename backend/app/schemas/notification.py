@@ -16,3 +16,14 @@ class NotificationRead(BaseModel):
 class NotificationListResponse(BaseModel):
     items: list[NotificationRead]
     unread_count: int
+    has_more: bool = False
+    next_cursor: str | None = None
+
+
+class UnreadCountResponse(BaseModel):
+    unread_count: int
+
+
+class StreamTokenResponse(BaseModel):
+    token: str
+    expires_in: int  # seconds
@@ -24,7 +24,9 @@ class ReportRead(BaseModel):
 
 class ReportListResponse(BaseModel):
     items: list[ReportRead]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 class ReportProcess(BaseModel):
@@ -22,7 +22,9 @@ class TalentListResponse(BaseModel):
     items: list[TalentSummary]
     page: int
     size: int
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 # --- Scout ---
@@ -49,7 +51,9 @@ class ScoutRead(BaseModel):
 
 class ScoutListResponse(BaseModel):
     items: list[ScoutRead]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 class ScoutRespondRequest(BaseModel):
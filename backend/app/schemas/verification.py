@@ -22,7 +22,9 @@ class VerificationRead(BaseModel):
 
 class VerificationListResponse(BaseModel):
     items: list[VerificationRead]
-    total: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 class VerificationReview(BaseModel):
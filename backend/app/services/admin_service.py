@@ -5,6 +5,7 @@ from fastapi import HTTPException
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import principal_cache
 from app.core.enums import JobPostStatus, UserStatus, VerificationStatus
 from app.models.admin import AdminLog, Report
 from app.models.application import Application
@@ -17,6 +18,16 @@ from app.schemas.admin import (
     JobModerationItem,
     UserAdminRead,
 )
+from app.services import search_cache
+from app.services.counting import CountStrategy, count_total
+from app.services.pagination import SortKey, next_cursor, paginate, split_page
+
+MODERATION_SORT = [
+    SortKey(JobPost.published_at, desc=True, nulls_last=True),
+    SortKey(JobPost.id, desc=True),
+]
+USERS_SORT = [SortKey(User.created_at, desc=True), SortKey(User.id, desc=True)]
+ADMIN_LOGS_SORT = [SortKey(AdminLog.created_at, desc=True), SortKey(AdminLog.id, desc=True)]
 
 
 async def get_dashboard(db: AsyncSession) -> AdminDashboard:
@@ -77,6 +88,8 @@ async def list_jobs_for_moderation(
     status_filter: str | None = None,
     page: int = 1,
     size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> dict:
     """List jobs for admin moderation."""
     filters = []
@@ -92,18 +105,15 @@ async def list_jobs_for_moderation(
 
     where = and_(*filters) if filters else True
 
-    count_q = select(func.count()).select_from(JobPost).where(where)
-    total = (await db.execute(count_q)).scalar() or 0
-
-    q = (
-        select(JobPost)
-        .where(where)
-        .order_by(JobPost.published_at.desc().nullslast())
-        .offset((page - 1) * size)
-        .limit(size)
+    total = (
+        await count_total(db, JobPost, where, CountStrategy.ESTIMATED)
+        if include_total
+        else None
     )
+
+    q = paginate(select(JobPost).where(where), MODERATION_SORT, page, size, cursor)
     result = await db.execute(q)
-    jobs = result.scalars().all()
+    jobs, has_more = split_page(result.scalars().all(), size)
 
     # Fetch companies
     company_ids = list({j.company_id for j in jobs})
@@ -145,7 +155,12 @@ async def list_jobs_for_moderation(
         )
         for j in jobs
     ]
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor(MODERATION_SORT, jobs, has_more),
+    }
 
 
 async def blind_job(
@@ -179,6 +194,7 @@ async def blind_job(
         meta_json={"title": job.title, "reason": reason},
     )
     db.add(admin_log)
+    search_cache.invalidate_on_commit(db)
 
     return {"message": "블라인드 처리 완료", "job_id": str(job.id)}
 
@@ -212,6 +228,7 @@ async def unblind_job(
         meta_json={"title": job.title},
     )
     db.add(admin_log)
+    search_cache.invalidate_on_commit(db)
 
     return {"message": "블라인드 해제 완료", "job_id": str(job.id)}
 
@@ -226,6 +243,8 @@ async def list_users(
     keyword: str | None = None,
     page: int = 1,
     size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> dict:
     """List users for admin."""
     filters = []
@@ -238,18 +257,15 @@ async def list_users(
 
     where = and_(*filters) if filters else True
 
-    count_q = select(func.count()).select_from(User).where(where)
-    total = (await db.execute(count_q)).scalar() or 0
-
-    q = (
-        select(User)
-        .where(where)
-        .order_by(User.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
+    total = (
+        await count_total(db, User, where, CountStrategy.ESTIMATED)
+        if include_total
+        else None
     )
+
+    q = paginate(select(User).where(where), USERS_SORT, page, size, cursor)
     result = await db.execute(q)
-    users = result.scalars().all()
+    users, has_more = split_page(result.scalars().all(), size)
 
     items = [
         UserAdminRead(
@@ -262,7 +278,12 @@ async def list_users(
         )
         for u in users
     ]
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor(USERS_SORT, users, has_more),
+    }
 
 
 async def update_user_status(
@@ -280,6 +301,7 @@ async def update_user_status(
 
     old_status = target.status
     target.status = new_status
+    principal_cache.invalidate(db, target.id)
 
     admin_log = AdminLog(
         admin_user_id=admin_user.id,
@@ -308,20 +330,22 @@ async def update_user_status(
 
 
 async def list_admin_logs(
-    db: AsyncSession, page: int = 1, size: int = 50
+    db: AsyncSession,
+    page: int = 1,
+    size: int = 50,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> dict:
     """List admin action logs."""
-    count_q = select(func.count()).select_from(AdminLog)
-    total = (await db.execute(count_q)).scalar() or 0
-
-    q = (
-        select(AdminLog)
-        .order_by(AdminLog.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
+    total = (
+        await count_total(db, AdminLog, strategy=CountStrategy.ESTIMATED)
+        if include_total
+        else None
     )
+
+    q = paginate(select(AdminLog), ADMIN_LOGS_SORT, page, size, cursor)
     result = await db.execute(q)
-    logs = result.scalars().all()
+    logs, has_more = split_page(result.scalars().all(), size)
 
     items = [
         AdminLogRead(
@@ -335,4 +359,9 @@ async def list_admin_logs(
         )
         for log in logs
     ]
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor(ADMIN_LOGS_SORT, logs, has_more),
+    }
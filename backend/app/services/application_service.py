@@ -1,13 +1,15 @@
 import uuid
+from functools import partial
 
 from fastapi import HTTPException
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.enums import ApplicationStatus, JobPostStatus, Role
+from app.db.hooks import run_after_commit
 from app.models.application import Application, ApplicationNote, ApplicationStatusHistory
-from app.models.company import Company, CompanyUser
+from app.models.company import Company
 from app.models.job import JobPost
 from app.models.resume import Resume
 from app.models.user import User, UserProfile
@@ -18,7 +20,14 @@ from app.schemas.application import (
     ApplicationRead,
     StatusHistoryRead,
 )
-from app.services import notification_service
+from app.services import job_stats, notification_service
+from app.services.counting import CountStrategy, count_total
+from app.services.pagination import SortKey, next_cursor, paginate, split_page
+
+APPLICANTS_SORT = [
+    SortKey(Application.created_at, desc=True),
+    SortKey(Application.id, desc=True),
+]
 
 
 # --- Helpers ---
@@ -95,23 +104,23 @@ async def apply_to_job(
         changed_by=user.id,
     )
     db.add(history)
+    run_after_commit(
+        db,
+        f"job-stats:applications:{job_id}",
+        partial(job_stats.track_application, job_id),
+    )
 
     # Notify company users
-    co_result = await db.execute(
-        select(CompanyUser.user_id).where(CompanyUser.company_id == job.company_id)
+    notification_service.notify(
+        db,
+        "APPLICATION_RECEIVED",
+        payload={
+            "job_post_id": str(job_id),
+            "job_title": job.title,
+            "application_id": str(application.id),
+        },
+        company_id=job.company_id,
     )
-    company_user_ids = co_result.scalars().all()
-    for cu_id in company_user_ids:
-        await notification_service.create_notification(
-            db,
-            cu_id,
-            "APPLICATION_RECEIVED",
-            payload={
-                "job_post_id": str(job_id),
-                "job_title": job.title,
-                "application_id": str(application.id),
-            },
-        )
 
     # Get company name for response
     co = await db.execute(select(Company.name).where(Company.id == job.company_id))
@@ -218,30 +227,16 @@ async def get_my_application(
 # --- ATS (기업) ---
 
 
-async def _get_company_for_user(db: AsyncSession, user: User) -> Company:
-    result = await db.execute(
-        select(CompanyUser).where(CompanyUser.user_id == user.id)
-    )
-    cu = result.scalar_one_or_none()
-    if not cu:
-        raise HTTPException(status_code=403, detail="기업 계정이 아닙니다")
-    result = await db.execute(select(Company).where(Company.id == cu.company_id))
-    company = result.scalar_one_or_none()
-    if not company:
-        raise HTTPException(status_code=404, detail="기업 정보를 찾을 수 없습니다")
-    return company
-
-
 async def list_company_applicants(
     db: AsyncSession,
-    user: User,
+    company: Company,
     job_post_id: uuid.UUID | None = None,
     status: str | None = None,
     page: int = 1,
     size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> ApplicationListResponse:
-    company = await _get_company_for_user(db, user)
-
     # Get company's job IDs
     job_q = select(JobPost.id).where(JobPost.company_id == company.id)
     if job_post_id:
@@ -257,22 +252,23 @@ async def list_company_applicants(
         filters.append(Application.status == status)
 
     # Count
-    count_r = await db.execute(
-        select(func.count())
-        .select_from(Application)
-        .where(and_(*filters))
+    total = (
+        await count_total(db, Application, and_(*filters), CountStrategy.CACHED)
+        if include_total
+        else None
     )
-    total = count_r.scalar() or 0
 
     # Fetch
     result = await db.execute(
-        select(Application)
-        .where(and_(*filters))
-        .order_by(Application.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
+        paginate(
+            select(Application).where(and_(*filters)),
+            APPLICANTS_SORT,
+            page,
+            size,
+            cursor,
+        )
     )
-    apps = result.scalars().all()
+    apps, has_more = split_page(result.scalars().all(), size)
 
     # Get job titles
     job_ids = list({a.job_post_id for a in apps})
@@ -306,14 +302,17 @@ async def list_company_applicants(
         )
         for app in apps
     ]
-    return ApplicationListResponse(items=items, total=total)
+    return ApplicationListResponse(
+        items=items,
+        total=total,
+        has_more=has_more,
+        next_cursor=next_cursor(APPLICANTS_SORT, apps, has_more),
+    )
 
 
 async def get_applicant_detail(
-    db: AsyncSession, user: User, application_id: uuid.UUID
+    db: AsyncSession, company: Company, application_id: uuid.UUID
 ) -> ApplicationDetailRead:
-    company = await _get_company_for_user(db, user)
-
     result = await db.execute(
         select(Application)
         .options(
@@ -382,12 +381,11 @@ FINAL_STATUSES = {ApplicationStatus.HIRED.value, ApplicationStatus.REJECTED.valu
 async def change_applicant_status(
     db: AsyncSession,
     user: User,
+    company: Company,
     application_id: uuid.UUID,
     new_status: str,
     note: str | None = None,
 ) -> ApplicationDetailRead:
-    company = await _get_company_for_user(db, user)
-
     result = await db.execute(
         select(Application).where(Application.id == application_id)
     )
@@ -425,9 +423,8 @@ async def change_applicant_status(
     db.add(history)
 
     # Notify applicant
-    await notification_service.create_notification(
+    notification_service.notify(
         db,
-        app.applicant_user_id,
         "STATUS_CHANGED",
         payload={
             "application_id": str(app.id),
@@ -435,20 +432,20 @@ async def change_applicant_status(
             "from_status": old_status,
             "to_status": new_status,
         },
+        user_ids=[app.applicant_user_id],
     )
 
     await db.flush()
-    return await get_applicant_detail(db, user, application_id)
+    return await get_applicant_detail(db, company, application_id)
 
 
 async def add_applicant_note(
     db: AsyncSession,
     user: User,
+    company: Company,
     application_id: uuid.UUID,
     note_text: str,
 ) -> ApplicationNoteRead:
-    company = await _get_company_for_user(db, user)
-
     result = await db.execute(
         select(Application).where(Application.id == application_id)
     )
@@ -9,12 +9,13 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
 from app.models.company import Company, CompanyUser
 from app.models.user import User, UserProfile
 from app.schemas.auth import LoginRequest, SignupRequest
+from app.services import search_service
 
 
 async def signup(db: AsyncSession, data: SignupRequest) -> tuple[User, str, str]:
@@ -28,7 +29,7 @@ async def signup(db: AsyncSession, data: SignupRequest) -> tuple[User, str, str]
         type=data.type.value,
         email=data.email,
         phone=data.phone,
-        password_hash=hash_password(data.password),
+        password_hash=await hash_password_async(data.password),
         status=UserStatus.ACTIVE.value,
         role=role.value,
         agree_terms=data.agree_terms,
@@ -54,7 +55,11 @@ async def signup(db: AsyncSession, data: SignupRequest) -> tuple[User, str, str]
         if existing_co.scalar_one_or_none():
             raise HTTPException(status_code=409, detail="이미 등록된 사업자등록번호입니다")
 
-        company = Company(business_no=data.business_no, name=data.company_name)
+        company = Company(
+            business_no=data.business_no,
+            name=data.company_name,
+            name_keys=search_service.build_company_name_keys(data.company_name),
+        )
         db.add(company)
         await db.flush()
         company_user = CompanyUser(company_id=company.id, user_id=user.id, role="OWNER")
@@ -68,8 +73,14 @@ async def signup(db: AsyncSession, data: SignupRequest) -> tuple[User, str, str]
 async def login(db: AsyncSession, data: LoginRequest) -> tuple[User, str, str]:
     result = await db.execute(select(User).where(User.email == data.email))
     user = result.scalar_one_or_none()
-    if not user or not verify_password(data.password, user.password_hash):
+    if not user:
+        raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 올바르지 않습니다")
+    valid, new_hash = await verify_password_async(data.password, user.password_hash)
+    if not valid:
         raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 올바르지 않습니다")
+    if new_hash:
+        # Stored hash predates the current BCRYPT_ROUNDS; upgrade it in place
+        user.password_hash = new_hash
     if user.status != UserStatus.ACTIVE.value:
         raise HTTPException(status_code=403, detail="비활성 계정입니다")
 
@@ -2,13 +2,12 @@ import uuid
 from datetime import datetime, timezone
 
 from fastapi import HTTPException
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.enums import OrderStatus, PaymentStatus
-from app.models.company import Company, CompanyUser
+from app.models.company import Company
 from app.models.payment import Entitlement, Invoice, Order, Payment, Product
-from app.models.user import User
 from app.schemas.billing import (
     EntitlementRead,
     InvoiceRead,
@@ -16,21 +15,12 @@ from app.schemas.billing import (
     PaymentRead,
     ProductRead,
 )
+from app.services.counting import count_total
+from app.services.pagination import SortKey, next_cursor, paginate, split_page
 
-
-async def _get_company_for_user(db: AsyncSession, user: User) -> Company:
-    result = await db.execute(
-        select(CompanyUser).where(CompanyUser.user_id == user.id)
-    )
-    cu = result.scalar_one_or_none()
-    if not cu:
-        raise HTTPException(status_code=403, detail="기업 계정이 아닙니다")
-
-    result = await db.execute(select(Company).where(Company.id == cu.company_id))
-    company = result.scalar_one_or_none()
-    if not company:
-        raise HTTPException(status_code=404, detail="기업 정보를 찾을 수 없습니다")
-    return company
+ORDERS_SORT = [SortKey(Order.created_at, desc=True), SortKey(Order.id, desc=True)]
+PAYMENTS_SORT = [SortKey(Payment.created_at, desc=True), SortKey(Payment.id, desc=True)]
+INVOICES_SORT = [SortKey(Invoice.created_at, desc=True), SortKey(Invoice.id, desc=True)]
 
 
 # --- Products ---
@@ -61,11 +51,9 @@ async def list_products(db: AsyncSession) -> dict:
 
 
 async def create_order(
-    db: AsyncSession, user: User, product_id: str
+    db: AsyncSession, company: Company, product_id: str
 ) -> OrderRead:
     """Create an order for a product."""
-    company = await _get_company_for_user(db, user)
-
     result = await db.execute(
         select(Product).where(
             and_(Product.id == uuid.UUID(product_id), Product.active.is_(True))
@@ -104,25 +92,20 @@ async def create_order(
 
 
 async def list_orders(
-    db: AsyncSession, user: User, page: int = 1, size: int = 20
+    db: AsyncSession,
+    company: Company,
+    page: int = 1,
+    size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> dict:
     """List company orders."""
-    company = await _get_company_for_user(db, user)
+    where = Order.company_id == company.id
+    total = await count_total(db, Order, where) if include_total else None
 
-    count_q = (
-        select(func.count()).select_from(Order).where(Order.company_id == company.id)
-    )
-    total = (await db.execute(count_q)).scalar() or 0
-
-    q = (
-        select(Order)
-        .where(Order.company_id == company.id)
-        .order_by(Order.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
-    )
+    q = paginate(select(Order).where(where), ORDERS_SORT, page, size, cursor)
     result = await db.execute(q)
-    orders = result.scalars().all()
+    orders, has_more = split_page(result.scalars().all(), size)
 
     # Fetch product names
     product_ids = list({o.product_id for o in orders})
@@ -147,7 +130,12 @@ async def list_orders(
         )
         for o in orders
     ]
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor(ORDERS_SORT, orders, has_more),
+    }
 
 
 # --- Webhook (Idempotent) ---
@@ -288,30 +276,23 @@ async def _grant_entitlement(db: AsyncSession, order: Order) -> None:
 
 
 async def list_payments(
-    db: AsyncSession, user: User, page: int = 1, size: int = 20
+    db: AsyncSession,
+    company: Company,
+    page: int = 1,
+    size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> dict:
     """List company payment history."""
-    company = await _get_company_for_user(db, user)
-
     # Get all order IDs for this company
     order_ids_q = select(Order.id).where(Order.company_id == company.id)
 
-    count_q = (
-        select(func.count())
-        .select_from(Payment)
-        .where(Payment.order_id.in_(order_ids_q))
-    )
-    total = (await db.execute(count_q)).scalar() or 0
-
-    q = (
-        select(Payment)
-        .where(Payment.order_id.in_(order_ids_q))
-        .order_by(Payment.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
-    )
+    where = Payment.order_id.in_(order_ids_q)
+    total = await count_total(db, Payment, where) if include_total else None
+
+    q = paginate(select(Payment).where(where), PAYMENTS_SORT, page, size, cursor)
     result = await db.execute(q)
-    payments = result.scalars().all()
+    payments, has_more = split_page(result.scalars().all(), size)
 
     items = [
         PaymentRead(
@@ -325,16 +306,19 @@ async def list_payments(
         )
         for p in payments
     ]
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor(PAYMENTS_SORT, payments, has_more),
+    }
 
 
 # --- Entitlements ---
 
 
-async def list_entitlements(db: AsyncSession, user: User) -> dict:
+async def list_entitlements(db: AsyncSession, company: Company) -> dict:
     """List company entitlements."""
-    company = await _get_company_for_user(db, user)
-
     result = await db.execute(
         select(Entitlement)
         .where(Entitlement.company_id == company.id)
@@ -362,11 +346,9 @@ async def list_entitlements(db: AsyncSession, user: User) -> dict:
 
 
 async def request_invoice(
-    db: AsyncSession, user: User, order_id: str
+    db: AsyncSession, company: Company, order_id: str
 ) -> InvoiceRead:
     """Request a tax invoice for an order."""
-    company = await _get_company_for_user(db, user)
-
     # Verify order belongs to company
     result = await db.execute(
         select(Order).where(
@@ -416,27 +398,20 @@ async def request_invoice(
 
 
 async def list_invoices(
-    db: AsyncSession, user: User, page: int = 1, size: int = 20
+    db: AsyncSession,
+    company: Company,
+    page: int = 1,
+    size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> dict:
     """List company invoices."""
-    company = await _get_company_for_user(db, user)
+    where = Invoice.company_id == company.id
+    total = await count_total(db, Invoice, where) if include_total else None
 
-    count_q = (
-        select(func.count())
-        .select_from(Invoice)
-        .where(Invoice.company_id == company.id)
-    )
-    total = (await db.execute(count_q)).scalar() or 0
-
-    q = (
-        select(Invoice)
-        .where(Invoice.company_id == company.id)
-        .order_by(Invoice.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
-    )
+    q = paginate(select(Invoice).where(where), INVOICES_SORT, page, size, cursor)
     result = await db.execute(q)
-    invoices = result.scalars().all()
+    invoices, has_more = split_page(result.scalars().all(), size)
 
     items = [
         InvoiceRead(
@@ -450,4 +425,9 @@ async def list_invoices(
         )
         for inv in invoices
     ]
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor(INVOICES_SORT, invoices, has_more),
+    }
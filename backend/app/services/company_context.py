@@ -0,0 +1,95 @@
+"""
+Company membership of the current user.
+
+Resolved with one joined query, once per request, by the
+`app.core.deps.get_current_company` dependency, which hands the company
+to the biz services; optionally cached across requests in Redis for
+COMPANY_CONTEXT_CACHE_TTL_SECONDS. A cached company is a detached
+`Company` carrying its scalar columns only; companies are not edited
+after signup, so the TTL is the only expiry.
+"""
+
+import json
+import logging
+import uuid
+
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.metrics import cache_requests
+from app.core.redis import get_redis
+from app.models.company import Company, CompanyUser
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+CACHE_NAME = "company_context"
+KEY_PREFIX = "company_ctx:"
+FIELDS = ("business_no", "name", "type", "address", "status")
+
+
+async def _cached(user_id: uuid.UUID) -> Company | None:
+    if settings.COMPANY_CONTEXT_CACHE_TTL_SECONDS <= 0:
+        return None
+    try:
+        raw = await get_redis().get(f"{KEY_PREFIX}{user_id}")
+    except RedisError:
+        logger.warning("company context cache unavailable", exc_info=True)
+        cache_requests.inc(cache=CACHE_NAME, result="error")
+        return None
+    if raw is None:
+        cache_requests.inc(cache=CACHE_NAME, result="miss")
+        return None
+    cache_requests.inc(cache=CACHE_NAME, result="hit")
+    data = json.loads(raw)
+    return Company(id=uuid.UUID(data.pop("id")), **data)
+
+
+async def _store(user_id: uuid.UUID, company: Company) -> None:
+    if settings.COMPANY_CONTEXT_CACHE_TTL_SECONDS <= 0:
+        return
+    data = {"id": str(company.id), **{f: getattr(company, f) for f in FIELDS}}
+    try:
+        await get_redis().set(
+            f"{KEY_PREFIX}{user_id}",
+            json.dumps(data),
+            ex=settings.COMPANY_CONTEXT_CACHE_TTL_SECONDS,
+        )
+    except RedisError:
+        logger.warning("company context cache write failed", exc_info=True)
+
+
+async def _resolve(db: AsyncSession, user: User) -> tuple[bool, Company | None]:
+    """(is member, company) for `user`."""
+    company = await _cached(user.id)
+    if company is not None:
+        return True, company
+    result = await db.execute(
+        select(CompanyUser.id, Company)
+        .outerjoin(Company, Company.id == CompanyUser.company_id)
+        .where(CompanyUser.user_id == user.id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return False, None
+    if row[1] is not None:
+        await _store(user.id, row[1])
+    return True, row[1]
+
+
+async def find_company_for_user(db: AsyncSession, user: User) -> Company | None:
+    return (await _resolve(db, user))[1]
+
+
+async def get_company_for_user(db: AsyncSession, user: User) -> Company:
+    """Get the company associated with a user, or raise 403/404."""
+    is_member, company = await _resolve(db, user)
+    if not is_member:
+        raise HTTPException(status_code=403, detail="기업 계정이 아닙니다")
+    if company is None:
+        raise HTTPException(status_code=404, detail="기업 정보를 찾을 수 없습니다")
+    return company
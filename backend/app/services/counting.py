@@ -0,0 +1,124 @@
+"""
+List totals for the paginated services.
+
+A page no longer needs COUNT(*) to know whether more rows exist (`paginate`
+fetches `size + 1`), so the total is only computed when the caller asks
+for it, using one of:
+
+- EXACT: plain COUNT(*) with the list's WHERE.
+- CACHED: exact count cached in Redis per normalized filter for a short TTL.
+  Redis being unavailable falls back to EXACT.
+- ESTIMATED: the planner's row estimate (EXPLAIN) for large admin tables.
+  Small estimates are re-counted exactly, since they are cheap and the
+  planner is least accurate there.
+"""
+
+import enum
+import hashlib
+import json
+import logging
+from typing import Any
+
+from redis.exceptions import RedisError
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.metrics import cache_requests
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+COUNT_CACHE_PREFIX = "count:"
+
+
+class CountStrategy(str, enum.Enum):
+    EXACT = "EXACT"
+    CACHED = "CACHED"
+    ESTIMATED = "ESTIMATED"
+
+
+def _count_query(model: Any, where: ColumnElement[bool] | None):
+    q = select(func.count()).select_from(model)
+    return q.where(where) if where is not None else q
+
+
+def count_cache_key(model: Any, where: ColumnElement[bool] | None) -> str:
+    """Key derived from the compiled WHERE and its bound parameters."""
+    compiled = _count_query(model, where).compile(dialect=postgresql.dialect())
+    params = json.dumps(compiled.params, sort_keys=True, default=str)
+    digest = hashlib.sha1(f"{compiled}|{params}".encode()).hexdigest()
+    return f"{COUNT_CACHE_PREFIX}{model.__tablename__}:{digest}"
+
+
+async def count_exact(
+    db: AsyncSession, model: Any, where: ColumnElement[bool] | None = None
+) -> int:
+    result = await db.execute(_count_query(model, where))
+    return result.scalar() or 0
+
+
+async def count_cached(
+    db: AsyncSession,
+    model: Any,
+    where: ColumnElement[bool] | None = None,
+    ttl: int | None = None,
+) -> int:
+    key = count_cache_key(model, where)
+    redis = get_redis()
+    try:
+        cached = await redis.get(key)
+    except RedisError:
+        logger.warning("count cache unavailable, counting exactly", exc_info=True)
+        cache_requests.inc(cache="count", result="error")
+        return await count_exact(db, model, where)
+    if cached is not None:
+        cache_requests.inc(cache="count", result="hit")
+        return int(cached)
+    cache_requests.inc(cache="count", result="miss")
+
+    total = await count_exact(db, model, where)
+    try:
+        await redis.set(key, total, ex=ttl or settings.COUNT_CACHE_TTL_SECONDS)
+    except RedisError:
+        logger.warning("count cache write failed", exc_info=True)
+    return total
+
+
+async def count_estimated(
+    db: AsyncSession, model: Any, where: ColumnElement[bool] | None = None
+) -> int:
+    q = select(model.id)
+    if where is not None:
+        q = q.where(where)
+    conn = await db.connection()
+    compiled = q.compile(
+        dialect=conn.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    params = compiled.construct_params()
+    result = await conn.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}",
+        tuple(params[name] for name in compiled.positiontup),
+    )
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < settings.COUNT_ESTIMATE_THRESHOLD:
+        return await count_exact(db, model, where)
+    return estimate
+
+
+async def count_total(
+    db: AsyncSession,
+    model: Any,
+    where: ColumnElement[bool] | None = None,
+    strategy: CountStrategy = CountStrategy.EXACT,
+) -> int:
+    if strategy == CountStrategy.CACHED:
+        return await count_cached(db, model, where)
+    if strategy == CountStrategy.ESTIMATED:
+        return await count_estimated(db, model, where)
+    return await count_exact(db, model, where)
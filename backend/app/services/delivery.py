@@ -0,0 +1,49 @@
+"""
+Email and SMS delivery for the outbox worker.
+
+DELIVERY_BACKEND selects where messages go:
+
+- "console": logged on the `app.services.delivery` logger (the default;
+  nothing leaves the machine);
+- "smtp": email goes to SMTP_HOST:SMTP_PORT without auth or TLS. Locally
+  that is the Mailpit container from docker-compose.yml, whose web UI on
+  :8025 shows every message. SMS has no provider yet and is logged.
+
+Failures raise, so the outbox retries the delivery.
+"""
+
+import asyncio
+import logging
+import smtplib
+from email.message import EmailMessage
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+SMTP_TIMEOUT_SECONDS = 10
+
+
+def _send_smtp(message: EmailMessage) -> None:
+    with smtplib.SMTP(
+        settings.SMTP_HOST, settings.SMTP_PORT, timeout=SMTP_TIMEOUT_SECONDS
+    ) as smtp:
+        smtp.send_message(message)
+
+
+async def send_email(to: str, subject: str, body: str) -> None:
+    if settings.DELIVERY_BACKEND != "smtp":
+        logger.info("email to %s: %s | %s", to, subject, body)
+        return
+    message = EmailMessage()
+    message["From"] = settings.SMTP_FROM
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+    # smtplib blocks; keep it off the worker's event loop
+    await asyncio.to_thread(_send_smtp, message)
+
+
+async def send_sms(to: str, body: str) -> None:
+    logger.info("sms to %s: %s", to, body)
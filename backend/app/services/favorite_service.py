@@ -1,34 +1,36 @@
 import uuid
+from functools import partial
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.hooks import run_after_commit
 from app.models.company import Company
 from app.models.interaction import Favorite
 from app.models.job import JobPost
 from app.models.user import User
 from app.schemas.favorite import FavoriteRead
+from app.services import job_stats
+from app.services.counting import count_total
+from app.services.pagination import SortKey, next_cursor, paginate, split_page
+
+FAVORITES_SORT = [SortKey(Favorite.created_at, desc=True), SortKey(Favorite.id, desc=True)]
 
 
 async def list_favorites(
-    db: AsyncSession, user: User, page: int = 1, size: int = 20
+    db: AsyncSession,
+    user: User,
+    page: int = 1,
+    size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> dict:
-    count_q = (
-        select(func.count())
-        .select_from(Favorite)
-        .where(Favorite.user_id == user.id)
-    )
-    total = (await db.execute(count_q)).scalar() or 0
-
-    q = (
-        select(Favorite)
-        .where(Favorite.user_id == user.id)
-        .order_by(Favorite.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
-    )
+    where = Favorite.user_id == user.id
+    total = await count_total(db, Favorite, where) if include_total else None
+
+    q = paginate(select(Favorite).where(where), FAVORITES_SORT, page, size, cursor)
     result = await db.execute(q)
-    favorites = result.scalars().all()
+    favorites, has_more = split_page(result.scalars().all(), size)
 
     items = []
     for fav in favorites:
@@ -56,7 +58,12 @@ async def list_favorites(
             )
         )
 
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor(FAVORITES_SORT, favorites, has_more),
+    }
 
 
 async def toggle_favorite(
@@ -80,6 +87,11 @@ async def toggle_favorite(
     else:
         new_fav = Favorite(user_id=user.id, job_post_id=jp_id)
         db.add(new_fav)
+        run_after_commit(
+            db,
+            f"job-stats:favorites:{jp_id}",
+            partial(job_stats.track_favorite, jp_id),
+        )
         return {"favorited": True}
 
 
@@ -2,37 +2,41 @@ import uuid
 from datetime import datetime, timezone
 
 from fastapi import HTTPException
-from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy import ColumnElement, Select, and_, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.enums import JobPostStatus, Role, VerificationStatus
-from app.models.company import Company, CompanyUser, CompanyVerification
+from app.models.company import Company, CompanyVerification
 from app.models.job import JobPost, JobPostHistory
 from app.models.user import User
 from app.schemas.job import (
+    FacetCount,
+    JobDailyStatRead,
+    JobFacetsResponse,
     JobListResponse,
     JobPostCreate,
     JobPostRead,
     JobPostSummary,
     JobPostUpdate,
+    JobStatsResponse,
 )
+from app.services import job_stats, search_cache, search_service
+from app.services.counting import CountStrategy, count_total
+from app.services.pagination import SortKey, next_cursor, paginate, split_page
 
+# Fields that make up JobPost.search_text
+SEARCH_FIELDS = {"title", "body", "department", "specialty"}
 
-async def _get_company_for_user(db: AsyncSession, user: User) -> Company:
-    """Get the company associated with a user, or raise 403."""
-    result = await db.execute(
-        select(CompanyUser).where(CompanyUser.user_id == user.id)
-    )
-    cu = result.scalar_one_or_none()
-    if not cu:
-        raise HTTPException(status_code=403, detail="기업 계정이 아닙니다")
+COMPANY_JOBS_SORT = [SortKey(JobPost.created_at, desc=True), SortKey(JobPost.id, desc=True)]
 
-    result = await db.execute(select(Company).where(Company.id == cu.company_id))
-    company = result.scalar_one_or_none()
-    if not company:
-        raise HTTPException(status_code=404, detail="기업 정보를 찾을 수 없습니다")
-    return company
+# Keyset sort keys per search sort option (id is the tie-breaker)
+SEARCH_SORT_KEYS = {
+    "SALARY_DESC": [SortKey(JobPost.salary_max, desc=True, nulls_last=True), SortKey(JobPost.id)],
+    "CLOSING_SOON": [SortKey(JobPost.close_at, nulls_last=True), SortKey(JobPost.id)],
+    "VIEWS": [SortKey(JobPost.view_count, desc=True), SortKey(JobPost.id)],
+    "LATEST": [SortKey(JobPost.published_at, desc=True, nulls_last=True), SortKey(JobPost.id)],
+}
 
 
 async def _check_verified(db: AsyncSession, company_id: uuid.UUID) -> bool:
@@ -69,6 +73,37 @@ def _job_to_summary(job: JobPost, company: Company | None = None) -> JobPostSumm
     )
 
 
+# Columns JobPostSummary needs; keeps body/contact/search fields off the wire
+SUMMARY_COLUMNS = (
+    JobPost.id,
+    JobPost.status,
+    JobPost.title,
+    JobPost.job_category,
+    JobPost.employment_type,
+    JobPost.shift_type,
+    JobPost.salary_type,
+    JobPost.salary_min,
+    JobPost.salary_max,
+    JobPost.location_code,
+    JobPost.location_detail,
+    JobPost.close_at,
+    JobPost.published_at,
+    JobPost.view_count,
+)
+
+
+def _summary_select() -> Select:
+    return select(
+        *SUMMARY_COLUMNS,
+        Company.name.label("company_name"),
+        Company.type.label("company_type"),
+    ).outerjoin(Company, Company.id == JobPost.company_id)
+
+
+def _row_to_summary(row) -> JobPostSummary:
+    return JobPostSummary(**{**row._mapping, "id": str(row.id)})
+
+
 def _job_to_read(job: JobPost, company: Company | None = None) -> JobPostRead:
     return JobPostRead(
         id=str(job.id),
@@ -118,10 +153,8 @@ async def _record_history(
 
 
 async def create_job(
-    db: AsyncSession, user: User, data: JobPostCreate
+    db: AsyncSession, user: User, company: Company, data: JobPostCreate
 ) -> JobPostRead:
-    company = await _get_company_for_user(db, user)
-
     job = JobPost(
         company_id=company.id,
         status=JobPostStatus.DRAFT.value,
@@ -141,6 +174,8 @@ async def create_job(
         contact_visible=data.contact_visible,
         close_at=data.close_at,
     )
+    job.search_text = search_service.build_job_search_text(job, company.name)
+    job.search_keys = search_service.build_job_search_keys(job)
     db.add(job)
     await db.flush()
 
@@ -150,10 +185,12 @@ async def create_job(
 
 
 async def update_job(
-    db: AsyncSession, user: User, job_id: uuid.UUID, data: JobPostUpdate
+    db: AsyncSession,
+    user: User,
+    company: Company,
+    job_id: uuid.UUID,
+    data: JobPostUpdate,
 ) -> JobPostRead:
-    company = await _get_company_for_user(db, user)
-
     result = await db.execute(select(JobPost).where(JobPost.id == job_id))
     job = result.scalar_one_or_none()
     if not job:
@@ -171,17 +208,21 @@ async def update_job(
             diff[field] = {"from": str(old_value), "to": str(value)}
             setattr(job, field, value)
 
+    if SEARCH_FIELDS & diff.keys():
+        job.search_text = search_service.build_job_search_text(job, company.name)
+        job.search_keys = search_service.build_job_search_keys(job)
+
     if diff:
         await _record_history(db, job.id, "UPDATE", user.id, diff)
+        if job.status == JobPostStatus.PUBLISHED.value:
+            search_cache.invalidate_on_commit(db)
 
     return _job_to_read(job, company)
 
 
 async def publish_job(
-    db: AsyncSession, user: User, job_id: uuid.UUID
+    db: AsyncSession, user: User, company: Company, job_id: uuid.UUID
 ) -> JobPostRead:
-    company = await _get_company_for_user(db, user)
-
     result = await db.execute(select(JobPost).where(JobPost.id == job_id))
     job = result.scalar_one_or_none()
     if not job:
@@ -222,15 +263,14 @@ async def publish_job(
     job.published_at = datetime.now(timezone.utc)
 
     await _record_history(db, job.id, "PUBLISH", user.id)
+    search_cache.invalidate_on_commit(db)
 
     return _job_to_read(job, company)
 
 
 async def close_job(
-    db: AsyncSession, user: User, job_id: uuid.UUID
+    db: AsyncSession, user: User, company: Company, job_id: uuid.UUID
 ) -> JobPostRead:
-    company = await _get_company_for_user(db, user)
-
     result = await db.execute(select(JobPost).where(JobPost.id == job_id))
     job = result.scalar_one_or_none()
     if not job:
@@ -245,37 +285,91 @@ async def close_job(
     job.status = JobPostStatus.CLOSED.value
 
     await _record_history(db, job.id, "CLOSE", user.id)
+    search_cache.invalidate_on_commit(db)
 
     return _job_to_read(job, company)
 
 
 async def get_company_jobs(
-    db: AsyncSession, user: User, page: int = 1, size: int = 20
+    db: AsyncSession,
+    company: Company,
+    page: int = 1,
+    size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> JobListResponse:
-    company = await _get_company_for_user(db, user)
+    where = JobPost.company_id == company.id
+    total = await count_total(db, JobPost, where) if include_total else None
 
-    count_q = select(func.count()).select_from(JobPost).where(
-        JobPost.company_id == company.id
-    )
-    total_result = await db.execute(count_q)
-    total = total_result.scalar() or 0
-
-    q = (
-        select(JobPost)
-        .where(JobPost.company_id == company.id)
-        .order_by(JobPost.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
-    )
+    q = paginate(select(JobPost).where(where), COMPANY_JOBS_SORT, page, size, cursor)
     result = await db.execute(q)
-    jobs = result.scalars().all()
+    jobs, has_more = split_page(result.scalars().all(), size)
 
     items = [_job_to_summary(j, company) for j in jobs]
-    return JobListResponse(items=items, page=page, size=size, total=total)
+    return JobListResponse(
+        items=items,
+        page=page,
+        size=size,
+        total=total,
+        has_more=has_more,
+        next_cursor=next_cursor(COMPANY_JOBS_SORT, jobs, has_more),
+    )
+
+
+async def get_company_job_stats(
+    db: AsyncSession, company: Company, job_id: uuid.UUID, days: int = 30
+) -> JobStatsResponse:
+    """Daily views, unique viewers, favorites and applications for a job."""
+    result = await db.execute(select(JobPost.company_id).where(JobPost.id == job_id))
+    owner_id = result.scalar_one_or_none()
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail="공고를 찾을 수 없습니다")
+    if owner_id != company.id:
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
+
+    stats = await job_stats.get_daily_stats(db, job_id, days)
+    # Unique viewers are per day: HLL sketches are not kept long enough to merge
+    return JobStatsResponse(
+        job_post_id=str(job_id),
+        days=[JobDailyStatRead.model_validate(s, from_attributes=True) for s in stats],
+        views=sum(s.views for s in stats),
+        favorites=sum(s.favorites for s in stats),
+        applications=sum(s.applications for s in stats),
+    )
 
 
 # --- Public Search ---
 
+# Filterable columns that also get per-value facet counts
+FACET_COLUMNS = {
+    "location_code": JobPost.location_code,
+    "job_category": JobPost.job_category,
+    "shift_type": JobPost.shift_type,
+    "employment_type": JobPost.employment_type,
+}
+
+
+def _search_filters(
+    keyword: str | None, salary_min: int | None, **facets: str | None
+) -> tuple[list[ColumnElement[bool]], dict[str, ColumnElement[bool]]]:
+    """Public search conditions: (shared filters, active facet filters by name)."""
+    filters = [JobPost.status == JobPostStatus.PUBLISHED.value]
+
+    if keyword:
+        filters.append(search_service.job_keyword_condition(keyword))
+    if salary_min is not None:
+        filters.append(
+            or_(
+                JobPost.salary_min >= salary_min,
+                JobPost.salary_min.is_(None),
+            )
+        )
+
+    facet_filters = {
+        name: FACET_COLUMNS[name] == value for name, value in facets.items() if value
+    }
+    return filters, facet_filters
+
 
 async def search_jobs(
     db: AsyncSession,
@@ -288,74 +382,153 @@ async def search_jobs(
     sort: str = "LATEST",
     page: int = 1,
     size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> JobListResponse:
-    base_filter = JobPost.status == JobPostStatus.PUBLISHED.value
+    cache_key = None
+    if search_cache.is_cacheable(page, cursor):
+        cached, cache_key = await search_cache.get(
+            JobListResponse,
+            search_cache.normalize_filters(
+                keyword=keyword,
+                location_code=location_code,
+                job_category=job_category,
+                shift_type=shift_type,
+                employment_type=employment_type,
+                salary_min=salary_min,
+                sort=sort,
+                page=page,
+                size=size,
+                include_total=include_total,
+            ),
+        )
+        if cached is not None:
+            return cached
+
+    filters, facet_filters = _search_filters(
+        keyword,
+        salary_min,
+        location_code=location_code,
+        job_category=job_category,
+        shift_type=shift_type,
+        employment_type=employment_type,
+    )
+    where_clause = and_(*filters, *facet_filters.values())
 
-    filters = [base_filter]
+    # Count (public hot path: cached per filter)
+    total = (
+        await count_total(db, JobPost, where_clause, CountStrategy.CACHED)
+        if include_total
+        else None
+    )
 
-    if keyword:
-        kw = f"%{keyword}%"
-        filters.append(
-            or_(
-                JobPost.title.ilike(kw),
-                JobPost.body.ilike(kw),
+    # Sort
+    sort_keys = None
+    if sort == "RELEVANCE" and keyword:
+        # Computed score: page-based only
+        if cursor:
+            raise HTTPException(
+                status_code=400, detail="정확도순 정렬은 커서 페이지네이션을 지원하지 않습니다"
             )
+        q = (
+            _summary_select()
+            .where(where_clause)
+            .order_by(search_service.job_relevance_score(keyword).desc(), JobPost.id)
+            .offset((page - 1) * size)
+            .limit(size + 1)
         )
-    if location_code:
-        filters.append(JobPost.location_code == location_code)
-    if job_category:
-        filters.append(JobPost.job_category == job_category)
-    if shift_type:
-        filters.append(JobPost.shift_type == shift_type)
-    if employment_type:
-        filters.append(JobPost.employment_type == employment_type)
-    if salary_min is not None:
-        filters.append(
-            or_(
-                JobPost.salary_min >= salary_min,
-                JobPost.salary_min.is_(None),
-            )
+    else:  # unknown sort or RELEVANCE without keyword -> LATEST
+        sort_keys = SEARCH_SORT_KEYS.get(sort, SEARCH_SORT_KEYS["LATEST"])
+        q = paginate(
+            _summary_select().where(where_clause), sort_keys, page, size, cursor
         )
 
-    where_clause = and_(*filters)
+    # Single statement: summary columns + company name/type, no detail fields
+    result = await db.execute(q)
+    jobs, has_more = split_page(result.all(), size)
+
+    items = [_row_to_summary(row) for row in jobs]
+    response = JobListResponse(
+        items=items,
+        page=page,
+        size=size,
+        total=total,
+        has_more=has_more,
+        next_cursor=next_cursor(sort_keys, jobs, has_more) if sort_keys else None,
+    )
+    if cache_key:
+        await search_cache.put(cache_key, response)
+    return response
+
+
+async def search_job_facets(
+    db: AsyncSession,
+    keyword: str | None = None,
+    location_code: str | None = None,
+    job_category: str | None = None,
+    shift_type: str | None = None,
+    employment_type: str | None = None,
+    salary_min: int | None = None,
+) -> JobFacetsResponse:
+    """Per-value counts for each facet column in one GROUPING SETS pass.
+
+    Each facet is counted with every active filter except its own, so the
+    other values of a selected facet keep their counts; `total` applies all
+    filters.
+    """
+    facets = {
+        "location_code": location_code,
+        "job_category": job_category,
+        "shift_type": shift_type,
+        "employment_type": employment_type,
+    }
+    cached, cache_key = await search_cache.get(
+        JobFacetsResponse,
+        search_cache.normalize_filters(keyword=keyword, salary_min=salary_min, **facets),
+    )
+    if cached is not None:
+        return cached
 
-    # Count
-    count_q = select(func.count()).select_from(JobPost).where(where_clause)
-    total_result = await db.execute(count_q)
-    total = total_result.scalar() or 0
+    filters, facet_filters = _search_filters(keyword, salary_min, **facets)
 
-    # Sort
-    if sort == "SALARY_DESC":
-        order = JobPost.salary_max.desc().nullslast()
-    elif sort == "CLOSING_SOON":
-        order = JobPost.close_at.asc().nullslast()
-    elif sort == "VIEWS":
-        order = JobPost.view_count.desc()
-    else:  # LATEST
-        order = JobPost.published_at.desc().nullslast()
+    def _count_without(name: str | None):
+        others = [cond for other, cond in facet_filters.items() if other != name]
+        return func.count().filter(and_(*others)) if others else func.count()
 
+    columns = list(FACET_COLUMNS.values())
     q = (
-        select(JobPost)
-        .where(where_clause)
-        .order_by(order, JobPost.id)
-        .offset((page - 1) * size)
-        .limit(size)
+        select(
+            *columns,
+            *[func.grouping(col) for col in columns],
+            *[_count_without(name) for name in FACET_COLUMNS],
+            _count_without(None),
+        )
+        .where(*filters)
+        .group_by(
+            func.grouping_sets(*[tuple_(col) for col in columns], tuple_())
+        )
     )
     result = await db.execute(q)
-    jobs = result.scalars().all()
-
-    # Fetch companies for the jobs
-    company_ids = list({j.company_id for j in jobs})
-    companies_map: dict[uuid.UUID, Company] = {}
-    if company_ids:
-        co_result = await db.execute(
-            select(Company).where(Company.id.in_(company_ids))
-        )
-        for co in co_result.scalars().all():
-            companies_map[co.id] = co
 
-    items = [_job_to_summary(j, companies_map.get(j.company_id)) for j in jobs]
-    return JobListResponse(items=items, page=page, size=size, total=total)
+    n = len(columns)
+    response = JobFacetsResponse()
+    for row in result.all():
+        values, grouping, counts = row[:n], row[n : 2 * n], row[2 * n :]
+        if all(grouping):  # grand total set: ()
+            response.total = counts[n]
+            continue
+        i = grouping.index(0)
+        if values[i] is not None and counts[i]:
+            getattr(response, columns[i].key).append(
+                FacetCount(value=values[i], count=counts[i])
+            )
+
+    for name in FACET_COLUMNS:
+        getattr(response, name).sort(key=lambda f: (-f.count, f.value))
+
+    if cache_key:
+        await search_cache.put(cache_key, response)
+    return response
 
 
 async def get_job_detail(
@@ -374,7 +547,5 @@ async def get_job_detail(
     co_result = await db.execute(select(Company).where(Company.id == job.company_id))
     company = co_result.scalar_one_or_none()
 
-    # Increment view count
-    job.view_count += 1
-
+    # Views are counted by view_counter, outside this transaction
     return _job_to_read(job, company)
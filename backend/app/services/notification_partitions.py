@@ -0,0 +1,161 @@
+"""
+Monthly partitions and retention for `notifications`.
+
+The table is range partitioned on created_at, one partition per calendar
+month (UTC) named notifications_pYYYYMM. Inserts fail if their month has no
+partition, so `ensure_partitions` keeps the current month and the next
+NOTIFICATION_PARTITIONS_AHEAD months created.
+
+Partitions that ended more than NOTIFICATION_RETENTION_MONTHS ago are
+archived by `archive_expired` once every row in them has been read:
+
+1. the partition is detached, so the table and its indexes stop carrying it;
+2. its rows are copied (CSV with header, gzip) to
+   NOTIFICATION_ARCHIVE_DIR/notifications_pYYYYMM.csv.gz, written under a
+   temporary name and renamed once complete;
+3. the detached table is dropped.
+
+A partition still holding unread notifications stays attached and is
+checked again on every run. A run interrupted after step 1 leaves a
+detached table behind; the next run archives it first. The outbox worker
+calls `maintain` at start and daily, under an advisory lock so only one
+worker does it.
+"""
+
+import gzip
+import logging
+import os
+import re
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import get_settings
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+PARTITION_PREFIX = "notifications_p"
+_PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{4}})(\d{{2}})$")
+MAINTENANCE_LOCK_KEY = 0x6E6F7469  # pg advisory lock id ("noti")
+
+PARTITIONS_SQL = text(
+    """
+    SELECT c.relname, i.inhrelid IS NOT NULL AS attached
+    FROM pg_class c
+    LEFT JOIN pg_inherits i
+        ON i.inhrelid = c.oid AND i.inhparent = 'notifications'::regclass
+    WHERE c.relkind = 'r' AND c.relname ~ '^notifications_p[0-9]{6}$'
+    ORDER BY c.relname
+    """
+)
+
+
+def month_start(moment: datetime | date) -> date:
+    return date(moment.year, moment.month, 1)
+
+
+def add_months(month: date, n: int) -> date:
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def partition_month(name: str) -> date | None:
+    match = _PARTITION_NAME.match(name)
+    return date(int(match[1]), int(match[2]), 1) if match else None
+
+
+def retention_cutoff(now: datetime) -> date:
+    """Partitions ending on or before this month's start are expired."""
+    return add_months(month_start(now), -settings.NOTIFICATION_RETENTION_MONTHS)
+
+
+async def ensure_partitions(
+    conn: AsyncConnection, now: datetime | None = None, months_back: int = 0
+) -> None:
+    """Create missing partitions from `months_back` months ago to the ones ahead."""
+    current = month_start(now or datetime.now(timezone.utc))
+    for offset in range(-months_back, settings.NOTIFICATION_PARTITIONS_AHEAD + 1):
+        start = add_months(current, offset)
+        end = add_months(start, 1)
+        await conn.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{partition_name(start)}" '
+                f"PARTITION OF notifications "
+                f"FOR VALUES FROM ('{start} 00:00+00') TO ('{end} 00:00+00')"
+            )
+        )
+
+
+async def _detach_if_read(name: str) -> bool:
+    """Detach `name` unless it still holds unread notifications."""
+    async with engine.begin() as conn:
+        unread = await conn.scalar(
+            text(f'SELECT count(*) FROM "{name}" WHERE read_at IS NULL')
+        )
+        if unread:
+            logger.info("keeping %s: %d notifications still unread", name, unread)
+            return False
+        await conn.execute(text(f'ALTER TABLE notifications DETACH PARTITION "{name}"'))
+    return True
+
+
+async def _archive(name: str) -> Path:
+    directory = Path(settings.NOTIFICATION_ARCHIVE_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.csv.gz"
+    partial = directory / f"{name}.csv.gz.partial"
+
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        with gzip.open(partial, "wb") as out:
+            status = await raw.driver_connection.copy_from_table(
+                name, output=out, format="csv", header=True
+            )
+        os.replace(partial, path)
+        await conn.execute(text(f'DROP TABLE "{name}"'))
+        await conn.commit()
+    logger.info("archived %s to %s (%s)", name, path, status)
+    return path
+
+
+async def archive_expired(now: datetime | None = None) -> list[Path]:
+    """Archive and drop partitions past retention; returns the archive files."""
+    cutoff = retention_cutoff(now or datetime.now(timezone.utc))
+    async with engine.connect() as conn:
+        partitions = (await conn.execute(PARTITIONS_SQL)).all()
+
+    detached = [name for name, attached in partitions if not attached]
+    for name, attached in partitions:
+        month = partition_month(name)
+        if attached and month is not None and add_months(month, 1) <= cutoff:
+            if await _detach_if_read(name):
+                detached.append(name)
+    return [await _archive(name) for name in detached]
+
+
+async def maintain(now: datetime | None = None) -> None:
+    """Create upcoming partitions and archive expired ones (one worker at a time)."""
+    async with engine.connect() as lock:
+        locked = await lock.scalar(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+        )
+        await lock.commit()
+        if not locked:
+            return
+        try:
+            async with engine.begin() as conn:
+                await ensure_partitions(conn, now)
+            await archive_expired(now)
+        finally:
+            await lock.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+            )
+            await lock.commit()
@@ -1,72 +1,216 @@
+"""
+Notifications.
+
+Services call `notify`, which costs the request one outbox insert. The
+outbox worker then writes the IN_APP rows for every recipient (in one
+statement, see `create_notifications`) and queues one delivery event per
+recipient and channel in DELIVERY_CHANNELS, each retried on its own:
+EMAIL and SMS through app.services.delivery, PUSH as a `push` event on the
+recipient's live stream. New IN_APP rows are published to the live stream
+(app.services.notification_stream) once they commit.
+"""
+
+import json
+import logging
 import uuid
+from functools import partial
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
 from fastapi import HTTPException
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
+from app.core.enums import NotificationChannel, UserStatus
+from app.models.company import CompanyUser
 from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.notification import NotificationListResponse, NotificationRead
+from app.db.hooks import run_after_commit
+from app.services import delivery, notification_stream, outbox, unread_counter
+from app.services.pagination import SortKey, next_cursor, paginate, split_page
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+FAN_OUT_TOPIC = "notification.fan_out"
+DELIVER_TOPIC = "notification.deliver"
+
+COPY_COLUMNS = ("id", "user_id", "type", "channel", "payload_json", "status")
+
+# Channels besides IN_APP per notification type
+DELIVERY_CHANNELS: dict[str, tuple[NotificationChannel, ...]] = {
+    "APPLICATION_RECEIVED": (NotificationChannel.EMAIL,),
+    "STATUS_CHANGED": (NotificationChannel.EMAIL, NotificationChannel.PUSH),
+    "SCOUT_RECEIVED": (
+        NotificationChannel.EMAIL,
+        NotificationChannel.SMS,
+        NotificationChannel.PUSH,
+    ),
+    "SCOUT_RESPONDED": (NotificationChannel.EMAIL,),
+}
+
+# (subject, body) formatted with the notification payload
+MESSAGES: dict[str, tuple[str, str]] = {
+    "APPLICATION_RECEIVED": (
+        "새 지원서가 접수되었습니다",
+        "'{job_title}' 공고에 새 지원서가 접수되었습니다.",
+    ),
+    "STATUS_CHANGED": (
+        "지원 상태가 변경되었습니다",
+        "지원하신 공고의 진행 상태가 {to_status}(으)로 변경되었습니다.",
+    ),
+    "SCOUT_RECEIVED": (
+        "스카우트 제안이 도착했습니다",
+        "{company_name}에서 스카우트 제안을 보냈습니다.",
+    ),
+    "SCOUT_RESPONDED": (
+        "스카우트 응답이 도착했습니다",
+        "보내신 스카우트 제안에 응답이 도착했습니다 ({status}).",
+    ),
+}
 
+NOTIFICATIONS_SORT = [
+    SortKey(Notification.created_at, desc=True),
+    SortKey(Notification.id, desc=True),
+]
 
-async def create_notification(
+
+def render_message(ntype: str, payload: dict | None) -> tuple[str, str]:
+    subject, body = MESSAGES.get(ntype, ("새 알림이 있습니다", "새 알림이 있습니다."))
+    try:
+        return subject, body.format(**(payload or {}))
+    except (KeyError, IndexError):
+        return subject, subject
+
+
+def notify(
     db: AsyncSession,
-    user_id: uuid.UUID,
     ntype: str,
     payload: dict | None = None,
-    channel: str = "IN_APP",
+    *,
+    user_ids: Iterable[uuid.UUID] = (),
+    company_id: uuid.UUID | None = None,
 ) -> None:
-    """Create an in-app notification for a user."""
-    notif = Notification(
-        user_id=user_id,
-        type=ntype,
-        channel=channel,
-        payload_json=payload,
-        status="UNREAD",
+    """Notify `user_ids` and every user of `company_id` after commit.
+
+    Only an outbox event is written here; recipients are resolved by the
+    worker.
+    """
+    outbox.enqueue(
+        db,
+        FAN_OUT_TOPIC,
+        {
+            "type": ntype,
+            "payload": payload,
+            "user_ids": [str(u) for u in user_ids],
+            "company_id": str(company_id) if company_id else None,
+        },
     )
-    db.add(notif)
 
 
-async def list_notifications(
-    db: AsyncSession, user: User, page: int = 1, size: int = 30
-) -> NotificationListResponse:
-    # Count unread
-    unread_result = await db.execute(
-        select(func.count())
-        .select_from(Notification)
-        .where(
-            and_(
-                Notification.user_id == user.id,
-                Notification.read_at.is_(None),
-            )
+async def _copy_notifications(db: AsyncSession, rows: list[dict]) -> None:
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        Notification.__tablename__,
+        columns=COPY_COLUMNS,
+        records=[tuple(row[column] for column in COPY_COLUMNS) for row in rows],
+    )
+
+
+async def create_notifications(
+    db: AsyncSession,
+    user_ids: Iterable[uuid.UUID],
+    ntype: str,
+    payload: dict | None = None,
+    channel: str = "IN_APP",
+) -> int:
+    """Create the same in-app notification for every user in one statement.
+
+    Small audiences get one multi-row INSERT; from NOTIFICATION_COPY_THRESHOLD
+    recipients up the rows are streamed with COPY on the session's
+    connection, so either way they commit with the caller's transaction;
+    after the commit they are published to the recipients' live streams.
+    Returns the number of notifications created.
+    """
+    recipients = list(dict.fromkeys(user_ids))
+    if not recipients:
+        return 0
+
+    use_copy = len(recipients) >= settings.NOTIFICATION_COPY_THRESHOLD
+    # COPY bypasses the column type, so JSONB goes in already encoded
+    body = json.dumps(payload) if use_copy and payload is not None else payload
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "type": ntype,
+            "channel": channel,
+            "payload_json": body,
+            "status": "UNREAD",
+        }
+        for user_id in recipients
+    ]
+    if use_copy:
+        await _copy_notifications(db, rows)
+    else:
+        await db.execute(insert(Notification).values(rows))
+    await unread_counter.adjust(db, recipients, 1)
+
+    now = datetime.now(timezone.utc)
+    messages = [
+        (
+            row["user_id"],
+            "notification",
+            NotificationRead(
+                id=str(row["id"]),
+                type=ntype,
+                channel=channel,
+                payload=payload,
+                status="UNREAD",
+                created_at=now,
+            ).model_dump(mode="json"),
         )
+        for row in rows
+    ]
+    run_after_commit(
+        db,
+        f"notification-publish:{rows[0]['id']}",
+        partial(notification_stream.publish_or_log, messages),
     )
-    unread_count = unread_result.scalar() or 0
+    return len(rows)
+
+
+async def list_notifications(
+    db: AsyncSession,
+    user: User,
+    page: int = 1,
+    size: int = 30,
+    cursor: str | None = None,
+) -> NotificationListResponse:
+    unread_count = await unread_counter.count(db, user.id)
 
     # Fetch notifications
     result = await db.execute(
-        select(Notification)
-        .where(Notification.user_id == user.id)
-        .order_by(Notification.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
-    )
-    notifs = result.scalars().all()
-
-    items = [
-        NotificationRead(
-            id=str(n.id),
-            type=n.type,
-            channel=n.channel,
-            payload=n.payload_json,
-            status="READ" if n.read_at else "UNREAD",
-            read_at=n.read_at,
-            created_at=n.created_at,
+        paginate(
+            select(Notification).where(Notification.user_id == user.id),
+            NOTIFICATIONS_SORT,
+            page,
+            size,
+            cursor,
         )
-        for n in notifs
-    ]
-    return NotificationListResponse(items=items, unread_count=unread_count)
+    )
+    notifs, has_more = split_page(result.scalars().all(), size)
+
+    items = [notification_stream.notification_read(n) for n in notifs]
+    return NotificationListResponse(
+        items=items,
+        unread_count=unread_count,
+        has_more=has_more,
+        next_cursor=next_cursor(NOTIFICATIONS_SORT, notifs, has_more),
+    )
 
 
 async def mark_read(
@@ -82,6 +226,7 @@ async def mark_read(
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
     if not notif.read_at:
         notif.read_at = datetime.now(timezone.utc)
+        await unread_counter.adjust(db, [user.id], -1)
 
 
 async def mark_all_read(db: AsyncSession, user: User) -> int:
@@ -95,4 +240,59 @@ async def mark_all_read(db: AsyncSession, user: User) -> int:
         )
         .values(read_at=datetime.now(timezone.utc))
     )
+    await unread_counter.adjust(db, [user.id], -result.rowcount)
     return result.rowcount
+
+
+@outbox.handler(FAN_OUT_TOPIC)
+async def _fan_out(db: AsyncSession, event: dict) -> None:
+    user_ids = [uuid.UUID(u) for u in event["user_ids"]]
+    if event["company_id"]:
+        result = await db.execute(
+            select(CompanyUser.user_id).where(
+                CompanyUser.company_id == uuid.UUID(event["company_id"])
+            )
+        )
+        user_ids.extend(result.scalars().all())
+    user_ids = list(dict.fromkeys(user_ids))
+
+    await create_notifications(db, user_ids, event["type"], event["payload"])
+    await outbox.enqueue_many(
+        db,
+        DELIVER_TOPIC,
+        [
+            {
+                "user_id": str(user_id),
+                "channel": channel.value,
+                "type": event["type"],
+                "payload": event["payload"],
+            }
+            for user_id in user_ids
+            for channel in DELIVERY_CHANNELS.get(event["type"], ())
+        ],
+    )
+
+
+@outbox.handler(DELIVER_TOPIC)
+async def _deliver(db: AsyncSession, event: dict) -> None:
+    user = await db.get(User, uuid.UUID(event["user_id"]))
+    if user is None or user.status != UserStatus.ACTIVE.value:
+        return
+    subject, body = render_message(event["type"], event["payload"])
+
+    channel = event["channel"]
+    if channel == NotificationChannel.EMAIL.value:
+        await delivery.send_email(user.email, subject, body)
+    elif channel == NotificationChannel.SMS.value:
+        if user.phone:
+            await delivery.send_sms(user.phone, body)
+    elif channel == NotificationChannel.PUSH.value:
+        data = {
+            "type": event["type"],
+            "title": subject,
+            "body": body,
+            "payload": event["payload"],
+        }
+        await notification_stream.publish([(user.id, "push", data)])
+    else:
+        logger.warning("unknown notification channel %s", channel)
@@ -0,0 +1,300 @@
+"""
+Live notification stream (GET /me/notifications/stream, server-sent events).
+
+Every notification is published on its recipient's Redis channel
+(`push_channel`) once the transaction that created it commits. Each worker
+holds a single pub/sub connection (`hub`) and hands messages to the
+streams of the users it serves, so open streams cost no database or
+pooled Redis connection of their own.
+
+Clients authenticate with a bearer token or, from EventSource (which cannot
+set headers), a short-lived `?token=` from POST
+/me/notifications/stream-token.
+
+A stream sends:
+
+- `event: notification` frames whose `id` is the notification id. A client
+  that reconnects with Last-Event-ID first gets what it missed (up to
+  NOTIFICATION_STREAM_RESUME_LIMIT, read from the database), then live
+  events;
+- `event: push` frames for PUSH deliveries (title/body for a desktop
+  notification);
+- a comment line every NOTIFICATION_STREAM_HEARTBEAT_SECONDS, so proxies
+  keep the connection open and dead clients are noticed.
+
+Live delivery is best effort: if a stream falls behind, or the pub/sub
+connection drops, the stream re-reads from the database after the last id
+it sent. Streams are capped at NOTIFICATION_STREAM_MAX_CONNECTIONS per
+worker and end when the worker shuts down; clients reconnect elsewhere.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator
+
+from redis.exceptions import RedisError
+from sqlalchemy import select, tuple_
+
+from app.core.config import get_settings
+from app.core.metrics import gauge
+from app.core.redis import get_redis
+from app.db.session import async_session
+from app.models.notification import Notification
+from app.schemas.notification import NotificationRead
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+QUEUE_SIZE = 100
+LISTEN_TIMEOUT_SECONDS = 1.0
+RECONNECT_DELAY_SECONDS = 1.0
+RECENT_IDS_KEPT = 200
+
+# Queue markers
+RESYNC = object()  # messages may have been lost; re-read from the database
+CLOSE = object()  # worker shutting down
+
+notification_streams = gauge(
+    "notification_streams_open", "Open notification streams in this worker."
+)
+
+
+def push_channel(user_id: uuid.UUID | str) -> str:
+    """Redis pub/sub channel carrying a user's live notifications."""
+    return f"notifications:{user_id}"
+
+
+def notification_read(n: Notification) -> NotificationRead:
+    return NotificationRead(
+        id=str(n.id),
+        type=n.type,
+        channel=n.channel,
+        payload=n.payload_json,
+        status="READ" if n.read_at else "UNREAD",
+        read_at=n.read_at,
+        created_at=n.created_at,
+    )
+
+
+async def publish(messages: list[tuple[uuid.UUID, str, dict]]) -> None:
+    """Publish (user_id, event, data) messages in one round trip."""
+    async with get_redis().pipeline(transaction=False) as pipe:
+        for user_id, event, data in messages:
+            pipe.publish(
+                push_channel(user_id), json.dumps({"event": event, "data": data})
+            )
+        await pipe.execute()
+
+
+async def publish_or_log(messages: list[tuple[uuid.UUID, str, dict]]) -> None:
+    """`publish` for after-commit hooks: failures only cost the live update."""
+    try:
+        await publish(messages)
+    except RedisError:
+        logger.warning("notification publish failed", exc_info=True)
+
+
+class NotificationHub:
+    """One pub/sub connection per worker, fanned out to local stream queues."""
+
+    def __init__(self):
+        self._queues: dict[str, set[asyncio.Queue]] = {}
+        self._pubsub = None
+        self._listener: asyncio.Task | None = None
+        self.closed = False
+
+    @property
+    def open_streams(self) -> int:
+        return sum(len(queues) for queues in self._queues.values())
+
+    def accepting(self) -> bool:
+        """Whether this worker takes another stream."""
+        return (
+            not self.closed
+            and self.open_streams < settings.NOTIFICATION_STREAM_MAX_CONNECTIONS
+        )
+
+    def subscribe(self, user_id: uuid.UUID) -> asyncio.Queue:
+        """Register a stream; `ensure_subscribed` then sends SUBSCRIBE if needed."""
+        queue: asyncio.Queue = asyncio.Queue(QUEUE_SIZE)
+        self._queues.setdefault(push_channel(user_id), set()).add(queue)
+        notification_streams.set(self.open_streams)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        return queue
+
+    async def ensure_subscribed(self, user_id: uuid.UUID) -> None:
+        channel = push_channel(user_id)
+        # Without a connection the listener subscribes on (re)connect
+        if self._pubsub is None or channel in self._pubsub.channels:
+            return
+        try:
+            await self._pubsub.subscribe(channel)
+        except RedisError:
+            # The listener reconnects, resubscribes and resyncs everyone
+            logger.warning("notification subscribe failed", exc_info=True)
+
+    async def unsubscribe(self, user_id: uuid.UUID, queue: asyncio.Queue) -> None:
+        channel = push_channel(user_id)
+        queues = self._queues.get(channel)
+        if queues is None:
+            return
+        queues.discard(queue)
+        notification_streams.set(self.open_streams)
+        if not queues:
+            del self._queues[channel]
+            if self._pubsub is not None:
+                try:
+                    await self._pubsub.unsubscribe(channel)
+                except RedisError:
+                    pass
+
+    def _put(self, queue: asyncio.Queue, item) -> None:
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # Slow consumer: drop the backlog, it re-reads from the database
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(CLOSE if item is CLOSE else RESYNC)
+
+    def _broadcast(self, item) -> None:
+        for queues in self._queues.values():
+            for queue in queues:
+                self._put(queue, item)
+
+    async def _reset(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except RedisError:
+                pass
+
+    async def _listen(self) -> None:
+        resync = False
+        while not self.closed:
+            try:
+                if self._pubsub is None:
+                    self._pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+                    if self._queues:
+                        await self._pubsub.subscribe(*self._queues)
+                    if resync:
+                        self._broadcast(RESYNC)
+                        resync = False
+                if not self._pubsub.subscribed:
+                    await asyncio.sleep(LISTEN_TIMEOUT_SECONDS)
+                    continue
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=LISTEN_TIMEOUT_SECONDS
+                )
+            except (RedisError, OSError):
+                logger.warning("notification pub/sub connection lost", exc_info=True)
+                await self._reset()
+                resync = True
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                continue
+            if message is None:
+                continue
+            for queue in self._queues.get(message["channel"], ()):
+                self._put(queue, message["data"])
+
+    async def close(self) -> None:
+        """End every open stream and stop listening (worker shutdown)."""
+        self.closed = True
+        self._broadcast(CLOSE)
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        await self._reset()
+
+
+hub = NotificationHub()
+
+
+def _frame(event: str, data: dict, event_id: str | None = None) -> str:
+    head = f"id: {event_id}\n" if event_id else ""
+    return f"{head}event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _missed(user_id: uuid.UUID, last_id: uuid.UUID) -> list[NotificationRead]:
+    """Notifications created after `last_id` (oldest first)."""
+    anchor = (
+        select(Notification.created_at, Notification.id)
+        .where(Notification.id == last_id, Notification.user_id == user_id)
+        .subquery()
+    )
+    async with async_session() as db:
+        result = await db.execute(
+            select(Notification)
+            .join(
+                anchor,
+                tuple_(Notification.created_at, Notification.id)
+                > tuple_(anchor.c.created_at, anchor.c.id),
+            )
+            .where(Notification.user_id == user_id)
+            .order_by(Notification.created_at, Notification.id)
+            .limit(settings.NOTIFICATION_STREAM_RESUME_LIMIT)
+        )
+        return [notification_read(n) for n in result.scalars().all()]
+
+
+def parse_event_id(value: str | None) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(value) if value else None
+    except ValueError:
+        return None
+
+
+async def stream(user_id: uuid.UUID, last_event_id: str | None) -> AsyncIterator[str]:
+    """SSE frames for `user_id` until the client leaves or the worker stops."""
+    queue = hub.subscribe(user_id)
+    last_id = parse_event_id(last_event_id)
+    sent: deque[str] = deque(maxlen=RECENT_IDS_KEPT)
+
+    async def catch_up() -> AsyncIterator[str]:
+        nonlocal last_id
+        if last_id is None:
+            return
+        for n in await _missed(user_id, last_id):
+            if n.id not in sent:
+                sent.append(n.id)
+                last_id = uuid.UUID(n.id)
+                yield _frame("notification", n.model_dump(mode="json"), n.id)
+
+    try:
+        # Subscribed before catching up, so nothing falls in between
+        await hub.ensure_subscribed(user_id)
+        async for frame in catch_up():
+            yield frame
+        while True:
+            try:
+                item = await asyncio.wait_for(
+                    queue.get(), settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS
+                )
+            except TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+            if item is CLOSE:
+                return
+            if item is RESYNC:
+                async for frame in catch_up():
+                    yield frame
+                continue
+
+            message = json.loads(item)
+            data = message["data"]
+            if message["event"] != "notification":
+                yield _frame(message["event"], data)
+            elif data["id"] not in sent:
+                sent.append(data["id"])
+                last_id = uuid.UUID(data["id"])
+                yield _frame("notification", data, data["id"])
+    finally:
+        await hub.unsubscribe(user_id, queue)
@@ -0,0 +1,158 @@
+"""
+Transactional outbox.
+
+Services call `enqueue` inside the request's transaction, so a side effect
+is recorded exactly when the change that caused it commits, at the cost of
+one INSERT. The worker process (`python -m app.worker`) drains the table:
+
+- `process_batch` claims up to OUTBOX_BATCH_SIZE due events with
+  FOR UPDATE SKIP LOCKED (several workers can run side by side) and runs
+  each topic's handler in a savepoint. An event and the rows its handler
+  writes commit together.
+- A failing event is retried after OUTBOX_RETRY_BASE_SECONDS, doubled per
+  attempt (with jitter, capped at OUTBOX_RETRY_MAX_SECONDS); after
+  OUTBOX_MAX_ATTEMPTS it is dead-lettered (status DEAD, last_error kept)
+  until someone sets it back to PENDING.
+- `purge` deletes delivered events after OUTBOX_RETENTION_DAYS.
+
+Handlers register per topic with `@handler("topic")`. External deliveries
+(email, SMS) may repeat if the worker dies between sending and commit, so
+handlers should enqueue one event per delivery to keep retries narrow.
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.enums import OutboxStatus
+from app.db.session import async_session
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+Handler = Callable[[AsyncSession, dict], Awaitable[None]]
+
+HANDLERS: dict[str, Handler] = {}
+
+
+def handler(topic: str) -> Callable[[Handler], Handler]:
+    """Register the decorated coroutine as the handler for `topic`."""
+
+    def register(fn: Handler) -> Handler:
+        HANDLERS[topic] = fn
+        return fn
+
+    return register
+
+
+def enqueue(db: AsyncSession, topic: str, payload: dict) -> None:
+    """Record an event; it is processed after the current transaction commits."""
+    db.add(
+        OutboxEvent(topic=topic, payload=payload, status=OutboxStatus.PENDING.value)
+    )
+
+
+async def enqueue_many(db: AsyncSession, topic: str, payloads: list[dict]) -> None:
+    """Record one event per payload in a single INSERT."""
+    if not payloads:
+        return
+    status = OutboxStatus.PENDING.value
+    await db.execute(
+        insert(OutboxEvent).values(
+            [{"topic": topic, "payload": p, "status": status} for p in payloads]
+        )
+    )
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before attempt `attempts` + 1."""
+    delay = settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return min(delay, settings.OUTBOX_RETRY_MAX_SECONDS) * random.uniform(0.5, 1.0)
+
+
+async def _dispatch(db: AsyncSession, event: OutboxEvent, now: datetime) -> None:
+    try:
+        fn = HANDLERS.get(event.topic)
+        if fn is None:
+            raise LookupError(f"no handler for topic {event.topic!r}")
+        async with db.begin_nested():
+            await fn(db, event.payload)
+    except Exception as exc:
+        event.attempts += 1
+        event.last_error = f"{type(exc).__name__}: {exc}"[:2000]
+        if event.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            event.status = OutboxStatus.DEAD.value
+            logger.error(
+                "outbox event %s (%s) dead after %d attempts: %s",
+                event.id, event.topic, event.attempts, event.last_error,
+            )
+        else:
+            event.available_at = now + timedelta(seconds=retry_delay(event.attempts))
+            logger.warning(
+                "outbox event %s (%s) failed, attempt %d: %s",
+                event.id, event.topic, event.attempts, event.last_error,
+            )
+    else:
+        event.status = OutboxStatus.DONE.value
+        event.processed_at = now
+
+
+async def process_batch(limit: int | None = None) -> int:
+    """Process due events; returns how many were claimed."""
+    async with async_session() as db:
+        result = await db.execute(
+            select(OutboxEvent)
+            .where(
+                OutboxEvent.status == OutboxStatus.PENDING.value,
+                OutboxEvent.available_at <= func.now(),
+            )
+            .order_by(OutboxEvent.available_at)
+            .limit(limit or settings.OUTBOX_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        )
+        events = result.scalars().all()
+        for event in events:
+            await _dispatch(db, event, datetime.now(timezone.utc))
+        await db.commit()
+    return len(events)
+
+
+async def purge() -> int:
+    """Delete delivered events older than OUTBOX_RETENTION_DAYS."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.OUTBOX_RETENTION_DAYS)
+    async with async_session() as db:
+        result = await db.execute(
+            delete(OutboxEvent).where(
+                OutboxEvent.status == OutboxStatus.DONE.value,
+                OutboxEvent.updated_at < cutoff,
+            )
+        )
+        await db.commit()
+    return result.rowcount
+
+
+async def run(stop: asyncio.Event) -> None:
+    """Drain the outbox until `stop` is set.
+
+    Full batches are followed immediately by the next one; otherwise the
+    worker waits OUTBOX_POLL_INTERVAL_SECONDS.
+    """
+    while not stop.is_set():
+        try:
+            claimed = await process_batch()
+        except Exception:
+            logger.exception("outbox batch failed")
+            claimed = 0
+        if claimed < settings.OUTBOX_BATCH_SIZE:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    stop.wait(), settings.OUTBOX_POLL_INTERVAL_SECONDS
+                )
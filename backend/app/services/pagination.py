@@ -0,0 +1,162 @@
+"""
+Page/cursor pagination shared by the list services.
+
+`page` keeps the original OFFSET behaviour. A `cursor` (opaque, returned
+as `next_cursor`) encodes the sort key values of the last row plus the
+`id` tie-breaker, so the next page is a keyset seek instead of an OFFSET scan.
+
+Pages are fetched with `size + 1` rows; the extra row only tells whether
+another page exists (`has_more`) and is dropped by `split_page`.
+"""
+
+import base64
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import ColumnElement, Select, and_, false, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+@dataclass(frozen=True)
+class SortKey:
+    column: InstrumentedAttribute
+    desc: bool = False
+    nulls_last: bool = False
+
+    @property
+    def name(self) -> str:
+        return self.column.key
+
+    def order_by(self) -> ColumnElement:
+        order = self.column.desc() if self.desc else self.column.asc()
+        return order.nullslast() if self.nulls_last else order
+
+    def beyond(self, value: Any) -> ColumnElement[bool]:
+        """Rows strictly after `value` in this key's order."""
+        if value is None:
+            # NULLs sort last: nothing comes after them
+            return false()
+        cmp = self.column < value if self.desc else self.column > value
+        return or_(cmp, self.column.is_(None)) if self.nulls_last else cmp
+
+    def equals(self, value: Any) -> ColumnElement[bool]:
+        return self.column.is_(None) if value is None else self.column == value
+
+
+# --- Cursor encoding ---
+
+
+def _dump(value: Any) -> list:
+    if value is None:
+        return ["n", None]
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, uuid.UUID):
+        return ["u", str(value)]
+    if isinstance(value, bool):
+        return ["b", value]
+    if isinstance(value, int):
+        return ["i", value]
+    if isinstance(value, float):
+        return ["f", value]
+    return ["s", str(value)]
+
+
+# tag -> (JSON type the value must have, loader)
+_LOADERS = {
+    "n": (type(None), lambda v: None),
+    "dt": (str, datetime.fromisoformat),
+    "d": (str, date.fromisoformat),
+    "u": (str, uuid.UUID),
+    "b": (bool, bool),
+    "i": (int, int),
+    "f": ((int, float), float),
+    "s": (str, str),
+}
+
+
+def _load(key: SortKey, item: Any) -> Any:
+    tag, raw = item
+    json_type, loader = _LOADERS[tag]
+    if not isinstance(raw, json_type) or (tag == "i" and isinstance(raw, bool)):
+        raise TypeError(f"bad {tag!r} cursor value")
+    value = loader(raw)
+    try:
+        python_type = key.column.type.python_type
+    except NotImplementedError:
+        return value
+    if value is not None and not isinstance(value, python_type):
+        raise TypeError(f"cursor value does not fit {key.name}")
+    return value
+
+
+def encode_cursor(keys: Sequence[SortKey], values: Sequence[Any]) -> str:
+    payload = {"k": [k.name for k in keys], "v": [_dump(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["k"] != [k.name for k in keys]:
+            raise ValueError("cursor sort mismatch")
+        values = payload["v"]
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor value count mismatch")
+        return [_load(key, item) for key, item in zip(keys, values)]
+    except (ValueError, KeyError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다")
+
+
+# --- Query helpers ---
+
+
+def keyset_after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """(k1, k2, ...) > (v1, v2, ...) in the mixed-direction order defined by keys."""
+    clauses = []
+    for i, key in enumerate(keys):
+        prefix = [k.equals(v) for k, v in zip(keys[:i], values[:i])]
+        clauses.append(and_(*prefix, key.beyond(values[i])))
+    return or_(*clauses)
+
+
+def paginate(
+    stmt: Select,
+    keys: Sequence[SortKey],
+    page: int,
+    size: int,
+    cursor: str | None = None,
+) -> Select:
+    """Apply ORDER BY plus either the keyset seek (cursor) or OFFSET (page).
+
+    Limits to `size + 1` rows; pass the result through `split_page`.
+    """
+    stmt = stmt.order_by(*[k.order_by() for k in keys])
+    if cursor:
+        stmt = stmt.where(keyset_after(keys, decode_cursor(keys, cursor)))
+    else:
+        stmt = stmt.offset((page - 1) * size)
+    return stmt.limit(size + 1)
+
+
+def split_page(rows: Sequence[Any], size: int) -> tuple[list[Any], bool]:
+    """Trim the look-ahead row fetched by `paginate`; returns (items, has_more)."""
+    return list(rows[:size]), len(rows) > size
+
+
+def next_cursor(
+    keys: Sequence[SortKey], items: Sequence[Any], has_more: bool
+) -> str | None:
+    """Cursor for the page after `items` (rows or entities carrying the key attributes)."""
+    if not has_more or not items:
+        return None
+    last = items[-1]
+    return encode_cursor(keys, [getattr(last, k.name) for k in keys])
@@ -1,7 +1,7 @@
 import uuid
 
 from fastapi import HTTPException
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.enums import JobPostStatus, UserStatus
@@ -9,6 +9,11 @@ from app.models.admin import AdminLog, Report
 from app.models.job import JobPost, JobPostHistory
 from app.models.user import User
 from app.schemas.report import ReportRead
+from app.services import search_cache
+from app.services.counting import count_total
+from app.services.pagination import SortKey, next_cursor, paginate, split_page
+
+REPORTS_SORT = [SortKey(Report.created_at), SortKey(Report.id)]
 
 
 def _report_to_read(r: Report) -> ReportRead:
@@ -52,6 +57,8 @@ async def list_reports(
     status_filter: str | None = None,
     page: int = 1,
     size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> dict:
     """List reports for admin."""
     filters = []
@@ -60,21 +67,19 @@ async def list_reports(
 
     where = and_(*filters) if filters else True
 
-    count_q = select(func.count()).select_from(Report).where(where)
-    total = (await db.execute(count_q)).scalar() or 0
+    total = await count_total(db, Report, where) if include_total else None
 
-    q = (
-        select(Report)
-        .where(where)
-        .order_by(Report.created_at.asc())
-        .offset((page - 1) * size)
-        .limit(size)
-    )
+    q = paginate(select(Report).where(where), REPORTS_SORT, page, size, cursor)
     result = await db.execute(q)
-    reports = result.scalars().all()
+    reports, has_more = split_page(result.scalars().all(), size)
 
     items = [_report_to_read(r) for r in reports]
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor(REPORTS_SORT, reports, has_more),
+    }
 
 
 async def process_report(
@@ -108,6 +113,7 @@ async def process_report(
                 diff_json={"reason": note or "신고 처리"},
             )
             db.add(history)
+            search_cache.invalidate_on_commit(db)
 
     elif action == "WARN" and report.target_type == "USER":
         # For now, just log the warning (could send notification later)
@@ -16,6 +16,7 @@ from app.schemas.resume import (
     ResumeLicenseRead,
     ResumeCareerRead,
 )
+from app.services import search_service
 
 
 def _license_to_read(lic: ResumeLicense) -> ResumeLicenseRead:
@@ -113,6 +114,7 @@ async def create_resume(
         summary=data.summary,
         is_experienced=data.is_experienced,
     )
+    resume.search_keys = search_service.build_resume_search_keys(resume)
     db.add(resume)
     await db.flush()
 
@@ -165,6 +167,8 @@ async def update_resume(
     for field in simple_fields:
         if field in update_data:
             setattr(resume, field, update_data[field])
+    if "title" in update_data or "summary" in update_data:
+        resume.search_keys = search_service.build_resume_search_keys(resume)
 
     # Replace licenses if provided
     if "licenses" in update_data and update_data["licenses"] is not None:
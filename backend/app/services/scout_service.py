@@ -1,12 +1,12 @@
 import uuid
 
 from fastapi import HTTPException
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.enums import JobPostStatus, ResumeVisibility, ScoutStatus
-from app.models.company import Company, CompanyUser
+from app.models.company import Company
 from app.models.interaction import Scout
 from app.models.job import JobPost
 from app.models.resume import Resume
@@ -18,25 +18,15 @@ from app.schemas.scout import (
     TalentListResponse,
     TalentSummary,
 )
-from app.services import notification_service
+from app.services import notification_service, search_service
+from app.services.counting import CountStrategy, count_total
+from app.services.pagination import SortKey, next_cursor, paginate, split_page
 
+TALENTS_SORT = [SortKey(Resume.updated_at, desc=True), SortKey(Resume.id, desc=True)]
+SCOUTS_SORT = [SortKey(Scout.created_at, desc=True), SortKey(Scout.id, desc=True)]
 
-# --- Helpers ---
-
-
-async def _get_company_for_user(db: AsyncSession, user: User) -> Company:
-    result = await db.execute(
-        select(CompanyUser).where(CompanyUser.user_id == user.id)
-    )
-    cu = result.scalar_one_or_none()
-    if not cu:
-        raise HTTPException(status_code=403, detail="기업 회원만 사용할 수 있습니다")
 
-    result = await db.execute(select(Company).where(Company.id == cu.company_id))
-    company = result.scalar_one_or_none()
-    if not company:
-        raise HTTPException(status_code=404, detail="기업 정보를 찾을 수 없습니다")
-    return company
+# --- Helpers ---
 
 
 def _scout_to_read(
@@ -69,14 +59,13 @@ async def search_talents(
     is_experienced: bool | None,
     page: int,
     size: int,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> TalentListResponse:
     conditions = [Resume.visibility == ResumeVisibility.PUBLIC.value]
 
     if keyword:
-        kw = f"%{keyword}%"
-        conditions.append(
-            or_(Resume.title.ilike(kw), Resume.summary.ilike(kw))
-        )
+        conditions.append(search_service.resume_keyword_condition(keyword))
     if desired_job:
         conditions.append(Resume.desired_job == desired_job)
     if desired_region:
@@ -87,21 +76,25 @@ async def search_talents(
     where = and_(*conditions)
 
     # Count
-    count_result = await db.execute(
-        select(func.count()).select_from(Resume).where(where)
+    total = (
+        await count_total(db, Resume, where, CountStrategy.CACHED)
+        if include_total
+        else None
     )
-    total = count_result.scalar() or 0
 
     # Fetch
     result = await db.execute(
-        select(Resume)
-        .options(selectinload(Resume.licenses), selectinload(Resume.careers))
-        .where(where)
-        .order_by(Resume.updated_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
+        paginate(
+            select(Resume)
+            .options(selectinload(Resume.licenses), selectinload(Resume.careers))
+            .where(where),
+            TALENTS_SORT,
+            page,
+            size,
+            cursor,
+        )
     )
-    resumes = result.scalars().all()
+    resumes, has_more = split_page(result.scalars().all(), size)
 
     items = []
     for r in resumes:
@@ -122,17 +115,22 @@ async def search_talents(
             )
         )
 
-    return TalentListResponse(items=items, page=page, size=size, total=total)
+    return TalentListResponse(
+        items=items,
+        page=page,
+        size=size,
+        total=total,
+        has_more=has_more,
+        next_cursor=next_cursor(TALENTS_SORT, resumes, has_more),
+    )
 
 
 # --- Scout: Company Side ---
 
 
 async def send_scout(
-    db: AsyncSession, user: User, data: ScoutCreate
+    db: AsyncSession, company: Company, data: ScoutCreate
 ) -> ScoutRead:
-    company = await _get_company_for_user(db, user)
-
     # Validate resume
     result = await db.execute(
         select(Resume).where(Resume.id == uuid.UUID(data.resume_id))
@@ -181,11 +179,11 @@ async def send_scout(
     db.add(scout)
     await db.flush()
 
-    await notification_service.create_notification(
+    notification_service.notify(
         db,
-        resume.user_id,
         "SCOUT_RECEIVED",
         payload={"scout_id": str(scout.id), "company_name": company.name},
+        user_ids=[resume.user_id],
     )
 
     return _scout_to_read(scout, company.name, job_title)
@@ -193,31 +191,24 @@ async def send_scout(
 
 async def list_company_scouts(
     db: AsyncSession,
-    user: User,
+    company: Company,
     status: str | None,
     page: int,
     size: int,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> ScoutListResponse:
-    company = await _get_company_for_user(db, user)
-
     conditions = [Scout.company_id == company.id]
     if status:
         conditions.append(Scout.status == status)
     where = and_(*conditions)
 
-    count_result = await db.execute(
-        select(func.count()).select_from(Scout).where(where)
-    )
-    total = count_result.scalar() or 0
+    total = await count_total(db, Scout, where) if include_total else None
 
     result = await db.execute(
-        select(Scout)
-        .where(where)
-        .order_by(Scout.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
+        paginate(select(Scout).where(where), SCOUTS_SORT, page, size, cursor)
     )
-    scouts = result.scalars().all()
+    scouts, has_more = split_page(result.scalars().all(), size)
 
     # Batch fetch job titles
     job_ids = list({s.job_post_id for s in scouts if s.job_post_id})
@@ -233,14 +224,17 @@ async def list_company_scouts(
         _scout_to_read(s, company.name, jobs_map.get(s.job_post_id))
         for s in scouts
     ]
-    return ScoutListResponse(items=items, total=total)
+    return ScoutListResponse(
+        items=items,
+        total=total,
+        has_more=has_more,
+        next_cursor=next_cursor(SCOUTS_SORT, scouts, has_more),
+    )
 
 
 async def get_company_scout_detail(
-    db: AsyncSession, user: User, scout_id: uuid.UUID
+    db: AsyncSession, company: Company, scout_id: uuid.UUID
 ) -> ScoutRead:
-    company = await _get_company_for_user(db, user)
-
     result = await db.execute(select(Scout).where(Scout.id == scout_id))
     scout = result.scalar_one_or_none()
     if not scout:
@@ -267,25 +261,20 @@ async def list_user_scouts(
     status: str | None,
     page: int,
     size: int,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> ScoutListResponse:
     conditions = [Scout.user_id == user.id]
     if status:
         conditions.append(Scout.status == status)
     where = and_(*conditions)
 
-    count_result = await db.execute(
-        select(func.count()).select_from(Scout).where(where)
-    )
-    total = count_result.scalar() or 0
+    total = await count_total(db, Scout, where) if include_total else None
 
     result = await db.execute(
-        select(Scout)
-        .where(where)
-        .order_by(Scout.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
+        paginate(select(Scout).where(where), SCOUTS_SORT, page, size, cursor)
     )
-    scouts = result.scalars().all()
+    scouts, has_more = split_page(result.scalars().all(), size)
 
     # Batch fetch company names and job titles
     company_ids = list({s.company_id for s in scouts})
@@ -314,7 +303,12 @@ async def list_user_scouts(
         )
         for s in scouts
     ]
-    return ScoutListResponse(items=items, total=total)
+    return ScoutListResponse(
+        items=items,
+        total=total,
+        has_more=has_more,
+        next_cursor=next_cursor(SCOUTS_SORT, scouts, has_more),
+    )
 
 
 async def get_user_scout_detail(
@@ -368,16 +362,12 @@ async def respond_to_scout(
     await db.flush()
 
     # Notify company users
-    cu_result = await db.execute(
-        select(CompanyUser.user_id).where(CompanyUser.company_id == scout.company_id)
+    notification_service.notify(
+        db,
+        "SCOUT_RESPONDED",
+        payload={"scout_id": str(scout.id), "status": new_status},
+        company_id=scout.company_id,
     )
-    for cu_id in cu_result.scalars().all():
-        await notification_service.create_notification(
-            db,
-            cu_id,
-            "SCOUT_RESPONDED",
-            payload={"scout_id": str(scout.id), "status": new_status},
-        )
 
     # Fetch names for response
     cr = await db.execute(
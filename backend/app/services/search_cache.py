@@ -0,0 +1,115 @@
+"""
+Result cache for the public job search (`GET /api/v1/jobs` and its facets).
+
+Entries are keyed on the normalized filter tuple plus a version number.
+Anything that changes what search can return (publish/close/update,
+blind/unblind, report processing) bumps the version after its transaction
+commits, which orphans every older entry; the orphans expire via TTL.
+
+Redis errors never fail a search: the cache is simply skipped.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.metrics import cache_requests
+from app.core.redis import get_redis
+from app.db.hooks import run_after_commit
+from app.schemas.admin import SearchCacheStats
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+VERSION_KEY = "search:jobs:version"
+ENTRY_PREFIX = "search:jobs:v"
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+CACHE_NAME = "search_jobs"
+
+
+def normalize_filters(**filters: Any) -> dict[str, Any]:
+    """Drop unset filters and collapse whitespace/case in the keyword."""
+    normalized = {}
+    for name, value in filters.items():
+        if value is None or value == "":
+            continue
+        if name == "keyword":
+            value = " ".join(str(value).split()).lower()
+            if not value:
+                continue
+        normalized[name] = value
+    return normalized
+
+
+def is_cacheable(page: int, cursor: str | None) -> bool:
+    """Only the first pages of offset pagination are worth caching."""
+    return cursor is None and page <= settings.SEARCH_CACHE_MAX_PAGE
+
+
+def _entry_key(version: int, filters: dict[str, Any]) -> str:
+    raw = json.dumps(filters, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{ENTRY_PREFIX}{version}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+async def get(
+    schema: type[ResponseT], filters: dict[str, Any]
+) -> tuple[ResponseT | None, str | None]:
+    """Return (cached response, key to store a fresh one under)."""
+    redis = get_redis()
+    try:
+        version = int(await redis.get(VERSION_KEY) or 0)
+        key = _entry_key(version, {"schema": schema.__name__, **filters})
+        cached = await redis.get(key)
+    except RedisError:
+        logger.warning("search cache unavailable", exc_info=True)
+        cache_requests.inc(cache=CACHE_NAME, result="error")
+        return None, None
+
+    if cached is None:
+        cache_requests.inc(cache=CACHE_NAME, result="miss")
+        return None, key
+    cache_requests.inc(cache=CACHE_NAME, result="hit")
+    return schema.model_validate_json(cached), key
+
+
+async def put(key: str, response: BaseModel) -> None:
+    try:
+        await get_redis().set(
+            key, response.model_dump_json(), ex=settings.SEARCH_CACHE_TTL_SECONDS
+        )
+    except RedisError:
+        logger.warning("search cache write failed", exc_info=True)
+
+
+def stats() -> SearchCacheStats:
+    """Lookup counters of this worker process."""
+    hits = int(cache_requests.value(cache=CACHE_NAME, result="hit"))
+    misses = int(cache_requests.value(cache=CACHE_NAME, result="miss"))
+    errors = int(cache_requests.value(cache=CACHE_NAME, result="error"))
+    lookups = hits + misses
+    return SearchCacheStats(
+        hits=hits,
+        misses=misses,
+        errors=errors,
+        hit_ratio=round(hits / lookups, 4) if lookups else 0.0,
+    )
+
+
+async def bump_version() -> None:
+    try:
+        await get_redis().incr(VERSION_KEY)
+    except RedisError:
+        logger.warning("search cache version bump failed", exc_info=True)
+
+
+def invalidate_on_commit(db: AsyncSession) -> None:
+    """Bump the search cache version once the current transaction commits."""
+    run_after_commit(db, VERSION_KEY, bump_version)
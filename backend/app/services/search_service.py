@@ -0,0 +1,84 @@
+from sqlalchemy import ColumnElement, func, or_, select
+
+from app.core import hangul
+from app.models.company import Company
+from app.models.job import JobPost
+from app.models.resume import Resume
+
+# 'simple' config: no stemming/stopwords, works for Korean tokens as-is
+TS_CONFIG = "simple"
+
+
+# --- Write-time documents ---
+
+
+def build_job_search_text(job: JobPost, company_name: str | None = None) -> str:
+    """Build the denormalized search document stored on JobPost.search_text."""
+    parts = [
+        job.title,
+        company_name,
+        job.department,
+        job.specialty,
+        job.body,
+    ]
+    return "\n".join(p for p in parts if p)
+
+
+def build_job_search_keys(job: JobPost) -> list[str]:
+    """Hangul bigram/chosung keys for JobPost.search_keys (body is left to full-text)."""
+    return hangul.index_keys(job.title, job.department, job.specialty)
+
+
+def build_company_name_keys(name: str) -> list[str]:
+    return hangul.index_keys(name)
+
+
+def build_resume_search_keys(resume: Resume) -> list[str]:
+    return hangul.index_keys(resume.title, resume.summary)
+
+
+# --- Query conditions ---
+
+
+def _company_name_match(keys: list[str]) -> ColumnElement[bool]:
+    return JobPost.company_id.in_(
+        select(Company.id).where(Company.name_keys.contains(keys))
+    )
+
+
+def job_keyword_condition(keyword: str) -> ColumnElement[bool]:
+    """
+    Keyword filter backed by GIN indexes only:
+    tsvector / trigram on the search document, Hangul bigram keys on
+    title and company name. Chosung-only queries ("ㅅㅇㄷㅂㅇ") use the keys alone.
+    """
+    keys = hangul.query_keys(keyword)
+    if keys and hangul.is_chosung_query(keyword):
+        return or_(JobPost.search_keys.contains(keys), _company_name_match(keys))
+
+    tsquery = func.websearch_to_tsquery(TS_CONFIG, keyword)
+    conditions = [
+        JobPost.search_vector.op("@@")(tsquery),
+        JobPost.search_text.ilike(f"%{keyword}%"),
+    ]
+    if keys:
+        conditions.append(JobPost.search_keys.contains(keys))
+        conditions.append(_company_name_match(keys))
+    return or_(*conditions)
+
+
+def job_relevance_score(keyword: str) -> ColumnElement[float]:
+    """Relevance score for RELEVANCE sort: full-text rank plus trigram similarity."""
+    tsquery = func.websearch_to_tsquery(TS_CONFIG, keyword)
+    return func.ts_rank_cd(JobPost.search_vector, tsquery) + func.similarity(
+        JobPost.search_text, keyword
+    )
+
+
+def resume_keyword_condition(keyword: str) -> ColumnElement[bool]:
+    """Talent search on resume title/summary; single-character queries fall back to ILIKE."""
+    keys = hangul.query_keys(keyword)
+    if keys:
+        return Resume.search_keys.contains(keys)
+    kw = f"%{keyword}%"
+    return or_(Resume.title.ilike(kw), Resume.summary.ilike(kw))
@@ -0,0 +1,208 @@
+"""
+Unread notification counts without counting notifications.
+
+`notification_counters` holds one row per user, adjusted in the same
+transaction as the notifications themselves (`adjust`). Redis caches it per
+user for UNREAD_COUNT_CACHE_TTL_SECONDS. After the commit the cached value
+is moved by the same delta, but only if it is cached, so a miss always
+reloads from the table.
+
+`count` reads Redis, then the counter row; it never touches the
+notifications table. Redis errors fall back to the table, and a cached
+value that missed an update is gone after the TTL. Concurrent updates can
+make a counter row drift, so the outbox worker runs `reconcile` every
+NOTIFICATION_UNREAD_RECONCILE_INTERVAL_SECONDS: it recounts, fixes drifted
+rows, then drops every cached count that differs from its (now correct)
+row, including ones that missed a cache update while the row was right.
+"""
+
+import logging
+import uuid
+from collections.abc import Sequence
+from functools import partial
+
+from redis.exceptions import RedisError
+from sqlalchemy import func, literal, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.metrics import cache_requests
+from app.core.redis import get_redis
+from app.db.hooks import run_after_commit
+from app.db.session import async_session
+from app.models.notification import NotificationCounter
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+KEY_PREFIX = "notifications:unread:"
+CACHE_NAME = "unread_count"
+SCAN_BATCH = 500
+
+# Move every cached key in KEYS by ARGV[1], never below zero; skip uncached
+ADJUST_LUA = """
+for _, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 then
+        if redis.call('INCRBY', key, ARGV[1]) < 0 then
+            redis.call('SET', key, 0, 'KEEPTTL')
+        end
+    end
+end
+return 0
+"""
+
+RECONCILE_SQL = text(
+    """
+    WITH actual AS (
+        SELECT user_id, count(*) AS unread
+        FROM notifications
+        WHERE read_at IS NULL
+        GROUP BY user_id
+    ), missing AS (
+        INSERT INTO notification_counters (user_id, unread)
+        SELECT user_id, unread FROM actual
+        ON CONFLICT (user_id) DO NOTHING
+        RETURNING user_id
+    ), drifted AS (
+        UPDATE notification_counters AS c
+        SET unread = coalesce(a.unread, 0)
+        FROM notification_counters AS c2
+        LEFT JOIN actual AS a ON a.user_id = c2.user_id
+        WHERE c.user_id = c2.user_id AND c.unread <> coalesce(a.unread, 0)
+        RETURNING c.user_id
+    )
+    SELECT user_id FROM missing
+    UNION ALL
+    SELECT user_id FROM drifted
+    """
+)
+
+
+def _key(user_id: uuid.UUID | str) -> str:
+    return f"{KEY_PREFIX}{user_id}"
+
+
+async def _adjust_cached(user_ids: list[uuid.UUID], delta: int) -> None:
+    try:
+        await get_redis().eval(
+            ADJUST_LUA, len(user_ids), *(_key(u) for u in user_ids), delta
+        )
+    except RedisError:
+        # Stale until the TTL or the next reconcile
+        logger.warning("unread count cache update failed", exc_info=True)
+
+
+async def adjust(db: AsyncSession, user_ids: Sequence[uuid.UUID], delta: int) -> None:
+    """Add `delta` to each user's unread count (clamped at zero).
+
+    One statement for any number of users; the cache follows on commit.
+    """
+    if not user_ids or not delta:
+        return
+    ids = list(dict.fromkeys(user_ids))
+    stmt = insert(NotificationCounter).from_select(
+        ["user_id", "unread"],
+        select(
+            func.unnest(literal(ids, ARRAY(UUID(as_uuid=True)))),
+            literal(max(delta, 0)),
+        ),
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[NotificationCounter.user_id],
+            set_={
+                "unread": func.greatest(NotificationCounter.unread + delta, 0),
+            },
+        )
+    )
+    run_after_commit(
+        db,
+        f"unread-count:{uuid.uuid4()}",
+        partial(_adjust_cached, ids, delta),
+    )
+
+
+async def count(db: AsyncSession, user_id: uuid.UUID) -> int:
+    key = _key(user_id)
+    try:
+        cached = await get_redis().get(key)
+    except RedisError:
+        logger.warning("unread count cache unavailable", exc_info=True)
+        cache_requests.inc(cache=CACHE_NAME, result="error")
+        cached = None
+    else:
+        cache_requests.inc(cache=CACHE_NAME, result="hit" if cached else "miss")
+    if cached is not None:
+        return int(cached)
+
+    unread = await db.scalar(
+        select(NotificationCounter.unread).where(
+            NotificationCounter.user_id == user_id
+        )
+    )
+    unread = unread or 0
+    try:
+        # NX: keep what a concurrent request may have cached meanwhile
+        await get_redis().set(
+            key, unread, ex=settings.UNREAD_COUNT_CACHE_TTL_SECONDS, nx=True
+        )
+    except RedisError:
+        pass
+    return unread
+
+
+async def _drop_stale_cache() -> int:
+    """Delete cached counts that differ from their counter rows."""
+    redis = get_redis()
+    keys: list[str] = []
+    stale = 0
+
+    async def check(batch: list[str]) -> int:
+        cached = dict(zip(batch, await redis.mget(batch)))
+        user_ids = [uuid.UUID(key.removeprefix(KEY_PREFIX)) for key in batch]
+        async with async_session() as db:
+            result = await db.execute(
+                select(NotificationCounter.user_id, NotificationCounter.unread).where(
+                    NotificationCounter.user_id.in_(user_ids)
+                )
+            )
+            actual = {_key(user_id): unread for user_id, unread in result.all()}
+        drop = [
+            key
+            for key, value in cached.items()
+            if value is not None and int(value) != actual.get(key, 0)
+        ]
+        if drop:
+            await redis.delete(*drop)
+        return len(drop)
+
+    async for key in redis.scan_iter(match=f"{KEY_PREFIX}*", count=SCAN_BATCH):
+        keys.append(key)
+        if len(keys) == SCAN_BATCH:
+            stale += await check(keys)
+            keys = []
+    if keys:
+        stale += await check(keys)
+    return stale
+
+
+async def reconcile() -> int:
+    """Recount unread notifications, fix drifted counters and stale cache.
+
+    Returns how many counter rows were fixed.
+    """
+    async with async_session() as db:
+        result = await db.execute(RECONCILE_SQL)
+        fixed = list(result.scalars().all())
+        await db.commit()
+    if fixed:
+        logger.warning("reconciled %d drifted unread counters", len(fixed))
+    try:
+        stale = await _drop_stale_cache()
+    except RedisError:
+        logger.warning("unread count cache check failed", exc_info=True)
+    else:
+        if stale:
+            logger.warning("dropped %d stale cached unread counts", stale)
+    return len(fixed)
@@ -1,29 +1,19 @@
 import uuid
 
 from fastapi import HTTPException
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import principal_cache
 from app.core.enums import Role, VerificationStatus
 from app.models.admin import AdminLog
 from app.models.company import Company, CompanyUser, CompanyVerification
 from app.models.user import User
 from app.schemas.verification import VerificationRead
+from app.services.counting import count_total
+from app.services.pagination import SortKey, next_cursor, paginate, split_page
 
-
-async def _get_company_for_user(db: AsyncSession, user: User) -> Company:
-    result = await db.execute(
-        select(CompanyUser).where(CompanyUser.user_id == user.id)
-    )
-    cu = result.scalar_one_or_none()
-    if not cu:
-        raise HTTPException(status_code=403, detail="기업 계정이 아닙니다")
-
-    result = await db.execute(select(Company).where(Company.id == cu.company_id))
-    company = result.scalar_one_or_none()
-    if not company:
-        raise HTTPException(status_code=404, detail="기업 정보를 찾을 수 없습니다")
-    return company
+VERIFICATIONS_SORT = [SortKey(CompanyVerification.created_at), SortKey(CompanyVerification.id)]
 
 
 def _verification_to_read(
@@ -45,11 +35,9 @@ def _verification_to_read(
 
 
 async def get_verification_status(
-    db: AsyncSession, user: User
+    db: AsyncSession, company: Company
 ) -> VerificationRead | None:
     """Get the latest verification for the user's company."""
-    company = await _get_company_for_user(db, user)
-
     result = await db.execute(
         select(CompanyVerification)
         .where(CompanyVerification.company_id == company.id)
@@ -63,11 +51,9 @@ async def get_verification_status(
 
 
 async def submit_verification(
-    db: AsyncSession, user: User, file_key: str
+    db: AsyncSession, company: Company, file_key: str
 ) -> VerificationRead:
     """Submit a new verification request. Only allowed if no PENDING exists."""
-    company = await _get_company_for_user(db, user)
-
     # Check for existing PENDING verification
     result = await db.execute(
         select(CompanyVerification).where(
@@ -110,7 +96,12 @@ async def submit_verification(
 
 
 async def list_pending_verifications(
-    db: AsyncSession, status_filter: str | None = None, page: int = 1, size: int = 20
+    db: AsyncSession,
+    status_filter: str | None = None,
+    page: int = 1,
+    size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> dict:
     """List verifications for admin review."""
     filters = []
@@ -123,20 +114,19 @@ async def list_pending_verifications(
 
     where = and_(*filters) if filters else True
 
-    count_q = (
-        select(func.count()).select_from(CompanyVerification).where(where)
+    total = (
+        await count_total(db, CompanyVerification, where) if include_total else None
     )
-    total = (await db.execute(count_q)).scalar() or 0
 
-    q = (
-        select(CompanyVerification)
-        .where(where)
-        .order_by(CompanyVerification.created_at.asc())
-        .offset((page - 1) * size)
-        .limit(size)
+    q = paginate(
+        select(CompanyVerification).where(where),
+        VERIFICATIONS_SORT,
+        page,
+        size,
+        cursor,
     )
     result = await db.execute(q)
-    verifications = result.scalars().all()
+    verifications, has_more = split_page(result.scalars().all(), size)
 
     # Fetch companies
     company_ids = list({v.company_id for v in verifications})
@@ -152,7 +142,12 @@ async def list_pending_verifications(
         _verification_to_read(v, companies_map.get(v.company_id))
         for v in verifications
     ]
-    return {"items": items, "total": total}
+    return {
+        "items": items,
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor(VERIFICATIONS_SORT, verifications, has_more),
+    }
 
 
 async def review_verification(
@@ -193,6 +188,7 @@ async def review_verification(
             u = user_result.scalar_one_or_none()
             if u and u.role == Role.COMPANY_UNVERIFIED.value:
                 u.role = Role.COMPANY_VERIFIED.value
+                principal_cache.invalidate(db, u.id)
 
     # Log admin action
     co_result = await db.execute(
@@ -0,0 +1,149 @@
+"""
+Buffered job view counting.
+
+Views are accumulated outside the request transaction, in a Redis hash
+(shared by all workers) or, if Redis is unavailable, in a process-local
+counter. A background task flushes the accumulated deltas into
+`job_posts.view_count` with one batched UPDATE per interval, so a job
+detail GET never writes to `job_posts` and popular posts don't contend
+on a row lock. Sorting by VIEWS reads the flushed column.
+
+Known crawlers are not counted, and with VIEW_DEDUP_WINDOW_SECONDS set a
+viewer (user id, or IP + User-Agent) is counted once per job per window.
+"""
+
+import hashlib
+import logging
+import re
+import time
+import uuid
+from collections import Counter
+
+from fastapi import Request
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, update
+
+from app.core.config import get_settings
+from app.core.redis import get_redis
+from app.core.security import access_token_subject
+from app.db.session import async_session
+from app.models.job import JobPost
+from app.services import job_stats
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+PENDING_KEY = "views:pending"
+SEEN_PREFIX = "views:seen:"
+
+# Read and delete the shared buffer in one step, so no count is left behind
+# or taken twice
+TAKE_LUA = """
+local deltas = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return deltas
+"""
+
+BOT_PATTERN = re.compile(
+    r"bot|crawl|spider|slurp|preview|facebookexternalhit|headless|"
+    r"curl|wget|python-requests|httpx|go-http-client|java/|okhttp",
+    re.IGNORECASE,
+)
+
+# Fallback buffers while Redis is unavailable
+_local_pending: Counter[str] = Counter()
+_local_seen: dict[str, float] = {}
+
+
+def is_bot(user_agent: str | None) -> bool:
+    return not user_agent or bool(BOT_PATTERN.search(user_agent))
+
+
+def viewer_key(request: Request) -> str:
+    """Identity used for once-per-window counting; no DB lookup."""
+    user_id = access_token_subject(request.headers.get("authorization"))
+    if user_id:
+        return f"u:{user_id}"
+    ip = request.headers.get("x-real-ip") or (
+        request.client.host if request.client else ""
+    )
+    ua = request.headers.get("user-agent", "")
+    return f"a:{ip}:{hashlib.sha1(ua.encode()).hexdigest()[:12]}"
+
+
+async def _first_view_in_window(job_id: str, viewer: str) -> bool:
+    window = settings.VIEW_DEDUP_WINDOW_SECONDS
+    if window <= 0:
+        return True
+    key = f"{SEEN_PREFIX}{job_id}:{viewer}"
+    try:
+        return bool(await get_redis().set(key, 1, nx=True, ex=window))
+    except RedisError:
+        now = time.monotonic()
+        if _local_seen.get(key, 0) > now:
+            return False
+        _local_seen[key] = now + window
+        return True
+
+
+async def record_view(job_id: uuid.UUID, request: Request) -> None:
+    """Buffer one view of `job_id` unless it's a bot or a repeat view."""
+    if is_bot(request.headers.get("user-agent")):
+        return
+    job, viewer = str(job_id), viewer_key(request)
+    await job_stats.track_view(job_id, viewer)
+    if not await _first_view_in_window(job, viewer):
+        return
+    try:
+        await get_redis().hincrby(PENDING_KEY, job, 1)
+    except RedisError:
+        _local_pending[job] += 1
+
+
+async def _take_redis_pending() -> dict[str, int]:
+    """Atomically read and clear the shared buffer."""
+    flat = await get_redis().eval(TAKE_LUA, 1, PENDING_KEY)
+    return {job: int(n) for job, n in zip(flat[::2], flat[1::2])}
+
+
+def _take_local_pending() -> dict[str, int]:
+    deltas = dict(_local_pending)
+    _local_pending.clear()
+    now = time.monotonic()
+    for key in [k for k, expires in _local_seen.items() if expires <= now]:
+        del _local_seen[key]
+    return deltas
+
+
+async def flush() -> int:
+    """Apply buffered views to job_posts.view_count; returns jobs updated."""
+    deltas = Counter(_take_local_pending())
+    try:
+        deltas.update(await _take_redis_pending())
+    except RedisError:
+        logger.warning("view buffer unavailable, flushing local counts", exc_info=True)
+    if not deltas:
+        return 0
+
+    table = JobPost.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("job_id"))
+        .values(
+            view_count=table.c.view_count + bindparam("delta"),
+            # not a content change: keep updated_at (sitemap lastmod) as is
+            updated_at=table.c.updated_at,
+        )
+    )
+    params = [
+        {"job_id": uuid.UUID(job), "delta": n} for job, n in sorted(deltas.items())
+    ]
+    try:
+        async with async_session() as session:
+            await session.execute(stmt, params)
+            await session.commit()
+    except Exception:
+        # Keep the counts for the next interval
+        _local_pending.update(deltas)
+        raise
+    return len(params)
@@ -0,0 +1,82 @@
+"""
+Outbox worker: `python -m app.worker`.
+
+Drains the outbox (app.services.outbox) until SIGTERM/SIGINT, finishing
+the batch in hand before exiting. Run as many as needed; they split the
+work with SKIP LOCKED. Also runs the outbox purge, the unread counter
+reconcile and the notifications partition maintenance.
+"""
+
+import asyncio
+import logging
+import signal
+from contextlib import suppress
+
+from app.core import redis
+from app.core.config import get_settings
+from app.core.tasks import run_periodic
+from app.db.session import engine
+from app.services import notification_service  # noqa: F401 (registers handlers)
+from app.services import notification_partitions, outbox, unread_counter
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+PURGE_INTERVAL_SECONDS = 3600
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 86400
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    await redis.init_redis()
+    try:
+        # Next month's partition must exist before anything is written to it
+        await notification_partitions.maintain()
+    except Exception:
+        logger.exception("notification partition maintenance failed")
+    periodic = [
+        asyncio.create_task(
+            run_periodic(
+                outbox.purge, PURGE_INTERVAL_SECONDS, "outbox purge", final_run=False
+            )
+        ),
+        asyncio.create_task(
+            run_periodic(
+                unread_counter.reconcile,
+                settings.NOTIFICATION_UNREAD_RECONCILE_INTERVAL_SECONDS,
+                "unread count reconcile",
+                final_run=False,
+            )
+        ),
+        asyncio.create_task(
+            run_periodic(
+                notification_partitions.maintain,
+                PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+                "notification partition maintenance",
+                final_run=False,
+            )
+        ),
+    ]
+    logger.info("outbox worker started (topics: %s)", ", ".join(outbox.HANDLERS))
+    try:
+        await outbox.run(stop)
+    finally:
+        for task in periodic:
+            task.cancel()
+        for task in periodic:
+            with suppress(asyncio.CancelledError):
+                await task
+        await engine.dispose()
+        await redis.close_redis()
+    logger.info("outbox worker stopped")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    asyncio.run(main())
@@ -1,8 +1,19 @@
 #!/bin/bash
 set -e
 
+# The outbox worker leaves migrations to the backend container
+if [ "${SERVER_MODE:-single}" = "worker" ]; then
+    echo "Starting outbox worker..."
+    exec python -m app.worker
+fi
+
 echo "Running database migrations..."
 alembic upgrade head
 
+if [ "${SERVER_MODE:-single}" = "production" ]; then
+    echo "Starting server (gunicorn + uvicorn workers)..."
+    exec gunicorn -c gunicorn.conf.py app.main:app
+fi
+
 echo "Starting server..."
 exec uvicorn app.main:app --host 0.0.0.0 --port 8000
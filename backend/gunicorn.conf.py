@@ -0,0 +1,60 @@
+"""
+Production server profile: gunicorn managing uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Tunables (environment):
+    WEB_CONCURRENCY        worker processes (default: usable CPUs)
+    MAX_REQUESTS           recycle a worker after this many requests
+    MAX_REQUESTS_JITTER    random spread so workers don't recycle together
+    KEEPALIVE_SECONDS      idle keep-alive; must exceed nginx's upstream
+                           keepalive_timeout (60s) so nginx closes first
+    METRICS_PORT           first per-worker metrics port (default 9100);
+                           worker slot N serves GET /metrics on
+                           METRICS_PORT + N, slots are reused when workers
+                           are replaced, so scrape METRICS_PORT ..
+                           METRICS_PORT + WEB_CONCURRENCY - 1
+"""
+
+import os
+
+from app.core.config import get_settings
+
+
+def _usable_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+workers = int(os.environ.get("WEB_CONCURRENCY") or _usable_cpus())
+# Workers import the app after fork; db/session.py sizes each pool from this
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+worker_class = "app.core.server.ProductionUvicornWorker"
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+
+max_requests = int(os.environ.get("MAX_REQUESTS", 10000))
+max_requests_jitter = int(os.environ.get("MAX_REQUESTS_JITTER", 1000))
+
+keepalive = int(os.environ.get("KEEPALIVE_SECONDS", 75))
+# Lifespan drain (SHUTDOWN_DRAIN_TIMEOUT_SECONDS) plus flush/dispose time
+graceful_timeout = int(get_settings().SHUTDOWN_DRAIN_TIMEOUT_SECONDS) + 10
+timeout = 60
+
+accesslog = None
+errorlog = "-"
+
+metrics_port = int(os.environ.get("METRICS_PORT") or 9100)
+
+
+def pre_fork(server, worker):
+    # Master side: the lowest slot no live worker holds
+    taken = {getattr(w, "metrics_slot", None) for w in server.WORKERS.values()}
+    worker.metrics_slot = next(n for n in range(len(taken) + 1) if n not in taken)
+
+
+def post_fork(server, worker):
+    # Settings were loaded above, before the fork; the app reads this copy
+    get_settings().METRICS_PORT = metrics_port + worker.metrics_slot
@@ -0,0 +1,81 @@
+"""
+로그인 비밀번호 검증 벤치마크: 이벤트 루프에서 직접 bcrypt vs 전용 스레드 풀
+실행: cd backend && python -m scripts.bench_login --logins 200 --concurrency 1 8 32
+
+DB 없이 login의 비밀번호 검증 구간만 재현한다. 동시 로그인 처리량과 함께
+같은 루프에서 도는 가벼운 요청(10ms 주기 tick)의 지연을 측정해 루프 블로킹을 본다.
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.core.config import get_settings
+from app.core.security import (
+    hash_password,
+    pwd_context,
+    shutdown_hash_executor,
+    verify_password,
+    verify_password_async,
+)
+
+TICK_SECONDS = 0.01
+
+
+async def _inline_login(password: str, hashed: str) -> None:
+    verify_password(password, hashed)
+
+
+async def _pooled_login(password: str, hashed: str) -> None:
+    await verify_password_async(password, hashed)
+
+
+async def _ticker(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append((time.perf_counter() - start - TICK_SECONDS) * 1000)
+
+
+async def _run(login, logins: int, concurrency: int, hashed: str) -> tuple[float, float]:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with sem:
+            await login("Password1", hashed)
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    ticker = asyncio.create_task(_ticker(stop, lags))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+
+    return logins / elapsed, max(lags, default=0.0)
+
+
+async def main(logins: int, concurrency: list[int]) -> None:
+    settings = get_settings()
+    hashed = hash_password("Password1")
+    print(
+        f"bcrypt rounds={pwd_context.to_dict()['bcrypt__rounds']} "
+        f"workers={settings.PASSWORD_HASH_WORKERS} "
+        f"max_pending={settings.PASSWORD_HASH_MAX_PENDING}"
+    )
+    print(f"{'mode':<8}{'conc':>6}{'logins/s':>12}{'max tick lag (ms)':>20}")
+    for conc in concurrency:
+        for name, login in (("inline", _inline_login), ("pooled", _pooled_login)):
+            rate, lag = await _run(login, logins, conc, hashed)
+            print(f"{name:<8}{conc:>6}{rate:>12.1f}{lag:>20.1f}")
+    shutdown_hash_executor()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.concurrency))
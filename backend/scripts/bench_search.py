@@ -0,0 +1,126 @@
+"""
+공고 키워드 검색 벤치마크: 기존 ILIKE 경로 vs 한글 bigram/초성 키 경로
+실행: cd backend && python -m scripts.bench_search --rows 50000
+
+합성 데이터는 하나의 트랜잭션 안에서 생성하고 마지막에 롤백한다.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from sqlalchemy import and_, func, insert, or_, select, text
+
+from app.core.enums import JobPostStatus
+from app.db.session import async_session
+from app.models.company import Company
+from app.models.job import JobPost
+from app.services.search_service import (
+    build_company_name_keys,
+    build_job_search_keys,
+    build_job_search_text,
+    job_keyword_condition,
+)
+
+REGIONS = ["서울", "강남", "분당", "인천", "부산", "대구", "광주", "수원", "일산", "대전"]
+KINDS = ["대학교병원", "중앙병원", "재활병원", "요양병원", "피부과의원", "치과의원", "한방병원"]
+ROLES = ["간호사", "간호조무사", "물리치료사", "방사선사", "임상병리사", "원무과", "약사"]
+DEPTS = ["내과 병동", "외래", "재활의학과", "영상의학과", "응급실", "수술실", "검진센터"]
+
+QUERIES = ["간호사", "서울대", "ㅅㅇㅈㅇㅂㅇ", "재활의학과", "방사선", "강남피부과ㅇ"]
+
+
+def _company_name(rng: random.Random) -> str:
+    return rng.choice(REGIONS) + rng.choice(KINDS)
+
+
+async def _seed(db, rows: int, rng: random.Random) -> None:
+    companies = []
+    for i in range(max(rows // 20, 1)):
+        name = _company_name(rng)
+        companies.append(
+            {
+                "id": uuid.uuid4(),
+                "business_no": f"bench-{i}-{uuid.uuid4().hex[:8]}",
+                "name": name,
+                "name_keys": build_company_name_keys(name),
+                "status": "ACTIVE",
+            }
+        )
+    await db.execute(insert(Company), companies)
+
+    batch = []
+    for _ in range(rows):
+        co = rng.choice(companies)
+        job = JobPost(
+            title=f"[{co['name']}] {rng.choice(ROLES)} 채용",
+            department=rng.choice(DEPTS),
+            body=" ".join(rng.choice(ROLES + DEPTS) for _ in range(40)),
+        )
+        batch.append(
+            {
+                "id": uuid.uuid4(),
+                "company_id": co["id"],
+                "status": JobPostStatus.PUBLISHED.value,
+                "title": job.title,
+                "department": job.department,
+                "body": job.body,
+                "contact_visible": False,
+                "view_count": 0,
+                "search_text": build_job_search_text(job, co["name"]),
+                "search_keys": build_job_search_keys(job),
+            }
+        )
+        if len(batch) >= 5000:
+            await db.execute(insert(JobPost), batch)
+            batch = []
+    if batch:
+        await db.execute(insert(JobPost), batch)
+    await db.execute(text("ANALYZE companies"))
+    await db.execute(text("ANALYZE job_posts"))
+
+
+def _ilike_condition(keyword: str):
+    kw = f"%{keyword}%"
+    return or_(JobPost.title.ilike(kw), JobPost.body.ilike(kw))
+
+
+async def _time(db, condition, repeat: int) -> tuple[float, int]:
+    q = (
+        select(func.count())
+        .select_from(JobPost)
+        .where(and_(JobPost.status == JobPostStatus.PUBLISHED.value, condition))
+    )
+    samples = []
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = (await db.execute(q)).scalar() or 0
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), count
+
+
+async def bench(rows: int, repeat: int) -> None:
+    rng = random.Random(42)
+    async with async_session() as db:
+        print(f"시드 생성: 공고 {rows}건 ...")
+        await _seed(db, rows, rng)
+
+        print(f"{'query':<16}{'ILIKE ms':>10}{'hits':>8}{'keys ms':>10}{'hits':>8}")
+        for kw in QUERIES:
+            ilike_ms, ilike_hits = await _time(db, _ilike_condition(kw), repeat)
+            keys_ms, keys_hits = await _time(db, job_keyword_condition(kw), repeat)
+            print(f"{kw:<16}{ilike_ms:>10.2f}{ilike_hits:>8}{keys_ms:>10.2f}{keys_hits:>8}")
+
+        await db.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(bench(args.rows, args.repeat))
@@ -22,7 +22,7 @@ from app.core.enums import (
     UserType,
     VerificationStatus,
 )
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from app.db.session import async_session
 from app.models.admin import AdminLog
 from app.models.application import Application, ApplicationStatusHistory
@@ -31,6 +31,11 @@ from app.models.job import JobPost
 from app.models.notification import Notification
 from app.models.payment import Entitlement, Product
 from app.models.user import User, UserProfile
+from app.services.search_service import (
+    build_company_name_keys,
+    build_job_search_keys,
+    build_job_search_text,
+)
 
 
 async def seed():
@@ -47,7 +52,7 @@ async def seed():
             return
 
         now = datetime.now(timezone.utc)
-        pw = hash_password("Password1")
+        pw = await hash_password_async("Password1")
 
         # ============================================================
         # 1. 관리자 계정
@@ -114,6 +119,7 @@ async def seed():
         company = Company(
             business_no="123-45-67890",
             name="서울중앙병원",
+            name_keys=build_company_name_keys("서울중앙병원"),
             type="종합병원",
             address="서울시 강남구 테헤란로 123",
             status=UserStatus.ACTIVE.value,
@@ -155,6 +161,7 @@ async def seed():
         company2 = Company(
             business_no="987-65-43210",
             name="강남피부과의원",
+            name_keys=build_company_name_keys("강남피부과의원"),
             type="피부과",
             address="서울시 강남구 논현동 456",
             status=UserStatus.ACTIVE.value,
@@ -266,6 +273,8 @@ async def seed():
                 view_count=50 + hash(jd["title"]) % 200,
                 **jd,
             )
+            job.search_text = build_job_search_text(job, company.name)
+            job.search_keys = build_job_search_keys(job)
             db.add(job)
             await db.flush()
             created_jobs.append(job)
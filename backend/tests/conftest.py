@@ -1,14 +1,25 @@
 from collections.abc import AsyncGenerator
 
 import pytest_asyncio
+from fastapi import Request
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import get_settings
 from app.core.rate_limit import limiter
-from app.db.session import get_db
+from app.core.security import access_token_subject
+from app.db import replica
+from app.db.instrumentation import instrument
+from app.db.session import (
+    WROTE,
+    RoutingSession,
+    get_db,
+    get_read_db,
+    route_read_only,
+)
 from app.main import app
 from app.models.base import Base
+from app.services.notification_partitions import ensure_partitions
 
 # Disable rate limiting in tests
 limiter.enabled = False
@@ -30,11 +41,15 @@ async def setup_db():
         pool_size=5,
         max_overflow=0,
     )
+    instrument(_test_engine, "test")
     _test_session_factory = async_sessionmaker(
-        _test_engine, class_=AsyncSession, expire_on_commit=False
+        _test_engine,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        expire_on_commit=False,
     )
 
-    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+    async def override_get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
         async with _test_session_factory() as session:
             try:
                 yield session
@@ -42,11 +57,24 @@ async def setup_db():
             except Exception:
                 await session.rollback()
                 raise
+            if session.info.get(WROTE):
+                await replica.stick(
+                    access_token_subject(request.headers.get("authorization"))
+                )
+
+    async def override_get_read_db(
+        request: Request,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        async with _test_session_factory() as session:
+            await route_read_only(session, request)
+            yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_read_db
 
     async with _test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await ensure_partitions(conn, months_back=1)
 
     yield
 
@@ -0,0 +1,27 @@
+from app.core import hangul
+
+
+def test_decompose():
+    assert hangul.decompose("병원") == "ㅂㅕㅇㅇㅝㄴ"
+    assert hangul.decompose("MRI실") == "MRIㅅㅣㄹ"
+
+
+def test_extract_chosung():
+    assert hangul.extract_chosung("서울대 병원") == "ㅅㅇㄷㅂㅇ"
+
+
+def test_chosung_query_matches_index_keys():
+    doc = set(hangul.index_keys("서울대병원"))
+    assert hangul.is_chosung_query("ㅅㅇㄷㅂㅇ")
+    assert set(hangul.query_keys("ㅅㅇㄷㅂㅇ")) <= doc
+
+
+def test_partial_query_matches_index_keys():
+    doc = set(hangul.index_keys("[서울대병원] 간호사 채용"))
+    assert set(hangul.query_keys("서울대 병원")) <= doc
+    assert set(hangul.query_keys("서울대ㅂ")) <= doc
+    assert not set(hangul.query_keys("부산대병원")) <= doc
+
+
+def test_short_query_has_no_keys():
+    assert hangul.query_keys("간") == []
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db import hooks
+
+
+async def test_jobs_run_after_each_commit():
+    ran = []
+
+    async def job():
+        ran.append(len(ran))
+
+    db = AsyncSession()
+    for _ in range(2):
+        hooks.run_after_commit(db, "job", job)
+        hooks.run_after_commit(db, "job", job)
+        await db.commit()
+        await hooks.wait_background()
+    assert ran == [0, 1]
+
+
+async def test_savepoint_rollback_drops_only_its_own_jobs():
+    ran = []
+
+    def job(name):
+        async def run():
+            ran.append(name)
+
+        return run
+
+    session = Session(create_engine("sqlite://"))
+    db = SimpleNamespace(sync_session=session)
+    session.execute(text("SELECT 1"))
+    hooks.run_after_commit(db, "outer", job("outer"))
+    with session.begin_nested():
+        hooks.run_after_commit(db, "kept", job("kept"))
+    with pytest.raises(RuntimeError):
+        with session.begin_nested():
+            hooks.run_after_commit(db, "dropped", job("dropped"))
+            raise RuntimeError
+    await hooks.wait_background()
+    assert ran == []  # releasing a savepoint is not the commit
+
+    session.commit()
+    await hooks.wait_background()
+    assert sorted(ran) == ["kept", "outer"]
+
+    session.execute(text("SELECT 1"))
+    hooks.run_after_commit(db, "rolled back", job("rolled back"))
+    session.rollback()
+    session.commit()
+    await hooks.wait_background()
+    assert sorted(ran) == ["kept", "outer"]
@@ -0,0 +1,84 @@
+import uuid
+
+import fakeredis
+import pytest
+from httpx import AsyncClient
+
+from app.services import job_stats
+from tests.conftest import auth_header
+
+
+@pytest.fixture
+def stats_redis(monkeypatch) -> fakeredis.FakeAsyncRedis:
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(job_stats, "get_redis", lambda: client)
+    return client
+
+
+async def _track(job_id: uuid.UUID) -> None:
+    for viewer in ("u:1", "u:2", "u:1"):
+        await job_stats.track_view(job_id, viewer)
+    await job_stats.track_favorite(job_id)
+    await job_stats.track_application(job_id)
+
+
+async def test_tracking_counts_views_and_unique_viewers(stats_redis):
+    job_id = uuid.uuid4()
+    await _track(job_id)
+
+    day = job_stats.today()
+    assert await job_stats._collect(day) == [
+        {
+            "job_post_id": job_id,
+            "day": day,
+            "unique_viewers": 2,
+            "views": 3,
+            "favorites": 1,
+            "applications": 1,
+        }
+    ]
+    for key in await stats_redis.keys(f"{job_stats.KEY_PREFIX}*"):
+        assert 0 < await stats_redis.ttl(key) <= job_stats.KEY_TTL_SECONDS
+
+
+async def test_tracking_is_best_effort(monkeypatch):
+    server = fakeredis.FakeServer()
+    server.connected = False
+    client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(job_stats, "get_redis", lambda: client)
+
+    await job_stats.track_view(uuid.uuid4(), "u:1")
+    assert await job_stats.rollup() == 0
+
+
+async def test_rollup_feeds_job_stats_endpoint(
+    client: AsyncClient, company_tokens: dict, person_tokens: dict, stats_redis
+):
+    res = await client.post(
+        "/api/v1/biz/jobs",
+        json={"title": "통계 테스트 간호사"},
+        headers=auth_header(company_tokens),
+    )
+    assert res.status_code == 200
+    job_id = uuid.UUID(res.json()["id"])
+    await _track(job_id)
+    # Events of a job deleted since are skipped
+    await job_stats.track_view(uuid.uuid4(), "u:1")
+
+    assert await job_stats.rollup() == 1
+    await job_stats.track_view(job_id, "u:3")
+    assert await job_stats.rollup() == 1  # upsert, not a second row
+
+    res = await client.get(
+        f"/api/v1/biz/jobs/{job_id}/stats", headers=auth_header(company_tokens)
+    )
+    assert res.status_code == 200
+    data = res.json()
+    assert len(data["days"]) == 1
+    assert data["days"][0]["unique_viewers"] == 3
+    assert (data["views"], data["favorites"], data["applications"]) == (4, 1, 1)
+
+    res = await client.get(
+        f"/api/v1/biz/jobs/{job_id}/stats", headers=auth_header(person_tokens)
+    )
+    assert res.status_code == 403
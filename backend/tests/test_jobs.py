@@ -1,11 +1,44 @@
+import uuid
+from datetime import datetime, timezone
+
 import pytest
 from httpx import AsyncClient
-
+from sqlalchemy import event
+
+from app.core.enums import JobPostStatus
+from app.db import replica
+from app.db.session import ReadOnlySessionError, mark_read_only
+from app.models.company import Company
+from app.models.job import JobPost
+from app.services import search_service
+from tests import conftest
 from tests.conftest import auth_header
 
 pytestmark = pytest.mark.asyncio
 
 
+async def _seed_jobs(*posts: tuple[str, str | None]) -> list[uuid.UUID]:
+    """Insert published posts (title, body) for a new company."""
+    async with conftest._test_session_factory() as session:
+        company = Company(business_no=uuid.uuid4().hex[:20], name="시드병원")
+        jobs = [
+            JobPost(
+                company=company,
+                status=JobPostStatus.PUBLISHED.value,
+                title=title,
+                body=body,
+                published_at=datetime.now(timezone.utc),
+            )
+            for title, body in posts
+        ]
+        for job in jobs:
+            job.search_text = search_service.build_job_search_text(job, company.name)
+            job.search_keys = search_service.build_job_search_keys(job)
+        session.add_all(jobs)
+        await session.commit()
+        return [job.id for job in jobs]
+
+
 async def test_list_jobs(client: AsyncClient):
     res = await client.get("/api/v1/jobs")
     assert res.status_code == 200
@@ -76,3 +109,137 @@ async def test_health(client: AsyncClient):
     res = await client.get("/health")
     assert res.status_code == 200
     assert res.json()["status"] == "ok"
+
+
+async def test_list_jobs_sort_relevance(client: AsyncClient):
+    keyword = f"relevance{uuid.uuid4().hex[:8]}"
+    body_only, in_title, _ = await _seed_jobs(
+        ("병동 간호사 모집", "병동 근무 안내. " * 40 + keyword),
+        (f"{keyword} 간호사 모집", "근무 안내"),
+        ("외래 간호사 모집", "외래 근무 안내"),
+    )
+
+    res = await client.get(
+        "/api/v1/jobs", params={"keyword": keyword, "sort": "RELEVANCE"}
+    )
+    assert res.status_code == 200
+    # Title match ranks above a body-only match; no match is excluded
+    assert [item["id"] for item in res.json()["items"]] == [
+        str(in_title),
+        str(body_only),
+    ]
+
+    # Without a keyword RELEVANCE falls back to LATEST
+    res = await client.get("/api/v1/jobs", params={"sort": "RELEVANCE"})
+    assert res.status_code == 200
+
+
+async def test_list_jobs_cursor_pagination(client: AsyncClient):
+    first = await client.get("/api/v1/jobs", params={"size": 1})
+    assert first.status_code == 200
+    data = first.json()
+    if not data["next_cursor"]:
+        pytest.skip("Not enough job posts in database")
+
+    second = await client.get(
+        "/api/v1/jobs", params={"size": 1, "cursor": data["next_cursor"]}
+    )
+    assert second.status_code == 200
+    second_ids = [item["id"] for item in second.json()["items"]]
+    assert data["items"][0]["id"] not in second_ids
+
+
+async def test_list_jobs_invalid_cursor(client: AsyncClient):
+    res = await client.get("/api/v1/jobs", params={"cursor": "not-a-cursor"})
+    assert res.status_code == 400
+
+
+async def test_list_jobs_without_total(client: AsyncClient):
+    res = await client.get(
+        "/api/v1/jobs", params={"size": 1, "include_total": "false"}
+    )
+    assert res.status_code == 200
+    data = res.json()
+    assert data["total"] is None
+    assert data["has_more"] == (data["next_cursor"] is not None)
+
+
+async def test_job_facets(client: AsyncClient):
+    res = await client.get("/api/v1/jobs/facets", params={"location_code": "11"})
+    assert res.status_code == 200
+    data = res.json()
+    for name in ("location_code", "job_category", "shift_type", "employment_type"):
+        assert isinstance(data[name], list)
+    # The selected facet still lists its alternatives' counts
+    assert sum(f["count"] for f in data["location_code"]) >= data["total"]
+
+
+# Search rows carry the summary columns only; a full job_posts row (body,
+# contact, search text) is several times this
+SUMMARY_ROW_MAX_BYTES = 1024
+
+
+async def test_search_jobs_single_statement(client: AsyncClient):
+    """Search page = one SELECT of summary columns joined to companies."""
+    size = 5
+    await _seed_jobs(*[(f"시드 공고 {i}", None) for i in range(4 * size + 1)])
+    statements: list[tuple[str, tuple]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, tuple(parameters or ())))
+
+    engines = {conftest._test_engine.sync_engine}
+    if replica.engine is not None:
+        engines.add(replica.engine.sync_engine)
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        # page 4 is past the result cache; no total -> no COUNT
+        res = await client.get(
+            "/api/v1/jobs",
+            params={"page": 4, "size": size, "include_total": "false"},
+        )
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+    assert res.status_code == 200
+    assert statements[0][0] == "SET TRANSACTION READ ONLY"
+    assert len(statements) == 2
+    search, params = statements[1]
+    select_list = search.split(" FROM ", 1)[0]
+    assert "companies.name" in select_list
+    for detail_column in ("body", "contact_name", "search_text", "search_keys"):
+        assert f"job_posts.{detail_column}" not in select_list
+
+    # Bytes the search ships: its rows' size, measured by re-running it
+    async with conftest._test_engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        rows, nbytes = await raw.fetchrow(
+            f"SELECT count(*), coalesce(sum(pg_column_size(t.*)), 0) FROM ({search}) t",
+            *params,
+        )
+    # LIMIT size + 1: the extra row only sets has_more
+    data = res.json()
+    assert len(data["items"]) == size
+    assert data["has_more"]
+    assert rows == len(data["items"]) + int(data["has_more"])
+    assert nbytes <= rows * SUMMARY_ROW_MAX_BYTES
+
+
+async def test_read_only_session_rejects_flush():
+    async with conftest._test_session_factory() as session:
+        mark_read_only(session)
+        session.add(Company(business_no="read-only-test", name="읽기전용"))
+        with pytest.raises(ReadOnlySessionError):
+            await session.flush()
+
+
+async def test_query_stats_headers(client: AsyncClient):
+    if not conftest.settings.DEBUG:
+        pytest.skip("query stats headers are DEBUG only")
+    res = await client.get("/api/v1/jobs", params={"page": 4, "include_total": "false"})
+    assert res.status_code == 200
+    assert int(res.headers["x-db-statements"]) >= 1
+    assert float(res.headers["x-db-time"]) > 0
+    assert "x-db-pool-wait" in res.headers
@@ -0,0 +1,50 @@
+import asyncio
+
+from httpx import ASGITransport, AsyncClient
+
+from app.core import lifecycle
+from app.main import app
+from tests import conftest
+
+
+async def test_drain_waits_for_in_flight_and_refuses_new(monkeypatch):
+    monkeypatch.setattr(lifecycle, "_draining", False)
+    release = asyncio.Event()
+
+    async def slow_app(scope, receive, send):
+        await release.wait()
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    transport = ASGITransport(app=lifecycle.AdmissionMiddleware(slow_app))
+    async with AsyncClient(transport=transport, base_url="http://t") as c:
+        in_flight = asyncio.create_task(c.get("/api/v1/jobs"))
+        await asyncio.sleep(0.01)
+        drained = asyncio.create_task(lifecycle.drain())
+        await asyncio.sleep(0.01)
+        assert not drained.done()
+
+        refused = await c.get("/api/v1/jobs")
+        assert refused.status_code == 503
+        assert refused.headers["connection"] == "close"
+
+        release.set()
+        assert (await in_flight).status_code == 204
+        assert await drained
+
+
+async def test_readiness_reports_draining(monkeypatch):
+    monkeypatch.setattr(lifecycle, "_draining", True)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as c:
+        res = await c.get("/health/ready")
+    assert res.status_code == 503
+    assert res.json()["status"] == "draining"
+
+
+async def test_warmup_fills_the_pool():
+    engine = conftest._test_engine
+    await engine.dispose()
+    await lifecycle.warmup([engine])
+    assert engine.sync_engine.pool.checkedin() == min(
+        lifecycle.settings.DB_WARMUP_CONNECTIONS, engine.sync_engine.pool.size()
+    )
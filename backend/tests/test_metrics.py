@@ -0,0 +1,48 @@
+from httpx import ASGITransport, AsyncClient
+
+from app.core.metrics import CONTENT_TYPE, Histogram, render
+from app.core.monitoring import serve_metrics
+from app.main import app
+
+
+def test_histogram_exposition_is_cumulative():
+    h = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        h.observe(value, route="/jobs")
+
+    assert h.exposition() == [
+        'latency_seconds_bucket{route="/jobs",le="0.1"} 1',
+        'latency_seconds_bucket{route="/jobs",le="1.0"} 3',
+        'latency_seconds_bucket{route="/jobs",le="+Inf"} 4',
+        'latency_seconds_sum{route="/jobs"} 4.05',
+        'latency_seconds_count{route="/jobs"} 4',
+    ]
+
+
+async def test_metrics_endpoint_reports_route_templates():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as c:
+        await c.get("/health")
+        res = await c.get("/internal/metrics")
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE http_request_duration_seconds histogram" in res.text
+    assert 'route="/health",status="200"' in res.text
+    assert "http_requests_in_flight" in render()
+
+
+async def test_worker_metrics_port_serves_this_process():
+    server = await serve_metrics(0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        async with AsyncClient(base_url=f"http://127.0.0.1:{port}") as c:
+            res = await c.get("/metrics")
+            missing = await c.get("/other")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert res.status_code == 200
+    assert res.headers["content-type"] == CONTENT_TYPE
+    assert "# TYPE http_requests_in_flight gauge" in res.text
+    assert missing.status_code == 404
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import uuid
+
+import fakeredis
+import pytest
+
+from app.core.config import get_settings
+from app.services import notification_stream
+from app.services.notification_stream import CLOSE, RESYNC, NotificationHub
+
+settings = get_settings()
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(notification_stream, "get_redis", lambda: client)
+    hub = NotificationHub()
+    monkeypatch.setattr(notification_stream, "hub", hub)
+    return hub
+
+
+async def _subscribed(hub: NotificationHub, user_id: uuid.UUID) -> None:
+    channel = notification_stream.push_channel(user_id)
+    for _ in range(100):
+        if hub._pubsub is not None and channel in hub._pubsub.channels:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("not subscribed")
+
+
+async def test_stream_receives_published_notifications(hub):
+    user_id = uuid.uuid4()
+    frames = notification_stream.stream(user_id, None)
+    first = asyncio.ensure_future(anext(frames))
+    await _subscribed(hub, user_id)
+
+    notification_id = str(uuid.uuid4())
+    await notification_stream.publish(
+        [
+            (user_id, "notification", {"id": notification_id, "type": "T"}),
+            (uuid.uuid4(), "notification", {"id": str(uuid.uuid4()), "type": "T"}),
+            (user_id, "push", {"title": "제목"}),
+        ]
+    )
+    frame = await asyncio.wait_for(first, 2)
+    assert frame.startswith(f"id: {notification_id}\nevent: notification\n")
+    frame = await asyncio.wait_for(anext(frames), 2)
+    assert frame == 'event: push\ndata: {"title": "제목"}\n\n'
+
+    await frames.aclose()
+    assert hub.open_streams == 0
+    await hub.close()
+
+
+async def test_duplicates_are_sent_once(hub):
+    user_id = uuid.uuid4()
+    frames = notification_stream.stream(user_id, None)
+    first = asyncio.ensure_future(anext(frames))
+    await _subscribed(hub, user_id)
+
+    message = (user_id, "notification", {"id": str(uuid.uuid4())})
+    await notification_stream.publish([message, message, (user_id, "push", {})])
+    await asyncio.wait_for(first, 2)
+    assert (await asyncio.wait_for(anext(frames), 2)).startswith("event: push")
+    await frames.aclose()
+    await hub.close()
+
+
+async def test_heartbeat_and_close(hub, monkeypatch):
+    monkeypatch.setattr(settings, "NOTIFICATION_STREAM_HEARTBEAT_SECONDS", 0.05)
+    frames = notification_stream.stream(uuid.uuid4(), None)
+    assert await asyncio.wait_for(anext(frames), 2) == ": heartbeat\n\n"
+
+    await hub.close()
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(anext(frames), 2)
+    assert not hub.accepting()
+
+
+def test_connection_cap(hub, monkeypatch):
+    monkeypatch.setattr(settings, "NOTIFICATION_STREAM_MAX_CONNECTIONS", 1)
+    hub._queues["notifications:x"] = {asyncio.Queue()}
+    assert not hub.accepting()
+
+
+def test_slow_stream_is_resynced():
+    hub = NotificationHub()
+    queue: asyncio.Queue = asyncio.Queue(2)
+    for i in range(3):
+        hub._put(queue, json.dumps({"n": i}))
+    assert queue.qsize() == 1 and queue.get_nowait() is RESYNC
+
+    for i in range(2):
+        hub._put(queue, json.dumps({"n": i}))
+    hub._put(queue, CLOSE)
+    assert queue.get_nowait() is CLOSE
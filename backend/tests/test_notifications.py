@@ -0,0 +1,209 @@
+import gzip
+import uuid
+from datetime import datetime, timezone
+
+import fakeredis
+from httpx import AsyncClient
+from sqlalchemy import insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.deps import get_streaming_user
+from app.db import hooks
+from app.db.session import engine
+from app.models.notification import Notification, NotificationCounter
+from app.models.user import User
+from app.services import notification_service, unread_counter
+from app.services.notification_partitions import (
+    add_months,
+    archive_expired,
+    ensure_partitions,
+    month_start,
+    partition_month,
+    partition_name,
+    retention_cutoff,
+)
+from tests.conftest import auth_header
+
+settings = get_settings()
+
+
+async def _users(db: AsyncSession, n: int) -> list[uuid.UUID]:
+    users = [
+        User(
+            type="PERSON",
+            email=f"notify-{uuid.uuid4().hex}@example.com",
+            password_hash="x",
+        )
+        for _ in range(n)
+    ]
+    db.add_all(users)
+    await db.flush()
+    return [u.id for u in users]
+
+
+async def _stored(db: AsyncSession, ntype: str) -> list[Notification]:
+    result = await db.execute(select(Notification).where(Notification.type == ntype))
+    return list(result.scalars().all())
+
+
+async def test_create_notifications_single_insert(db: AsyncSession):
+    user_ids = await _users(db, 3)
+    created = await notification_service.create_notifications(
+        db, [*user_ids, user_ids[0]], "BULK_TEST", payload={"k": "v"}
+    )
+    assert created == 3
+
+    rows = await _stored(db, "BULK_TEST")
+    assert sorted(n.user_id for n in rows) == sorted(user_ids)
+    assert all(n.payload_json == {"k": "v"} and n.status == "UNREAD" for n in rows)
+    assert all(n.created_at is not None for n in rows)
+    await db.rollback()
+
+
+async def test_create_notifications_copy(db: AsyncSession):
+    user_ids = await _users(db, settings.NOTIFICATION_COPY_THRESHOLD)
+    await notification_service.create_notifications(
+        db, user_ids, "BULK_COPY", payload={"n": 1}
+    )
+
+    rows = await _stored(db, "BULK_COPY")
+    assert len(rows) == len(user_ids)
+    assert rows[0].payload_json == {"n": 1}
+    await db.rollback()
+
+
+async def test_create_notifications_empty(db: AsyncSession):
+    assert await notification_service.create_notifications(db, [], "NONE") == 0
+
+
+async def test_unread_counter_follows_creates_and_reads(db: AsyncSession):
+    user_ids = await _users(db, 2)
+    await notification_service.create_notifications(db, user_ids, "COUNT_TEST")
+    await notification_service.create_notifications(db, user_ids[:1], "COUNT_TEST")
+    await db.commit()
+    await hooks.wait_background()
+    user = await db.get(User, user_ids[0])
+
+    assert await unread_counter.count(db, user_ids[0]) == 2
+    assert await unread_counter.count(db, user_ids[1]) == 1
+
+    first = (await _stored(db, "COUNT_TEST"))[0]
+    owner = await db.get(User, first.user_id)
+    await notification_service.mark_read(db, owner, first.id)
+    await notification_service.mark_all_read(db, user)
+    await db.commit()
+    await hooks.wait_background()
+    assert await unread_counter.count(db, user_ids[0]) == 0
+
+
+async def test_reconcile_fixes_drifted_counters(db: AsyncSession):
+    (user_id,) = await _users(db, 1)
+    await notification_service.create_notifications(db, [user_id], "DRIFT_TEST")
+    await db.execute(
+        update(NotificationCounter)
+        .where(NotificationCounter.user_id == user_id)
+        .values(unread=7)
+    )
+    await db.commit()
+
+    assert await unread_counter.reconcile() >= 1
+    assert await db.scalar(
+        select(NotificationCounter.unread)
+        .where(NotificationCounter.user_id == user_id)
+        .execution_options(populate_existing=True)
+    ) == 1
+
+
+async def test_reconcile_drops_stale_cached_counts(db: AsyncSession, monkeypatch):
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(unread_counter, "get_redis", lambda: redis)
+    stale, fresh = await _users(db, 2)
+    await notification_service.create_notifications(db, [stale, fresh], "STALE_TEST")
+    await db.commit()
+    await hooks.wait_background()
+    # The counter rows are right; one cached value missed an update
+    await redis.set(unread_counter._key(stale), 0)
+    await redis.set(unread_counter._key(fresh), 1)
+
+    await unread_counter.reconcile()
+
+    assert await redis.get(unread_counter._key(stale)) is None
+    assert await redis.get(unread_counter._key(fresh)) == "1"
+
+
+async def test_stream_token_opens_the_stream_only(
+    client: AsyncClient, person_tokens: dict
+):
+    res = await client.post(
+        "/api/v1/me/notifications/stream-token", headers=auth_header(person_tokens)
+    )
+    assert res.status_code == 200
+    data = res.json()
+    assert data["expires_in"] == settings.NOTIFICATION_STREAM_TOKEN_EXPIRE_SECONDS
+    me = (await client.get("/api/v1/me", headers=auth_header(person_tokens))).json()
+
+    # EventSource: no header, the stream token in the query string
+    user = await get_streaming_user(token=data["token"], credentials=None)
+    assert str(user.id) == me["id"]
+
+    stream = "/api/v1/me/notifications/stream"
+    assert (await client.get(stream)).status_code == 401
+    res = await client.get(stream, params={"token": person_tokens["access_token"]})
+    assert res.status_code == 401
+    # Not an access token
+    res = await client.get(
+        "/api/v1/me", headers=auth_header({"access_token": data["token"]})
+    )
+    assert res.status_code == 401
+
+
+def test_partition_months(monkeypatch):
+    monkeypatch.setattr(settings, "NOTIFICATION_RETENTION_MONTHS", 6)
+    now = datetime(2026, 3, 15, tzinfo=timezone.utc)
+    assert add_months(month_start(now), -3) == month_start(datetime(2025, 12, 1))
+    assert partition_name(month_start(now)) == "notifications_p202603"
+    assert partition_month("notifications_p202603") == month_start(now)
+    assert partition_month("notifications_p2026") is None
+    # Six months back from March: everything up to August 2025 is expired
+    assert retention_cutoff(now) == month_start(datetime(2025, 9, 1))
+
+
+async def test_expired_partitions_are_archived_once_read(
+    db: AsyncSession, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(settings, "NOTIFICATION_ARCHIVE_DIR", str(tmp_path))
+    old = add_months(month_start(datetime.now(timezone.utc)), -12)
+    async with engine.begin() as conn:
+        await ensure_partitions(
+            conn, now=datetime(old.year, old.month, 1, tzinfo=timezone.utc)
+        )
+    (user_id,) = await _users(db, 1)
+    await db.execute(
+        insert(Notification).values(
+            user_id=user_id,
+            type="OLD",
+            channel="IN_APP",
+            status="UNREAD",
+            created_at=datetime(old.year, old.month, 2, tzinfo=timezone.utc),
+        )
+    )
+    await db.commit()
+    exists = text("SELECT to_regclass(:name) IS NOT NULL")
+    path = tmp_path / f"{partition_name(old)}.csv.gz"
+
+    # Unread notifications keep their partition
+    assert path not in await archive_expired()
+    assert await db.scalar(exists, {"name": partition_name(old)})
+
+    await db.execute(
+        update(Notification)
+        .where(Notification.user_id == user_id)
+        .values(read_at=datetime.now(timezone.utc))
+    )
+    await db.commit()
+    assert path in await archive_expired()
+    with gzip.open(path, "rt") as f:
+        lines = f.read().splitlines()
+    assert "user_id" in lines[0] and len(lines) == 2 and str(user_id) in lines[1]
+    assert not await db.scalar(exists, {"name": partition_name(old)})
@@ -0,0 +1,176 @@
+import uuid
+from datetime import timedelta
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db import hooks
+from app.models.notification import Notification
+from app.models.outbox import OutboxEvent
+from app.models.user import User
+from app.services import notification_service, notification_stream, outbox
+
+settings = get_settings()
+
+
+def test_retry_delay_doubles_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(settings, "OUTBOX_RETRY_BASE_SECONDS", 10.0)
+    monkeypatch.setattr(settings, "OUTBOX_RETRY_MAX_SECONDS", 60.0)
+    assert 5 <= outbox.retry_delay(1) <= 10
+    assert 20 <= outbox.retry_delay(3) <= 40
+    assert 30 <= outbox.retry_delay(10) <= 60
+
+
+def test_render_message():
+    subject, body = notification_service.render_message(
+        "SCOUT_RECEIVED", {"company_name": "테스트병원", "scout_id": "x"}
+    )
+    assert subject == "스카우트 제안이 도착했습니다"
+    assert "테스트병원" in body
+    # Missing payload keys fall back to the subject
+    assert notification_service.render_message("SCOUT_RECEIVED", {}) == (
+        subject,
+        subject,
+    )
+
+
+async def _event(db: AsyncSession, topic: str) -> OutboxEvent:
+    result = await db.execute(
+        select(OutboxEvent)
+        .where(OutboxEvent.topic == topic)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def test_process_batch_marks_events_done(db: AsyncSession):
+    seen = []
+
+    @outbox.handler("test.ok")
+    async def ok(session, payload):
+        seen.append(payload)
+
+    outbox.enqueue(db, "test.ok", {"n": 1})
+    await db.commit()
+
+    await outbox.process_batch()
+
+    event = await _event(db, "test.ok")
+    assert seen == [{"n": 1}]
+    assert event.status == "DONE" and event.processed_at is not None
+
+
+async def test_failing_event_is_retried_then_dead_lettered(
+    db: AsyncSession, monkeypatch
+):
+    monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", 2)
+
+    @outbox.handler("test.fail")
+    async def fail(session, payload):
+        raise RuntimeError("smtp down")
+
+    outbox.enqueue(db, "test.fail", {})
+    await db.commit()
+
+    await outbox.process_batch()
+    event = await _event(db, "test.fail")
+    assert event.status == "PENDING" and event.attempts == 1
+    assert event.last_error == "RuntimeError: smtp down"
+    assert event.available_at > event.created_at
+
+    await db.execute(
+        update(OutboxEvent)
+        .where(OutboxEvent.id == event.id)
+        .values(available_at=event.created_at)
+    )
+    await db.commit()
+    await outbox.process_batch()
+    event = await _event(db, "test.fail")
+    assert event.status == "DEAD" and event.attempts == 2
+
+
+async def test_notify_fans_out_in_the_worker(db: AsyncSession):
+    user = User(
+        type="PERSON", email=f"outbox-{uuid.uuid4().hex}@example.com", password_hash="x"
+    )
+    db.add(user)
+    await db.flush()
+    notification_service.notify(
+        db,
+        "SCOUT_RECEIVED",
+        {"scout_id": "s", "company_name": "병원"},
+        user_ids=[user.id],
+    )
+    await db.commit()
+
+    # Fan-out writes the IN_APP row and one delivery event per channel
+    await outbox.process_batch()
+    result = await db.execute(
+        select(Notification).where(Notification.user_id == user.id)
+    )
+    assert [n.type for n in result.scalars().all()] == ["SCOUT_RECEIVED"]
+    result = await db.execute(
+        select(OutboxEvent.payload["channel"].astext).where(
+            OutboxEvent.topic == notification_service.DELIVER_TOPIC,
+            OutboxEvent.payload["user_id"].astext == str(user.id),
+        )
+    )
+    assert sorted(result.scalars().all()) == ["EMAIL", "PUSH", "SMS"]
+
+    await outbox.process_batch()
+    result = await db.execute(
+        select(OutboxEvent.status).where(
+            OutboxEvent.topic == notification_service.DELIVER_TOPIC,
+            OutboxEvent.payload["user_id"].astext == str(user.id),
+        )
+    )
+    assert set(result.scalars().all()) == {"DONE"}
+
+
+async def test_failing_event_keeps_earlier_events_publishes(
+    db: AsyncSession, monkeypatch
+):
+    published = []
+
+    async def publish(messages):
+        published.extend(messages)
+
+    monkeypatch.setattr(notification_stream, "publish_or_log", publish)
+    user = User(
+        type="PERSON", email=f"outbox-{uuid.uuid4().hex}@example.com", password_hash="x"
+    )
+    db.add(user)
+    await db.flush()
+
+    @outbox.handler("test.publish")
+    async def create(session, payload):
+        await notification_service.create_notifications(
+            session, [uuid.UUID(payload["user_id"])], "PUBLISH_TEST"
+        )
+
+    @outbox.handler("test.publish_fail")
+    async def create_then_fail(session, payload):
+        await create(session, payload)
+        raise RuntimeError("boom")
+
+    for topic in ("test.publish", "test.publish_fail"):
+        outbox.enqueue(db, topic, {"user_id": str(user.id)})
+    await db.commit()
+    # The failing event runs second, after the first one's savepoint
+    for topic, age in (("test.publish", 2), ("test.publish_fail", 1)):
+        await db.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.topic == topic)
+            .values(available_at=func.now() - timedelta(seconds=age))
+        )
+    await db.commit()
+
+    await outbox.process_batch()
+    await hooks.wait_background()
+
+    assert [m[0] for m in published] == [user.id]
+    result = await db.execute(
+        select(func.count()).where(Notification.user_id == user.id)
+    )
+    assert result.scalar() == 1
@@ -0,0 +1,74 @@
+import base64
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.job import JobPost
+from app.services.pagination import SortKey, decode_cursor, encode_cursor
+
+KEYS = [SortKey(JobPost.created_at, desc=True), SortKey(JobPost.id)]
+ID = str(uuid.uuid4())
+
+
+def _cursor(payload) -> str:
+    raw = json.dumps(payload).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def test_cursor_round_trip():
+    values = [datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc), uuid.uuid4()]
+    assert decode_cursor(KEYS, encode_cursor(KEYS, values)) == values
+
+
+def test_cursor_round_trip_null():
+    keys = [SortKey(JobPost.close_at, nulls_last=True), SortKey(JobPost.id)]
+    values = [None, uuid.uuid4()]
+    assert decode_cursor(keys, encode_cursor(keys, values)) == values
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        _cursor([1, 2]),
+        _cursor({"k": ["created_at", "id"]}),
+        _cursor({"k": ["title", "id"], "v": [["s", "x"], ["u", ID]]}),
+        # wrong value count
+        _cursor({"k": ["created_at", "id"], "v": []}),
+        _cursor({"k": ["created_at", "id"], "v": [["dt", "2026-01-02T03:04:05"]]}),
+        _cursor(
+            {
+                "k": ["created_at", "id"],
+                "v": [["dt", "2026-01-02"], ["u", ID], ["i", 1]],
+            }
+        ),
+        # malformed values
+        _cursor({"k": ["created_at", "id"], "v": "x"}),
+        _cursor({"k": ["created_at", "id"], "v": ["dt", "u"]}),
+        _cursor({"k": ["created_at", "id"], "v": [["dt"], ["u"]]}),
+        _cursor({"k": ["created_at", "id"], "v": [["zz", 1], ["u", "x"]]}),
+        # tampered values
+        _cursor({"k": ["created_at", "id"], "v": [["dt", "2026-01-02"], ["u", 123]]}),
+        _cursor({"k": ["created_at", "id"], "v": [["i", 1], ["u", ID]]}),
+        _cursor({"k": ["created_at", "id"], "v": [["s", "x"], ["u", ID]]}),
+        _cursor({"k": ["created_at", "id"], "v": [["dt", "2026-01-02"], ["s", "x"]]}),
+        _cursor({"k": ["created_at", "id"], "v": [["dt", "2026-01-02"], ["u", "x"]]}),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(KEYS, cursor)
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.parametrize("item", [["i", "x"], ["i", True], ["i", 1.5], ["f", "1"]])
+def test_mistyped_int_cursor_is_rejected(item):
+    keys = [SortKey(JobPost.view_count, desc=True), SortKey(JobPost.id)]
+    cursor = _cursor({"k": ["view_count", "id"], "v": [item, ["u", ID]]})
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(keys, cursor)
+    assert exc.value.status_code == 400
@@ -0,0 +1,30 @@
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from app.core import security
+from app.core.security import hash_password_async, verify_password_async
+
+
+async def test_hash_and_verify_off_loop():
+    hashed = await hash_password_async("Password1")
+    assert await verify_password_async("Password1", hashed) == (True, None)
+    assert (await verify_password_async("wrong", hashed))[0] is False
+
+
+async def test_outdated_cost_is_rehashed_on_verify():
+    weak = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("Password1")
+    valid, new_hash = await verify_password_async("Password1", weak)
+    assert valid
+    assert new_hash and new_hash != weak
+    assert security.pwd_context.verify("Password1", new_hash)
+    assert not security.pwd_context.needs_update(new_hash)
+
+
+async def test_saturated_pool_rejects(monkeypatch):
+    monkeypatch.setattr(
+        security, "_hash_pending", security.settings.PASSWORD_HASH_MAX_PENDING
+    )
+    with pytest.raises(HTTPException) as exc:
+        await hash_password_async("Password1")
+    assert exc.value.status_code == 503
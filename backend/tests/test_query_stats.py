@@ -0,0 +1,21 @@
+from app.db.instrumentation import QueryStats, statement_shape
+
+
+def test_statement_shape_collapses_bind_lists():
+    assert statement_shape(
+        "SELECT * FROM job_posts\n WHERE id IN ($1, $2, $3) AND status = $4"
+    ) == "SELECT * FROM job_posts WHERE id IN (?) AND status = ?"
+    assert statement_shape("SELECT 1 WHERE id IN ($1)") == statement_shape(
+        "SELECT 1 WHERE id IN ($1, $2)"
+    )
+
+
+def test_repeated_shapes_are_n_plus_one_suspects():
+    stats = QueryStats()
+    stats.record("SELECT * FROM users WHERE id = $1", 0.001)
+    for i in range(5):
+        stats.record("SELECT title FROM job_posts WHERE id = $1", 0.002 * (i + 1))
+
+    assert stats.statements == 6
+    assert stats.repeated(5) == [("SELECT title FROM job_posts WHERE id = ?", 5)]
+    assert [round(d, 3) for d, _ in stats.slowest] == [0.01, 0.008, 0.006]
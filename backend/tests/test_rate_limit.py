@@ -0,0 +1,75 @@
+import fakeredis
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.core import rate_limit
+from app.core.rate_limit import RateLimiter, RatePolicy, client_identity
+from app.core.security import create_access_token
+
+POLICY = RatePolicy("test", limit=3, window=60)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        rate_limit, "get_redis", lambda: fakeredis.FakeAsyncRedis(server=server)
+    )
+    return server
+
+
+async def test_limit_is_shared_across_workers(server):
+    workers = [RateLimiter({}), RateLimiter({})]
+    decisions = [await workers[i % 2].hit(POLICY, "ip:1", now=600) for i in range(4)]
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+    assert decisions[2].remaining == 0
+    assert decisions[3].retry_after == 60
+    assert (await workers[0].hit(POLICY, "ip:2", now=600)).allowed
+
+
+async def test_previous_window_is_weighted(server):
+    limiter = RateLimiter({})
+    for _ in range(3):
+        assert (await limiter.hit(POLICY, "ip:1", now=600)).allowed
+    # Half way into the next bucket the previous one still counts for 1
+    assert (await limiter.hit(POLICY, "ip:1", now=690)).allowed
+    assert (await limiter.hit(POLICY, "ip:1", now=690)).allowed
+    assert not (await limiter.hit(POLICY, "ip:1", now=690)).allowed
+    assert (await limiter.hit(POLICY, "ip:1", now=780)).allowed
+
+
+async def test_local_fallback_when_redis_is_down(server):
+    server.connected = False
+    limiter = RateLimiter({})
+    decisions = [await limiter.hit(POLICY, "ip:1", now=600) for _ in range(4)]
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+
+
+async def test_dependency_raises_429(server):
+    limiter = RateLimiter({"test": POLICY})
+    check = limiter.limit("test")
+    request = Request({"type": "http", "headers": [], "client": ("10.0.0.1", 1)})
+    for _ in range(3):
+        await check(request)
+    with pytest.raises(HTTPException) as exc:
+        await check(request)
+    assert exc.value.status_code == 429
+    assert "Retry-After" in exc.value.headers
+
+
+def test_per_user_policies_key_by_token():
+    token = create_access_token("user-1", "USER")
+    request = Request(
+        {
+            "type": "http",
+            "headers": [
+                (b"authorization", f"Bearer {token}".encode()),
+                (b"x-real-ip", b"10.0.0.9"),
+            ],
+            "client": ("127.0.0.1", 1),
+        }
+    )
+    assert client_identity(request, POLICY) == "ip:10.0.0.9"
+    per_user = RatePolicy("search", limit=1, window=60, per_user=True)
+    assert client_identity(request, per_user) == "u:user-1"
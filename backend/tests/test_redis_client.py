@@ -0,0 +1,36 @@
+import fakeredis
+
+from app.core import redis
+
+
+async def test_check_tracks_health(monkeypatch):
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeAsyncRedis(server=server)
+    monkeypatch.setattr(redis, "get_redis", lambda: client)
+
+    assert await redis.check()
+    assert redis.is_healthy() and redis.last_error() is None
+    assert redis.redis_up.value() == 1
+
+    server.connected = False
+    assert not await redis.check()
+    assert not redis.is_healthy() and redis.last_error()
+    assert redis.redis_up.value() == 0
+
+    server.connected = True
+    assert await redis.check()
+
+
+async def test_shared_client_is_bounded_and_reused():
+    client = redis.get_redis()
+    try:
+        assert redis.get_redis() is client
+        pool = client.connection_pool
+        assert pool.max_connections == redis.settings.REDIS_MAX_CONNECTIONS
+        assert pool.connection_kwargs["socket_timeout"] == (
+            redis.settings.REDIS_SOCKET_TIMEOUT_SECONDS
+        )
+    finally:
+        await redis.close_redis()
+    assert redis.get_redis() is not client
+    await redis.close_redis()
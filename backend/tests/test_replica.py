@@ -0,0 +1,31 @@
+import fakeredis
+import pytest
+
+from app.db import replica
+
+
+@pytest.fixture
+def configured(monkeypatch):
+    redis = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(replica, "get_redis", lambda: redis)
+    monkeypatch.setattr(replica, "engine", object())
+    monkeypatch.setattr(replica, "_healthy", True)
+    monkeypatch.setattr(replica, "_local_sticky", {})
+
+
+async def test_reads_stay_on_primary_without_replica(monkeypatch):
+    monkeypatch.setattr(replica, "engine", None)
+    assert not await replica.use_for(None)
+
+
+async def test_writer_sticks_to_primary(configured):
+    assert await replica.use_for("user-1")
+    await replica.stick("user-1")
+    assert not await replica.use_for("user-1")
+    assert await replica.use_for("user-2")
+    assert await replica.use_for(None)
+
+
+async def test_unhealthy_replica_falls_back(configured):
+    replica.mark_unhealthy("test")
+    assert not await replica.use_for(None)
@@ -0,0 +1,37 @@
+import uuid
+
+import fakeredis
+import pytest
+
+from app.services import unread_counter
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(unread_counter, "get_redis", lambda: client)
+    return client
+
+
+class _NoDb:
+    async def scalar(self, statement):
+        raise AssertionError("cached counts must not hit the database")
+
+
+async def test_cached_counts_skip_the_database(client):
+    user_id = uuid.uuid4()
+    await client.set(unread_counter._key(user_id), 4)
+    assert await unread_counter.count(_NoDb(), user_id) == 4
+
+
+async def test_adjust_only_moves_cached_counts(client):
+    cached, uncached = uuid.uuid4(), uuid.uuid4()
+    await client.set(unread_counter._key(cached), 2, ex=60)
+
+    await unread_counter._adjust_cached([cached, uncached], 3)
+    assert await client.get(unread_counter._key(cached)) == "5"
+    assert await client.get(unread_counter._key(uncached)) is None
+
+    await unread_counter._adjust_cached([cached], -9)
+    assert await client.get(unread_counter._key(cached)) == "0"
+    assert 0 < await client.ttl(unread_counter._key(cached)) <= 60
@@ -0,0 +1,52 @@
+import uuid
+
+import fakeredis
+from starlette.requests import Request
+
+from app.core.security import create_access_token
+from app.services import view_counter
+from app.services.view_counter import is_bot, viewer_key
+
+
+def _request(headers: dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+            "client": ("10.0.0.1", 1234),
+        }
+    )
+
+
+def test_bots_are_not_counted():
+    assert is_bot(None)
+    assert is_bot("Mozilla/5.0 (compatible; Googlebot/2.1)")
+    assert is_bot("Yeti/1.1 (NHN Corp.; naver crawler)")
+    assert not is_bot(
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) Safari/604.1"
+    )
+
+
+def test_viewer_key_prefers_user_id():
+    user_id = uuid.uuid4()
+    token = create_access_token(user_id, "USER")
+    req = _request({"Authorization": f"Bearer {token}", "User-Agent": "x"})
+    assert viewer_key(req) == f"u:{user_id}"
+
+
+def test_viewer_key_anonymous_uses_ip_and_agent():
+    a = viewer_key(_request({"X-Real-IP": "1.2.3.4", "User-Agent": "A"}))
+    b = viewer_key(_request({"X-Real-IP": "1.2.3.4", "User-Agent": "B"}))
+    assert a.startswith("a:1.2.3.4:")
+    assert a != b
+
+
+async def test_take_redis_pending_empties_the_buffer(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(view_counter, "get_redis", lambda: client)
+    job = str(uuid.uuid4())
+    await client.hincrby(view_counter.PENDING_KEY, job, 3)
+
+    assert await view_counter._take_redis_pending() == {job: 3}
+    assert await client.keys("views:*") == []
+    assert await view_counter._take_redis_pending() == {}
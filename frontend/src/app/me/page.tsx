@@ -35,7 +35,7 @@ export default function MePage() {
         .get<{ items: unknown[]; total: number }>("/me/applications")
         .catch(() => ({ items: [], total: 0 })),
       api
-        .get<{ unread_count: number }>("/me/notifications?size=1")
+        .get<{ unread_count: number }>("/me/notifications/unread-count")
         .catch(() => ({ unread_count: 0 })),
     ]).then(([resumes, apps, notifs]) => {
       setStats({
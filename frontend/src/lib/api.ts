@@ -1,4 +1,11 @@
+import type {
+  NotificationItem,
+  NotificationPush,
+  StreamTokenResponse,
+} from "@/types/notification";
+
 const API_BASE = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000/api/v1";
+const STREAM_RETRY_MS = 5000;
 
 interface ApiErrorBody {
   error: {
@@ -130,6 +137,63 @@ class ApiClient {
   delete<T>(path: string) {
     return this.request<T>(path, { method: "DELETE" });
   }
+
+  /**
+   * Live notifications (server-sent events). EventSource cannot send the
+   * bearer token, so each connection opens with a short-lived stream token;
+   * once the browser's own retry is refused (expired token, server busy) a
+   * fresh token is fetched and the stream resumes after the last event.
+   * Returns a function that closes the stream.
+   */
+  openNotificationStream(handlers: {
+    onNotification: (item: NotificationItem) => void;
+    onPush?: (push: NotificationPush) => void;
+  }): () => void {
+    let source: EventSource | null = null;
+    let lastEventId = "";
+    let closed = false;
+
+    const reconnect = () => {
+      if (!closed) setTimeout(connect, STREAM_RETRY_MS);
+    };
+
+    const connect = async () => {
+      let token: string;
+      try {
+        ({ token } = await this.post<StreamTokenResponse>(
+          "/me/notifications/stream-token",
+        ));
+      } catch {
+        reconnect();
+        return;
+      }
+      if (closed) return;
+
+      const params = new URLSearchParams({ token });
+      if (lastEventId) params.set("last_event_id", lastEventId);
+      source = new EventSource(`${this.baseUrl}/me/notifications/stream?${params}`);
+      source.addEventListener("notification", (event) => {
+        const message = event as MessageEvent<string>;
+        lastEventId = message.lastEventId || lastEventId;
+        handlers.onNotification(JSON.parse(message.data));
+      });
+      source.addEventListener("push", (event) => {
+        handlers.onPush?.(JSON.parse((event as MessageEvent<string>).data));
+      });
+      source.onerror = () => {
+        if (source?.readyState === EventSource.CLOSED) {
+          source = null;
+          reconnect();
+        }
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      source?.close();
+    };
+  }
 }
 
 export const api = new ApiClient(API_BASE);
@@ -152,6 +152,7 @@ export const SORT_OPTIONS = [
   { value: "CLOSING_SOON", label: "마감임박순" },
   { value: "SALARY_DESC", label: "급여높은순" },
   { value: "VIEWS", label: "조회순" },
+  { value: "RELEVANCE", label: "정확도순" },
 ] as const;
 
 export function getLabel(
@@ -12,3 +12,15 @@ export interface NotificationListResponse {
   items: NotificationItem[];
   unread_count: number;
 }
+
+export interface NotificationPush {
+  type: string;
+  title: string;
+  body: string;
+  payload: Record<string, string> | null;
+}
+
+export interface StreamTokenResponse {
+  token: string;
+  expires_in: number;
+}